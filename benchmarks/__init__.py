@@ -0,0 +1,15 @@
+"""
+Benchmarks of the protocol hot paths (not part of the installed package).
+
+Each scenario (see :mod:`benchmarks.scenarios`) runs over each transport (see
+:mod:`benchmarks.transports`): a server thread in the same process (``thread``), a
+server thread over a unix domain socket (``unix``), and a server subprocess over TCP
+loopback (``tcp``). Run from the root of the repository::
+
+    python -m benchmarks --output before.json
+    # ... change things ...
+    python -m benchmarks --output after.json
+    python -m benchmarks.compare before.json after.json
+
+Use ``--quick`` for a short smoke run, and ``--scenario``/``--transport`` to select.
+"""
@@ -0,0 +1,73 @@
+"""
+Runs the benchmarks and prints (or saves) the results as JSON; see :mod:`benchmarks`.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import rpyc
+from benchmarks.scenarios import SCENARIOS, LOCAL_SCENARIOS
+from benchmarks.transports import TRANSPORTS, ROOT
+
+
+def git_revision():
+    try:
+        output = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL)
+        return output.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scenarios, transports, duration, log=sys.stderr):
+    results = {}
+    for name in scenarios:
+        if name in LOCAL_SCENARIOS:
+            log.write(f"{name} ...\n")
+            results.setdefault("local", {})[name] = SCENARIOS[name](None, duration)
+    for transport in transports:
+        with TRANSPORTS[transport]() as conn:
+            for name in scenarios:
+                if name in LOCAL_SCENARIOS:
+                    continue
+                log.write(f"{name} over {transport} ...\n")
+                results.setdefault(transport, {})[name] = SCENARIOS[name](conn, duration)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="the scenarios to run (default: all)")
+    parser.add_argument("--transport", action="append", choices=sorted(TRANSPORTS),
+                        help="the transports to run over (default: all)")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per scenario (default: 2)")
+    parser.add_argument("--quick", action="store_true", help="a short smoke run (0.2 seconds per scenario)")
+    parser.add_argument("--output", help="the file to write the results to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    duration = 0.2 if args.quick else args.duration
+    report = dict(
+        meta=dict(
+            rpyc_version=rpyc.__version__,
+            git_revision=git_revision(),
+            python=sys.version.split()[0],
+            implementation=platform.python_implementation(),
+            platform=platform.platform(),
+            time=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            duration=duration,
+        ),
+        results=run(args.scenario or list(SCENARIOS), args.transport or list(TRANSPORTS), duration),
+    )
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
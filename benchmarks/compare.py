@@ -0,0 +1,55 @@
+"""
+Compares two benchmark results (see :mod:`benchmarks`), e.g.::
+
+    python -m benchmarks.compare before.json after.json --threshold 0.1
+
+Prints the change of each metric, and exits with status 1 if any metric regressed
+by more than the threshold (a fraction, 0.1 by default).
+"""
+import argparse
+import json
+import sys
+
+
+def is_higher_better(metric):
+    return metric.endswith("_per_sec") or metric == "calls"
+
+
+def compare(before, after, threshold):
+    """yields ``(path, old, new, change, regressed)`` for each metric found in both results;
+    *change* is the relative improvement (positive is better)"""
+    for transport, scenarios in sorted(after["results"].items()):
+        for scenario, metrics in sorted(scenarios.items()):
+            old_metrics = before["results"].get(transport, {}).get(scenario, {})
+            for metric, new in sorted(metrics.items()):
+                old = old_metrics.get(metric)
+                if metric == "calls" or not old:
+                    continue
+                change = (new - old) / old
+                if not is_higher_better(metric):
+                    change = -change
+                yield f"{transport}/{scenario}/{metric}", old, new, change, change < -threshold
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description=__doc__)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    regressions = 0
+    for path, old, new, change, regressed in compare(before, after, args.threshold):
+        regressions += regressed
+        mark = "REGRESSED" if regressed else ""
+        print(f"{path:<55} {old:>14.2f} {new:>14.2f} {change:>+8.1%} {mark}")
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
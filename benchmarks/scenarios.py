@@ -0,0 +1,140 @@
+"""
+The benchmark scenarios. A scenario is a function of ``(conn, duration)`` that returns a
+dict of metrics; metrics named ``*_per_sec`` are better when higher, and metrics named
+``*_us`` (microseconds) are better when lower. Scenarios that do not use a connection
+(``conn`` is ``None``) run once, rather than once per transport.
+"""
+import os
+import tempfile
+import time
+
+import rpyc
+from rpyc.core import brine
+from rpyc.utils import classic
+
+SCENARIOS = {}
+LOCAL_SCENARIOS = set()
+
+
+def scenario(name, local=False):
+    def deco(func):
+        SCENARIOS[name] = func
+        if local:
+            LOCAL_SCENARIOS.add(name)
+        return func
+    return deco
+
+
+def measure(func, duration, warmup=10):
+    """calls *func* repeatedly for *duration* seconds and returns the call rate and the
+    latency distribution"""
+    for _ in range(warmup):
+        func()
+    latencies = []
+    start = time.perf_counter()
+    end = start + duration
+    now = start
+    while now < end:
+        func()
+        then, now = now, time.perf_counter()
+        latencies.append(now - then)
+    latencies.sort()
+    count = len(latencies)
+    return dict(
+        calls=count,
+        calls_per_sec=count / (now - start),
+        mean_us=sum(latencies) / count * 1e6,
+        p50_us=latencies[count // 2] * 1e6,
+        p99_us=latencies[min(count - 1, int(count * 0.99))] * 1e6,
+    )
+
+
+@scenario("ping")
+def ping(conn, duration):
+    """round trip of a ping request"""
+    return measure(lambda: conn.ping(b"x"), duration)
+
+
+@scenario("sync_request")
+def sync_request(conn, duration):
+    """a synchronous call of a remote function"""
+    remote_abs = conn.builtins.abs
+    return measure(lambda: remote_abs(-1), duration)
+
+
+@scenario("async_fanout")
+def async_fanout(conn, duration, width=100):
+    """*width* asynchronous calls, then waiting for all of their results"""
+    async_abs = rpyc.async_(conn.builtins.abs)
+
+    def fanout():
+        for res in [async_abs(-i) for i in range(width)]:
+            res.wait()
+    metrics = measure(fanout, duration, warmup=2)
+    metrics["requests_per_sec"] = metrics["calls_per_sec"] * width
+    return metrics
+
+
+@scenario("attr_chain")
+def attr_chain(conn, duration):
+    """getting a chain of netref attributes (``os.path.join``)"""
+    remote_os = conn.modules.os
+    return measure(lambda: remote_os.path.join, duration)
+
+
+@scenario("buffiter")
+def buffiter(conn, duration, count=10000):
+    """iterating over a remote iterable with :func:`rpyc.buffiter`"""
+    remote_range = conn.builtins.range(count)
+
+    def iterate():
+        for _ in rpyc.buffiter(remote_range):
+            pass
+    metrics = measure(iterate, duration, warmup=1)
+    metrics["items_per_sec"] = metrics["calls_per_sec"] * count
+    return metrics
+
+
+BRINE_PAYLOADS = {
+    "small_tuple": (1, "abc", None, 2.5, (b"xyz", True)),
+    "request": (7, (8, ((b"builtins.int", 140245983454880, 94230948230), b"__add__", (4,), ()))),
+    "large_bytes": b"x" * 1000000,
+    "nested": tuple((i, str(i), float(i), (i, (i,))) for i in range(1000)),
+}
+
+
+@scenario("brine", local=True)
+def brine_dump_load(conn, duration):
+    """dumping and loading typical payloads with brine (loading from ``bytes``, and from a
+    ``memoryview``, as connections do)"""
+    metrics = {}
+    part = duration / len(BRINE_PAYLOADS) / 3
+    for name, payload in BRINE_PAYLOADS.items():
+        data = brine.dump(payload)
+        view = memoryview(data)
+        metrics[f"{name}_dump_per_sec"] = measure(lambda: brine.dump(payload), part)["calls_per_sec"]
+        metrics[f"{name}_load_per_sec"] = measure(lambda: brine.load(data), part)["calls_per_sec"]
+        metrics[f"{name}_load_view_per_sec"] = measure(lambda: brine.load(view), part)["calls_per_sec"]
+    return metrics
+
+
+@scenario("file_transfer")
+def file_transfer(conn, duration, size=16 * 1024 * 1024):
+    """:func:`~rpyc.utils.classic.upload_file` and :func:`~rpyc.utils.classic.download_file`
+    throughput (both parties are on this host)"""
+    tmpdir = tempfile.mkdtemp()
+    local_path = os.path.join(tmpdir, "local")
+    remote_path = os.path.join(tmpdir, "remote")
+    try:
+        with open(local_path, "wb") as f:
+            f.write(os.urandom(size))
+        upload = measure(lambda: classic.upload_file(conn, local_path, remote_path), duration / 2, warmup=1)
+        download = measure(lambda: classic.download_file(conn, remote_path, local_path), duration / 2, warmup=1)
+    finally:
+        for path in (local_path, remote_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(tmpdir)
+    megabytes = size / (1024 * 1024)
+    return dict(upload_mb_per_sec=upload["calls_per_sec"] * megabytes,
+                download_mb_per_sec=download["calls_per_sec"] * megabytes)
@@ -0,0 +1,21 @@
+"""
+The server of the ``tcp`` transport: serves a :class:`~rpyc.core.service.SlaveService`
+on an arbitrary localhost port, which it prints on the first line of its output.
+"""
+import sys
+
+import rpyc
+from rpyc.utils.server import ThreadedServer
+
+
+def main():
+    server = ThreadedServer(rpyc.SlaveService, hostname="localhost", port=0, auto_register=False)
+    server.logger.quiet = True
+    server._listen()
+    sys.stdout.write(f"{server.port}\n")
+    sys.stdout.flush()
+    server.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+The transports the scenarios run over. Each transport is a context manager that yields
+a classic connection (to a :class:`~rpyc.core.service.SlaveService`).
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import rpyc
+from rpyc.utils.server import ThreadedServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@contextmanager
+def thread_transport():
+    """a server thread in this process, over a socket pair bound to localhost"""
+    conn = rpyc.classic.connect_thread()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def unix_transport():
+    """a server thread in this process, over a unix domain socket"""
+    path = os.path.join(tempfile.mkdtemp(), "rpyc-bench.sock")
+    server = ThreadedServer(rpyc.SlaveService, socket_path=path, auto_register=False)
+    server.logger.quiet = True
+    server._start_in_thread()
+    try:
+        conn = rpyc.classic.unix_connect(path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    finally:
+        server.close()
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+@contextmanager
+def tcp_transport():
+    """a server subprocess (see :mod:`benchmarks.server`), over TCP loopback"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.Popen([sys.executable, "-m", "benchmarks.server"], stdout=subprocess.PIPE, cwd=ROOT, env=env)
+    try:
+        port = int(proc.stdout.readline())
+        conn = rpyc.classic.connect("localhost", port)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+TRANSPORTS = {
+    "thread": thread_transport,
+    "unix": unix_transport,
+    "tcp": tcp_transport,
+}
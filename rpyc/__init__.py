@@ -27,17 +27,17 @@ Classic-style usage::
 """
 # flake8: noqa: F401
 from rpyc.core import (SocketStream, TunneledSocketStream, PipeStream, Channel,
-                       Connection, Service, BaseNetref, AsyncResult, GenericException,
+                       Connection, AsyncioConnection, Service, BaseNetref, AsyncResult, GenericException,
                        AsyncResultTimeout, VoidService, SlaveService, MasterService, ClassicService)
 from rpyc.utils.factory import (connect_stream, connect_channel, connect_pipes,
-                                connect_stdpipes, connect, ssl_connect, list_services, discover, connect_by_service, connect_subproc,
-                                connect_thread, ssh_connect)
-from rpyc.utils.helpers import async_, timed, buffiter, BgServingThread, restricted
+                                connect_stdpipes, connect, asyncio_connect, ssl_connect, list_services, discover, connect_by_service, connect_subproc,
+                                connect_thread, ssh_connect, ConnectionPool, ServiceBalancer)
+from rpyc.utils.helpers import async_, timed, buffiter, BgServingThread, restricted, attrpath
 from rpyc.utils import classic, exposed, service
 from rpyc.version import __version__
 
 from rpyc.lib import setup_logger, spawn
-from rpyc.utils.server import OneShotServer, ThreadedServer, ThreadPoolServer, ForkingServer
+from rpyc.utils.server import OneShotServer, ThreadedServer, ThreadPoolServer, ForkingServer, AsyncioServer
 from rpyc import cli
 
 __author__ = "Tomer Filiba (tomerfiliba@gmail.com)"
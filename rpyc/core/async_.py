@@ -7,9 +7,15 @@ from rpyc.lib.compat import TimeoutError as AsyncResultTimeout
 class AsyncResult(object):
     """*AsyncResult* represents a computation that occurs in the background and
     will eventually have a result. Use the :attr:`value` property to access the
-    result (which will block if the result has not yet arrived).
+    result (which will block if the result has not yet arrived), or ``await``
+    the result in a coroutine.
+
+    The result of a request of :func:`rpyc.async_`, when ``promise_pipelining`` is enabled, is
+    also a *promise*: it can be passed (even before it arrives) as an argument of further requests
+    over the same connection, or called with :func:`rpyc.async_`, and the other party uses the
+    result it computed, so that a chain of dependent calls takes a single round trip.
     """
-    __slots__ = ["_conn", "_is_ready", "_is_exc", "_callbacks", "_obj", "_ttl"]
+    __slots__ = ["_conn", "_is_ready", "_is_exc", "_callbacks", "_obj", "_ttl", "_promise_seq", "__weakref__"]
 
     def __init__(self, conn):
         self._conn = conn
@@ -18,6 +24,7 @@ class AsyncResult(object):
         self._obj = None
         self._callbacks = []
         self._ttl = Timeout(None)
+        self._promise_seq = None  # the seq of the request, if the other party keeps its result
 
     def __repr__(self):
         if self._is_ready:
@@ -40,6 +47,11 @@ class AsyncResult(object):
             cb(self)
         del self._callbacks[:]
 
+    def __await__(self):
+        if not self._is_ready:
+            yield from self._conn._await_result(self).__await__()
+        return self.value
+
     def wait(self):
         """Waits for the result to arrive. If the AsyncResult object has an
         expiry set, and the result did not arrive within that timeout,
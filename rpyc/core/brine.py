@@ -5,6 +5,10 @@ The following types are supported: ``int``, ``bool``, ``str``, ``float``,
 ``frozenset`` (of simple types) as well as the following singletons: ``None``,
 ``NotImplemented``, and ``Ellipsis``.
 
+The mutable containers ``list``, ``dict``, ``set``, ``bytearray`` and ``memoryview``
+(of bytes) can be dumped as well; since their copies do not reflect later changes of
+the original, :func:`dumpable` only accepts them when asked to (``containers=True``).
+
 Example::
  >>> x = ("he", 7, u"llo", 8, (), 900, None, True, Ellipsis, 18.2, 18.2j + 13,
  ... slice(1,2,3), frozenset([5,6,7]), NotImplemented)
@@ -17,7 +21,8 @@ Example::
  >>> x == z
  True
 """
-from rpyc.lib.compat import Struct, BytesIO, BYTES_LITERAL
+import struct
+from rpyc.lib.compat import Struct
 
 
 # singletons
@@ -49,7 +54,15 @@ TAG_FLOAT = b"\x18"
 TAG_SLICE = b"\x19"
 TAG_FSET = b"\x1a"
 TAG_COMPLEX = b"\x1b"
-IMM_INTS = dict((i, bytes([i + 0x50])) for i in range(-0x30, 0xa0))
+# mutable containers (dumpable with containers=True)
+TAG_LIST = b"\x1c"
+TAG_DICT = b"\x1d"
+TAG_SET = b"\x1e"
+TAG_BYTEARRAY = b"\x1f"
+TAG_MEMORYVIEW = b"\xf0"
+# integers in IMM_INTS are dumped as a single byte: the tag is the integer plus IMM_INT_OFFSET
+IMM_INT_OFFSET = 0x50
+IMM_INTS = range(-0x30, 0xa0)
 
 # Below "!" is used to set byte order as network (= big-endian). See https://docs.python.org/3/library/struct.html
 F8 = Struct("!d")  # Python type float w/ size [8] (ctype double)
@@ -64,280 +77,334 @@ I4 = Struct("!L")  # Python type int w/ size [4] (ctype unsigned long)
 # TODO: Switch to native_id when 3.7 is EOL b/c PyThread_get_thread_ident is inheritly hosed due to casting.
 I8I8 = Struct("!QQ")
 
-_dump_registry = {}
-_load_registry = {}
-IMM_INTS_LOADER = dict((v, k) for k, v in IMM_INTS.items())
-
-
-def register(coll, key):
-    def deco(func):
-        coll[key] = func
-        return func
-    return deco
+# the tags as integers (the values of ``buf[i]``) and the tags of bytes by length
+_TAG_NONE, _TAG_EMPTY_STR, _TAG_EMPTY_TUPLE, _TAG_TRUE, _TAG_FALSE, _TAG_NOT_IMPLEMENTED, _TAG_ELLIPSIS, \
+    _TAG_UNICODE, _TAG_STR1, _TAG_STR2, _TAG_STR3, _TAG_STR4, _TAG_STR_L1, _TAG_STR_L4, \
+    _TAG_TUP1, _TAG_TUP2, _TAG_TUP3, _TAG_TUP4, _TAG_TUP_L1, _TAG_TUP_L4, _TAG_INT_L1, _TAG_INT_L4, \
+    _TAG_FLOAT, _TAG_SLICE, _TAG_FSET, _TAG_COMPLEX, _TAG_LIST, _TAG_DICT, _TAG_SET, _TAG_BYTEARRAY, \
+    _TAG_MEMORYVIEW = (
+        tag[0] for tag in (
+            TAG_NONE, TAG_EMPTY_STR, TAG_EMPTY_TUPLE, TAG_TRUE, TAG_FALSE, TAG_NOT_IMPLEMENTED, TAG_ELLIPSIS,
+            TAG_UNICODE, TAG_STR1, TAG_STR2, TAG_STR3, TAG_STR4, TAG_STR_L1, TAG_STR_L4,
+            TAG_TUP1, TAG_TUP2, TAG_TUP3, TAG_TUP4, TAG_TUP_L1, TAG_TUP_L4, TAG_INT_L1, TAG_INT_L4,
+            TAG_FLOAT, TAG_SLICE, TAG_FSET, TAG_COMPLEX, TAG_LIST, TAG_DICT, TAG_SET, TAG_BYTEARRAY,
+            TAG_MEMORYVIEW))
+_SHORT_STR_TAGS = (_TAG_EMPTY_STR, _TAG_STR1, _TAG_STR2, _TAG_STR3, _TAG_STR4)
+_SHORT_TUP_TAGS = (_TAG_EMPTY_TUPLE, _TAG_TUP1, _TAG_TUP2, _TAG_TUP3, _TAG_TUP4)
+_SINGLETONS = {_TAG_NONE: None, _TAG_TRUE: True, _TAG_FALSE: False, _TAG_NOT_IMPLEMENTED: NotImplemented,
+               _TAG_ELLIPSIS: Ellipsis}
+
+# the loader classifies each tag by a table lookup (_KINDS[tag]); _LENGTHS[tag] holds the
+# length of short strings and tuples
+_K_INVALID, _K_IMM_INT, _K_STR, _K_UNICODE, _K_TUPLE, _K_SINGLETON, _K_FLOAT, _K_INT, _K_WRAPPER, \
+    _K_COMPLEX = range(10)
+_KINDS = [_K_INVALID] * 256
+_LENGTHS = [0] * 256
+for _i in IMM_INTS:
+    _KINDS[_i + IMM_INT_OFFSET] = _K_IMM_INT
+for _i, _tag in enumerate(_SHORT_STR_TAGS):
+    _KINDS[_tag] = _K_STR
+    _LENGTHS[_tag] = _i
+for _i, _tag in enumerate(_SHORT_TUP_TAGS):
+    _KINDS[_tag] = _K_TUPLE
+    _LENGTHS[_tag] = _i
+for _tag in _SINGLETONS:
+    _KINDS[_tag] = _K_SINGLETON
+for _tag in (_TAG_LIST, _TAG_DICT, _TAG_SET, _TAG_FSET, _TAG_SLICE, _TAG_BYTEARRAY, _TAG_MEMORYVIEW):
+    _KINDS[_tag] = _K_WRAPPER
+_KINDS[_TAG_STR_L1] = _KINDS[_TAG_STR_L4] = _K_STR
+_KINDS[_TAG_TUP_L1] = _KINDS[_TAG_TUP_L4] = _K_TUPLE
+_KINDS[_TAG_INT_L1] = _KINDS[_TAG_INT_L4] = _K_INT
+_KINDS[_TAG_UNICODE] = _K_UNICODE
+_KINDS[_TAG_FLOAT] = _K_FLOAT
+_KINDS[_TAG_COMPLEX] = _K_COMPLEX
 
 
 # ===============================================================================
 # dumping
 # ===============================================================================
-@register(_dump_registry, type(None))
-def _dump_none(obj, stream):
-    stream.append(TAG_NONE)
-
-
-@register(_dump_registry, type(NotImplemented))
-def _dump_notimplemeted(obj, stream):
-    stream.append(TAG_NOT_IMPLEMENTED)
-
-
-@register(_dump_registry, type(Ellipsis))
-def _dump_ellipsis(obj, stream):
-    stream.append(TAG_ELLIPSIS)
-
-
-@register(_dump_registry, bool)
-def _dump_bool(obj, stream):
-    if obj:
-        stream.append(TAG_TRUE)
-    else:
-        stream.append(TAG_FALSE)
-
-
-@register(_dump_registry, slice)
-def _dump_slice(obj, stream):
-    stream.append(TAG_SLICE)
-    _dump((obj.start, obj.stop, obj.step), stream)
-
-
-@register(_dump_registry, frozenset)
-def _dump_frozenset(obj, stream):
-    stream.append(TAG_FSET)
-    _dump(tuple(obj), stream)
-
-
-@register(_dump_registry, int)
-def _dump_int(obj, stream):
-    if obj in IMM_INTS:
-        stream.append(IMM_INTS[obj])
-    else:
-        obj = BYTES_LITERAL(str(obj))
-        lenobj = len(obj)
-        if lenobj < 256:
-            stream.append(TAG_INT_L1 + I1.pack(lenobj) + obj)
+# Objects are dumped into a bytearray. Instead of recursing into the items of containers,
+# the items are pushed (in reverse) onto a stack of objects left to dump, so the depth of
+# nesting is not limited by the interpreter's recursion limit. Large strings are not
+# copied into the bytearray: they become chunks of their own, which dump() joins.
+_LARGE_STR = 0x8000
+_SHORT_UNICODE_HEADERS = [bytes([_TAG_UNICODE, tag]) for tag in _SHORT_STR_TAGS]
+
+
+def _str_header(lenobj):
+    if lenobj < 5:
+        return bytes([_SHORT_STR_TAGS[lenobj]])
+    if lenobj < 256:
+        return TAG_STR_L1 + I1.pack(lenobj)
+    return TAG_STR_L4 + I4.pack(lenobj)
+
+
+def _tup_header(lenobj):
+    if lenobj < 5:
+        return bytes([_SHORT_TUP_TAGS[lenobj]])
+    if lenobj < 256:
+        return TAG_TUP_L1 + I1.pack(lenobj)
+    return TAG_TUP_L4 + I4.pack(lenobj)
+
+
+def _dump(obj):
+    """dumps the object into a list of chunks"""
+    chunks = []
+    buf = bytearray()
+    stack = [obj]
+    pop = stack.pop
+    while stack:
+        obj = pop()
+        t = type(obj)
+        if t is int:
+            if -0x30 <= obj < 0xa0:
+                buf.append(obj + IMM_INT_OFFSET)
+            else:
+                obj = str(obj).encode("ascii")
+                lenobj = len(obj)
+                if lenobj < 256:
+                    buf.append(_TAG_INT_L1)
+                    buf.append(lenobj)
+                else:
+                    buf.append(_TAG_INT_L4)
+                    buf += I4.pack(lenobj)
+                buf += obj
+        elif t is tuple:
+            lenobj = len(obj)
+            if lenobj < 5:
+                buf.append(_SHORT_TUP_TAGS[lenobj])
+            else:
+                buf += _tup_header(lenobj)
+            stack.extend(reversed(obj))
+        elif t is str:
+            obj = obj.encode("utf8")
+            lenobj = len(obj)
+            if lenobj < 5:
+                buf += _SHORT_UNICODE_HEADERS[lenobj]
+                buf += obj
+            else:
+                buf.append(_TAG_UNICODE)
+                stack.append(obj)
+        elif t is bytes:
+            lenobj = len(obj)
+            if lenobj < 5:
+                buf.append(_SHORT_STR_TAGS[lenobj])
+            else:
+                buf += _str_header(lenobj)
+            if lenobj < _LARGE_STR:
+                buf += obj
+            else:
+                chunks.append(buf)
+                chunks.append(obj)
+                buf = bytearray()
+        elif t is float:
+            buf.append(_TAG_FLOAT)
+            buf += F8.pack(obj)
+        elif obj is None:
+            buf.append(_TAG_NONE)
+        elif t is bool:
+            buf.append(_TAG_TRUE if obj else _TAG_FALSE)
+        elif t is list:
+            buf.append(_TAG_LIST)
+            buf += _tup_header(len(obj))
+            stack.extend(reversed(obj))
+        elif t is dict:
+            buf.append(_TAG_DICT)
+            buf += _tup_header(2 * len(obj))
+            for key, value in reversed(obj.items()):
+                stack.append(value)
+                stack.append(key)
+        elif t is frozenset or t is set:
+            buf.append(_TAG_FSET if t is frozenset else _TAG_SET)
+            buf += _tup_header(len(obj))
+            stack.extend(obj)  # the order of the items does not matter
+        elif t is bytearray or t is memoryview:
+            buf.append(_TAG_BYTEARRAY if t is bytearray else _TAG_MEMORYVIEW)
+            stack.append(bytes(obj))
+        elif t is slice:
+            buf.append(_TAG_SLICE)
+            stack.append((obj.start, obj.stop, obj.step))
+        elif t is complex:
+            buf.append(_TAG_COMPLEX)
+            buf += C16.pack(obj.real, obj.imag)
+        elif obj is NotImplemented:
+            buf.append(_TAG_NOT_IMPLEMENTED)
+        elif obj is Ellipsis:
+            buf.append(_TAG_ELLIPSIS)
         else:
-            stream.append(TAG_INT_L4 + I4.pack(lenobj) + obj)
-
-
-@register(_dump_registry, float)
-def _dump_float(obj, stream):
-    stream.append(TAG_FLOAT + F8.pack(obj))
-
-
-@register(_dump_registry, complex)
-def _dump_complex(obj, stream):
-    stream.append(TAG_COMPLEX + C16.pack(obj.real, obj.imag))
-
-
-@register(_dump_registry, bytes)
-def _dump_bytes(obj, stream):
-    lenobj = len(obj)
-    if lenobj == 0:
-        stream.append(TAG_EMPTY_STR)
-    elif lenobj == 1:
-        stream.append(TAG_STR1 + obj)
-    elif lenobj == 2:
-        stream.append(TAG_STR2 + obj)
-    elif lenobj == 3:
-        stream.append(TAG_STR3 + obj)
-    elif lenobj == 4:
-        stream.append(TAG_STR4 + obj)
-    elif lenobj < 256:
-        stream.append(TAG_STR_L1 + I1.pack(lenobj) + obj)
-    else:
-        stream.append(TAG_STR_L4 + I4.pack(lenobj) + obj)
-
-
-@register(_dump_registry, type(u""))
-def _dump_str(obj, stream):
-    stream.append(TAG_UNICODE)
-    _dump_bytes(obj.encode("utf8"), stream)
-
-
-@register(_dump_registry, tuple)
-def _dump_tuple(obj, stream):
-    lenobj = len(obj)
-    if lenobj == 0:
-        stream.append(TAG_EMPTY_TUPLE)
-    elif lenobj == 1:
-        stream.append(TAG_TUP1)
-    elif lenobj == 2:
-        stream.append(TAG_TUP2)
-    elif lenobj == 3:
-        stream.append(TAG_TUP3)
-    elif lenobj == 4:
-        stream.append(TAG_TUP4)
-    elif lenobj < 256:
-        stream.append(TAG_TUP_L1 + I1.pack(lenobj))
-    else:
-        stream.append(TAG_TUP_L4 + I4.pack(lenobj))
-    for item in obj:
-        _dump(item, stream)
-
-
-def _undumpable(obj, stream):
-    raise TypeError(f"cannot dump {obj}")
-
-
-def _dump(obj, stream):
-    _dump_registry.get(type(obj), _undumpable)(obj, stream)
+            raise TypeError(f"cannot dump {obj!r}")
+    chunks.append(buf)
+    return chunks
 
 
 # ===============================================================================
 # loading
 # ===============================================================================
-@register(_load_registry, TAG_NONE)
-def _load_none(stream):
-    return None
-
-
-@register(_load_registry, TAG_NOT_IMPLEMENTED)
-def _load_nonimp(stream):
-    return NotImplemented
-
-
-@register(_load_registry, TAG_ELLIPSIS)
-def _load_elipsis(stream):
-    return Ellipsis
-
-
-@register(_load_registry, TAG_TRUE)
-def _load_true(stream):
-    return True
-
-
-@register(_load_registry, TAG_FALSE)
-def _load_false(stream):
-    return False
-
-
-@register(_load_registry, TAG_EMPTY_TUPLE)
-def _load_empty_tuple(stream):
-    return ()
-
-
-@register(_load_registry, TAG_EMPTY_STR)
-def _load_empty_str(stream):
-    return b""
-
-
-@register(_load_registry, TAG_FLOAT)
-def _load_float(stream):
-    return F8.unpack(stream.read(8))[0]
-
-
-@register(_load_registry, TAG_COMPLEX)
-def _load_complex(stream):
-    real, imag = C16.unpack(stream.read(16))
-    return complex(real, imag)
-
-
-@register(_load_registry, TAG_STR1)
-def _load_str1(stream):
-    return stream.read(1)
-
-
-@register(_load_registry, TAG_STR2)
-def _load_str2(stream):
-    return stream.read(2)
-
-
-@register(_load_registry, TAG_STR3)
-def _load_str3(stream):
-    return stream.read(3)
-
-
-@register(_load_registry, TAG_STR4)
-def _load_str4(stream):
-    return stream.read(4)
-
-
-@register(_load_registry, TAG_STR_L1)
-def _load_str_l1(stream):
-    l, = I1.unpack(stream.read(1))
-    return stream.read(l)
-
-
-@register(_load_registry, TAG_STR_L4)
-def _load_str_l4(stream):
-    l, = I4.unpack(stream.read(4))
-    return stream.read(l)
-
-
-@register(_load_registry, TAG_UNICODE)
-def _load_unicode(stream):
-    obj = _load(stream)
-    return obj.decode("utf-8")
-
-
-@register(_load_registry, TAG_TUP1)
-def _load_tup1(stream):
-    return (_load(stream),)
-
-
-@register(_load_registry, TAG_TUP2)
-def _load_tup2(stream):
-    return (_load(stream), _load(stream))
-
-
-@register(_load_registry, TAG_TUP3)
-def _load_tup3(stream):
-    return (_load(stream), _load(stream), _load(stream))
-
-
-@register(_load_registry, TAG_TUP4)
-def _load_tup4(stream):
-    return (_load(stream), _load(stream), _load(stream), _load(stream))
-
-
-@register(_load_registry, TAG_TUP_L1)
-def _load_tup_l1(stream):
-    l, = I1.unpack(stream.read(1))
-    return tuple(_load(stream) for i in range(l))
-
-
-@register(_load_registry, TAG_TUP_L4)
-def _load_tup_l4(stream):
-    l, = I4.unpack(stream.read(4))
-    return tuple(_load(stream) for i in range(l))
-
-
-@register(_load_registry, TAG_SLICE)
-def _load_slice(stream):
-    start, stop, step = _load(stream)
+# Objects are loaded from a memoryview, with an offset into it. Instead of recursing into
+# containers, their items are collected in frames, ``(items, remaining, finish)``, kept on
+# a stack; once a frame has all of its items, ``finish(items)`` makes the container, which
+# becomes an item of the frame below it (or the result).
+def _wrapped(items, expected):
+    """the one value of a wrapper tag, which must be of the type the wrapper is dumped with"""
+    value = items[0]
+    if type(value) is not expected:
+        raise ValueError(f"invalid brine wrapper of {type(value).__name__}")
+    return value
+
+
+def _finish_slice(items):
+    start, stop, step = _wrapped(items, tuple)
     return slice(start, stop, step)
 
 
-@register(_load_registry, TAG_FSET)
-def _load_frozenset(stream):
-    return frozenset(_load(stream))
-
-
-@register(_load_registry, TAG_INT_L1)
-def _load_int_l1(stream):
-    l, = I1.unpack(stream.read(1))
-    return int(stream.read(l))
-
-
-@register(_load_registry, TAG_INT_L4)
-def _load_int_l4(stream):
-    l, = I4.unpack(stream.read(4))
-    return int(stream.read(l))
-
-
-def _load(stream):
-    tag = stream.read(1)
-    if tag in IMM_INTS_LOADER:
-        return IMM_INTS_LOADER[tag]
-    return _load_registry.get(tag)(stream)
+def _finish_frozenset(items):
+    return frozenset(_wrapped(items, tuple))
+
+
+def _finish_list(items):
+    return list(_wrapped(items, tuple))
+
+
+def _finish_dict(items):
+    items = _wrapped(items, tuple)
+    if len(items) % 2:
+        raise ValueError("invalid brine dict of an odd number of items")
+    items = iter(items)
+    return dict(zip(items, items))
+
+
+def _finish_set(items):
+    return set(_wrapped(items, tuple))
+
+
+def _finish_bytearray(items):
+    return bytearray(_wrapped(items, bytes))
+
+
+def _finish_memoryview(items):
+    return memoryview(_wrapped(items, bytes))
+
+
+# tags whose value is made from the one value that follows them
+_WRAPPERS = {
+    _TAG_SLICE: _finish_slice,
+    _TAG_FSET: _finish_frozenset,
+    _TAG_LIST: _finish_list,
+    _TAG_DICT: _finish_dict,
+    _TAG_SET: _finish_set,
+    _TAG_BYTEARRAY: _finish_bytearray,
+    _TAG_MEMORYVIEW: _finish_memoryview,
+}
+
+
+def _load(view, pos):
+    # the kinds are compared with literals, as global lookups would slow the loop down
+    # (0 invalid, 1 _K_IMM_INT, 2 _K_STR, 3 _K_UNICODE, 4 _K_TUPLE, 5 _K_SINGLETON,
+    # 6 _K_FLOAT, 7 _K_INT, 8 _K_WRAPPER, 9 _K_COMPLEX)
+    kinds = _KINDS
+    lengths = _LENGTHS
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    make_tuple = tuple
+    items = []  # the frame of the innermost container; the result is the one item of the bottom frame
+    remaining = 1  # the number of items the innermost container still lacks
+    finish = None
+    end = len(view)
+    while True:
+        tag = view[pos]
+        kind = kinds[tag]
+        if kind == 1:
+            obj = tag - IMM_INT_OFFSET
+            pos += 1
+        elif kind == 4:
+            if tag == _TAG_TUP_L1:
+                length = view[pos + 1]
+                pos += 2
+            elif tag == _TAG_TUP_L4:
+                length, = I4.unpack_from(view, pos + 1)
+                pos += 5
+            else:
+                length = lengths[tag]
+                pos += 1
+            # the items that are immediate integers or singletons (the most common leaves)
+            # are loaded right away; a frame is needed only if other items follow
+            leaf = []
+            while length:
+                tag = view[pos]
+                kind = kinds[tag]
+                if kind == 1:
+                    leaf.append(tag - IMM_INT_OFFSET)
+                elif kind == 5:
+                    leaf.append(_SINGLETONS[tag])
+                else:
+                    push((items, remaining, finish))
+                    items = leaf
+                    remaining = length
+                    finish = make_tuple
+                    break
+                pos += 1
+                length -= 1
+            if items is leaf:
+                continue
+            obj = make_tuple(leaf)
+        elif kind == 2 or kind == 3:
+            if kind == 3:
+                pos += 1
+                tag = view[pos]
+                if kinds[tag] != 2:
+                    raise ValueError(f"invalid brine tag {tag:#04x} in a unicode string at offset {pos}")
+            if tag == _TAG_STR_L1:
+                start = pos + 2
+                pos = start + view[pos + 1]
+            elif tag == _TAG_STR_L4:
+                start = pos + 5
+                pos = start + I4.unpack_from(view, pos + 1)[0]
+            else:
+                start = pos + 1
+                pos = start + lengths[tag]
+            if pos > end:
+                raise ValueError(f"truncated brine string at offset {start}")
+            obj = view[start:pos].tobytes() if kind == 2 else str(view[start:pos], "utf-8")
+        elif kind == 5:
+            obj = _SINGLETONS[tag]
+            pos += 1
+        elif kind == 6:
+            obj, = F8.unpack_from(view, pos + 1)
+            pos += 9
+        elif kind == 7:
+            if tag == _TAG_INT_L1:
+                start = pos + 2
+                pos = start + view[pos + 1]
+            else:
+                start = pos + 5
+                pos = start + I4.unpack_from(view, pos + 1)[0]
+            if pos > end:
+                raise ValueError(f"truncated brine integer at offset {start}")
+            obj = int(view[start:pos].tobytes())
+        elif kind == 8:
+            push((items, remaining, finish))
+            items = []
+            remaining = 1
+            finish = _WRAPPERS[tag]
+            pos += 1
+            continue
+        elif kind == 9:
+            real, imag = C16.unpack_from(view, pos + 1)
+            obj = complex(real, imag)
+            pos += 17
+        else:
+            raise ValueError(f"invalid brine tag {tag:#04x} at offset {pos}")
+        # hand the object to the innermost frame, finishing the frames that become complete
+        items.append(obj)
+        remaining -= 1
+        while not remaining:
+            if not stack:
+                return obj, pos
+            obj = finish(items)
+            items, remaining, finish = pop()
+            items.append(obj)
+            remaining -= 1
 
 # ===============================================================================
 # API
@@ -351,38 +418,78 @@ def dump(obj):
 
     :returns: a byte-string representation of the object
     """
-    stream = []
-    _dump(obj, stream)
-    return b"".join(stream)
+    return b"".join(_dump(obj))
 
 
 def load(data):
     """Recreates (loads) an object from its byte-string representation
 
-    :param data: the byte-string representation of an object
+    :param data: the byte-string representation of an object (any bytes-like object)
 
     :returns: the dumped object
+
+    :raises: ``ValueError`` if the data is malformed
     """
-    stream = BytesIO(data)
-    return _load(stream)
+    try:
+        obj, _ = _load(memoryview(data), 0)
+    except (IndexError, struct.error):
+        raise ValueError("truncated brine data") from None
+    except TypeError as ex:  # e.g., an unhashable key of a dict or item of a set
+        raise ValueError(f"invalid brine data: {ex}") from None
+    return obj
 
 
 simple_types = frozenset([type(None), int, bool, float, bytes, str, complex, type(NotImplemented), type(Ellipsis)])
+container_types = frozenset([list, dict, set, bytearray, memoryview])
 
 
-def dumpable(obj):
+class _Leave(object):
+    """marks the end of checking the items of a container (see :func:`dumpable`)"""
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+
+def dumpable(obj, containers=False):
     """Indicates whether the given object is *dumpable* by brine
 
+    :param containers: whether to accept the mutable containers (``list``, ``dict``, ``set``,
+                       ``bytearray`` and ``memoryview``), which are dumped by value
+
     :returns: ``True`` if the object is dumpable (e.g., :func:`dump` would succeed),
               ``False`` otherwise
     """
-    if type(obj) in simple_types:
-        return True
-    if type(obj) in (tuple, frozenset):
-        return all(dumpable(item) for item in obj)
-    if type(obj) is slice:
-        return dumpable(obj.start) and dumpable(obj.stop) and dumpable(obj.step)
-    return False
+    stack = [obj]
+    path = set()  # the ids of the containers whose items are being checked
+    while stack:
+        obj = stack.pop()
+        t = type(obj)
+        if t in simple_types:
+            continue
+        if t is tuple or t is frozenset:
+            stack.extend(obj)
+        elif t is slice:
+            stack.extend((obj.start, obj.stop, obj.step))
+        elif t is _Leave:
+            path.discard(obj.key)
+        elif not containers or t not in container_types:
+            return False
+        elif t is memoryview:
+            if obj.format != "B" or obj.ndim != 1:
+                return False
+        elif t is not bytearray:
+            # a container that contains itself cannot be dumped
+            if id(obj) in path:
+                return False
+            path.add(id(obj))
+            stack.append(_Leave(id(obj)))
+            if t is dict:
+                for item in obj.items():
+                    stack.extend(item)
+            else:
+                stack.extend(obj)
+    return True
 
 
 if __name__ == "__main__":
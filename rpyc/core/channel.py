@@ -1,33 +1,134 @@
 """*Channel* is an abstraction layer over streams that works with *packets of data*,
 rather than an endless stream of bytes, and adds support for compression.
 """
+import itertools
+
 from rpyc.lib import safe_import
 from rpyc.lib.compat import Struct, BYTES_LITERAL
 zlib = safe_import("zlib")
+bz2 = safe_import("bz2")
+lzma = safe_import("lzma")
 
-# * 64 bit length field?
 # * separate \n into a FlushingChannel subclass?
 # * add thread safety as a subclass?
 
+_codecs_by_name = {}  # name -> (codec_id, compress, decompress, default_level)
+_codecs_by_id = {}  # codec_id -> decompress
+
+
+def register_codec(name, codec_id, compress, decompress, default_level=None):
+    """Registers a compression codec that channels can use.
+
+    :param name: the name of the codec (see the ``compression_codec`` configuration parameter)
+    :param codec_id: the id of the codec, sent in the header of each frame the codec compressed
+                     (1-127, and the same for both parties; 0 stands for uncompressed frames, and
+                     the high bit of the header byte marks fragments)
+    :param compress: a function of ``(data, level)``, returning the compressed data
+    :param decompress: a function of ``(data)``, returning the decompressed data
+    :param default_level: the compression level used when none is configured (``None`` for
+                          the channel's ``COMPRESSION_LEVEL``)
+    """
+    if not 0 < codec_id < 0x80:  # the high bit is Channel.FRAGMENT
+        raise ValueError(f"invalid codec id: {codec_id!r}")
+    _codecs_by_name[name] = (codec_id, compress, decompress, default_level)
+    _codecs_by_id[codec_id] = decompress
+
+
+# the ids of the built-in codecs are part of the protocol; zlib is 1 for compatibility with
+# the frames of older versions, which used the header byte as a "compressed" flag
+if zlib:
+    register_codec("zlib", 1, lambda data, level: zlib.compress(data, level), zlib.decompress)
+if bz2:
+    register_codec("bz2", 2, lambda data, level: bz2.compress(data, level), bz2.decompress, 9)
+if lzma:
+    register_codec("lzma", 3, lambda data, level: lzma.compress(data, preset=level), lzma.decompress, 6)
+
 
 class Channel(object):
     """Channel implementation.
 
     Note: In order to avoid problems with all sorts of line-buffered transports,
     we deliberately add ``\\n`` at the end of each frame.
+
+    Frames larger than the compression threshold are compressed by the channel's
+    codec (see :func:`register_codec`); the header of each frame names the codec that
+    compressed it, so a channel can receive frames of any registered codec.
+
+    Packets larger than the fragment size (if set) are sent as a sequence of fragments,
+    frames whose header byte has the ``FRAGMENT`` bit set, and whose data begins with
+    ``FRAGMENT_HEADER``: the id of the packet and its total size (which may exceed 4GB).
+    The fragments of a packet are reassembled into a single buffer, which grows as they
+    arrive (the size in their header is only checked), and other packets may be sent
+    between them (see :func:`send_fragments`). Any channel receives fragments; only the
+    other party's channel needs the fragment size to send them.
+
+    :param stream: the underlying stream
+    :param compress: whether to compress large frames
+    :param codec: the name of the compression codec (``"zlib"``, ``"bz2"`` or ``"lzma"``)
+    :param level: the compression level (``None`` for the codec's default)
+    :param threshold: the size from which frames are compressed (``None`` for ``COMPRESSION_THRESHOLD``)
+    :param adaptive: whether to stop compressing for a while, when the compression ratio of the
+                     recent frames was poor (see ``ADAPTIVE_RATIO`` and ``ADAPTIVE_BACKOFF``)
+    :param fragment_size: the size from which packets are sent in fragments of this size
+                          (``None`` to send every packet as a single frame)
     """
 
     COMPRESSION_THRESHOLD = 3000
     COMPRESSION_LEVEL = 1
+    ADAPTIVE_RATIO = 0.9  # compressed/original size above which compression is considered useless
+    ADAPTIVE_BACKOFF = 64  # the number of frames sent uncompressed, before compressing is attempted again
     FRAME_HEADER = Struct("!LB")
+    FRAGMENT = 0x80  # the bit of the header byte that marks fragments
+    FRAGMENT_HEADER = Struct("!LQ")  # packet id, total size
     FLUSHER = BYTES_LITERAL("\n")  # cause any line-buffered layers below us to flush
-    __slots__ = ["stream", "compress"]
+    __slots__ = ["stream", "compress", "codec", "level", "threshold", "adaptive", "_codec_info",
+                 "_ratio", "_backoff", "fragment_size", "_packet_ids", "_partial"]
 
-    def __init__(self, stream, compress=True):
+    def __init__(self, stream, compress=True, codec="zlib", level=None, threshold=None, adaptive=False,
+                 fragment_size=None):
         self.stream = stream
-        if not zlib:
+        self.fragment_size = fragment_size
+        self._packet_ids = itertools.count()
+        self._partial = {}  # packet id -> buffer, of the packets being reassembled
+        self.compress = False
+        self.codec = None
+        self.level = level
+        self.threshold = self.COMPRESSION_THRESHOLD if threshold is None else threshold
+        self.adaptive = adaptive
+        self._codec_info = None
+        self._ratio = 0.0  # moving average of the compression ratio
+        self._backoff = 0
+        if codec == "zlib" and not zlib:
             compress = False
-        self.compress = compress
+        if compress:
+            self.set_compression(codec)
+
+    def set_compression(self, codec, level=None, threshold=None, adaptive=None):
+        """Sets the compression of the frames sent over the channel. Arguments that are
+        ``None`` remain unchanged.
+
+        :param codec: the name of a registered codec, or ``False`` to stop compressing
+        :param level: the compression level
+        :param threshold: the size from which frames are compressed
+        :param adaptive: whether to skip compression while the compression ratio is poor
+        """
+        if codec is not None:
+            if not codec:
+                self.compress = False
+                self.codec = None
+                self._codec_info = None
+            elif codec not in _codecs_by_name:
+                raise ValueError(f"unknown compression codec: {codec!r}")
+            else:
+                self.compress = True
+                self.codec = codec
+                self._codec_info = _codecs_by_name[codec]
+        if level is not None:
+            self.level = level
+        if threshold is not None:
+            self.threshold = threshold
+        if adaptive is not None:
+            self.adaptive = adaptive
 
     def close(self):
         """closes the channel and underlying stream"""
@@ -46,39 +147,139 @@ class Channel(object):
         """polls the underlying steam for data, waiting up to *timeout* seconds"""
         return self.stream.poll(timeout)
 
+    def frame_size(self, header):
+        """returns the total size (including the header) of the frame that begins with the given header"""
+        length, codec_id = self.FRAME_HEADER.unpack(header)
+        return self.FRAME_HEADER.size + length + len(self.FLUSHER)
+
     def recv(self):
         """Receives the next packet (or *frame*) from the underlying stream.
         This method will block until the packet has been read completely
 
-        :returns: string of data
+        :returns: the data, as a bytes-like object (a ``memoryview`` of the received
+                  buffer, to avoid copying it)
         """
-        header = self.stream.read(self.FRAME_HEADER.size)
-        length, compressed = self.FRAME_HEADER.unpack(header)
-        data = self.stream.read(length + len(self.FLUSHER))[:-len(self.FLUSHER)]
-        if compressed:
-            data = zlib.decompress(data)
+        data = self.recv_frame()
+        while data is None:
+            data = self.recv_frame()
         return data
 
-    def send(self, data):
+    def recv_frame(self):
+        """Receives the next frame from the underlying stream, blocking until it has been
+        read completely
+
+        :returns: the packet, as in :func:`recv`, or ``None`` if the frame was a fragment that
+                  did not complete its packet
+        """
+        header = self.stream.read(self.FRAME_HEADER.size)
+        length, codec_id = self.FRAME_HEADER.unpack(header)
+        return self._recv_frame_data(length, codec_id)
+
+    def recv_into(self, view):
+        """Receives the next packet into the given writable memoryview, blocking until it has
+        been read completely. The data of a raw (neither compressed nor fragmented) frame is
+        read directly into the view, without copying it
+
+        :returns: the size of the packet
+        :raises: ``ValueError`` if the packet is larger than the view
+        """
+        while True:
+            header = self.stream.read(self.FRAME_HEADER.size)
+            length, codec_id = self.FRAME_HEADER.unpack(header)
+            if codec_id == 0:
+                if length > len(view):
+                    raise ValueError(f"frame of {length} bytes exceeds its buffer ({len(view)} bytes)")
+                self.stream.read_into(view[:length])
+                self.stream.read(len(self.FLUSHER))
+                return length
+            data = self._recv_frame_data(length, codec_id)
+            if data is not None:
+                if len(data) > len(view):
+                    raise ValueError(f"packet of {len(data)} bytes exceeds its buffer ({len(view)} bytes)")
+                view[:len(data)] = data
+                return len(data)
+
+    def _recv_frame_data(self, length, codec_id):
+        data = memoryview(self.stream.read(length + len(self.FLUSHER)))[:-len(self.FLUSHER)]
+        fragment = codec_id & self.FRAGMENT
+        if fragment:
+            packet_id, total = self.FRAGMENT_HEADER.unpack(data[:self.FRAGMENT_HEADER.size])
+            data = data[self.FRAGMENT_HEADER.size:]
+            codec_id ^= self.FRAGMENT
+        if codec_id:
+            decompress = _codecs_by_id.get(codec_id)
+            if decompress is None:
+                raise ValueError(f"frame compressed by an unknown codec: {codec_id!r}")
+            data = decompress(data)
+        if not fragment:
+            return data
+        buf = self._partial.get(packet_id)
+        if buf is None:
+            buf = self._partial[packet_id] = bytearray()
+        if len(buf) + len(data) > total:
+            raise ValueError(f"fragments of packet {packet_id} exceed its size ({total})")
+        buf += data
+        if len(buf) < total:
+            return None
+        del self._partial[packet_id]
+        return memoryview(buf)
+
+    def send(self, data, compress=True):
         """Sends the given string of data as a packet over the underlying
         stream. Blocks until the packet has been sent.
 
         :param data: the byte string to send as a packet
+        :param compress: whether the packet may be compressed (``False`` sends it as is)
         """
-        if self.compress and len(data) > self.COMPRESSION_THRESHOLD:
-            compressed = 1
-            data = zlib.compress(data, self.COMPRESSION_LEVEL)
+        if self.fragment_size and len(data) > self.fragment_size:
+            for _ in self.send_fragments(data, compress):
+                pass
         else:
-            compressed = 0
-        data_size = len(data)
-        header = self.FRAME_HEADER.pack(data_size, compressed)
-        flush_size = len(self.FLUSHER)
-        if self.FRAME_HEADER.size + data_size + flush_size <= self.stream.MAX_IO_CHUNK:
-            # avoid overhead from socket writes requiring GIL to be held
-            self.stream.write(header + data + self.FLUSHER)
+            self._send_frame(data, compress)
+
+    def send_fragments(self, data, compress=True):
+        """Sends the given string of data as a packet, in fragments of ``fragment_size``
+        bytes. This is a generator that sends a fragment whenever it is advanced, so the
+        caller can send other packets between the fragments
+
+        :param data: the byte string to send as a packet
+        :param compress: whether the fragments may be compressed
+        """
+        view = memoryview(data).cast("B")
+        total = len(view)
+        packet_id = next(self._packet_ids) & 0xffffffff
+        prefix = self.FRAGMENT_HEADER.pack(packet_id, total)
+        for pos in range(0, total, self.fragment_size):
+            self._send_frame(view[pos:pos + self.fragment_size], compress, prefix)
+            yield
+
+    def _send_frame(self, data, compress, fragment_prefix=None):
+        codec_id = 0
+        if compress and self.compress and len(data) > self.threshold:
+            if self._backoff:
+                self._backoff -= 1
+            else:
+                codec_id, compress, _, level = self._codec_info
+                if self.level is not None:
+                    level = self.level
+                elif level is None:
+                    level = self.COMPRESSION_LEVEL
+                compressed = compress(data, level)
+                ratio = len(compressed) / len(data)
+                if self.adaptive:
+                    self._ratio = (self._ratio + ratio) / 2 if self._ratio else ratio
+                    if self._ratio > self.ADAPTIVE_RATIO:
+                        self._backoff = self.ADAPTIVE_BACKOFF
+                        self._ratio = 0.0
+                if ratio < 1:
+                    data = compressed
+                else:
+                    codec_id = 0  # compression did not pay off
+        if fragment_prefix is None:
+            header = self.FRAME_HEADER.pack(len(data), codec_id)
+            buffers = (header, data, self.FLUSHER)
         else:
-            # Data larger than 64KB, the extra writes are negligible
-            part1 = self.stream.MAX_IO_CHUNK - self.FRAME_HEADER.size
-            self.stream.write(header + data[:part1])
-            self.stream.write(data[part1:])
-            self.stream.write(self.FLUSHER)
+            header = self.FRAME_HEADER.pack(len(fragment_prefix) + len(data), codec_id | self.FRAGMENT)
+            buffers = (header, fragment_prefix, data, self.FLUSHER)
+        # a single vectored write, without concatenating (copying) the data
+        self.stream.writev(buffers)
@@ -5,12 +5,22 @@
 MSG_REQUEST = 1
 MSG_REPLY = 2
 MSG_EXCEPTION = 3
+MSG_BATCH = 4
+MSG_REPLY_OOB = 5
+MSG_PIPELINE_REQUEST = 6  # a request whose result later requests may use (see promise_pipelining)
+
+# send priorities (lanes); lower values are sent first
+PRIORITY_CONTROL = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BULK = 2
 
 # boxing
 LABEL_VALUE = 1
 LABEL_TUPLE = 2
 LABEL_LOCAL_REF = 3
 LABEL_REMOTE_REF = 4
+LABEL_REMOTE_REF_METHODS = 5  # a remote ref, with the methods of its class (see inline_methods)
+LABEL_PROMISE = 6  # the result of an earlier MSG_PIPELINE_REQUEST
 
 # action handlers
 HANDLE_PING = 1
@@ -33,12 +43,20 @@ HANDLE_BUFFITER = 17
 HANDLE_OLDSLICING = 18
 HANDLE_CTXEXIT = 19
 HANDLE_INSTANCECHECK = 20
+HANDLE_DEL_MANY = 21
+HANDLE_PEER_TOKEN = 22
+HANDLE_DEL_PROMISE = 23
+HANDLE_CALLPATH = 24
 
 # optimized exceptions
 EXC_STOP_ITERATION = 1
 
 # IO values
 STREAM_CHUNK = 64000  # read/write chunk is 64KB, too large of a value will degrade response for other clients
+STREAM_WINDOW = 8  # the number of chunks in flight when uploading or downloading a file (see rpyc.utils.classic)
+SYNC_BLOCK = 128 * 1024  # the block size of delta transfers (see rpyc.utils.classic.sync_dir)
+OOB_CHUNK = 1024 * 1024  # out-of-band pickle buffers are sent in raw frames of up to 1MB
+OOB_PREALLOC = 64 * OOB_CHUNK  # the size of out-of-band buffers allocated upfront; larger ones grow as they arrive
 
 # DEBUG
 # for k in globals().keys():
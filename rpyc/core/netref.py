@@ -4,12 +4,16 @@ of *magic*, so beware.
 import sys
 import types
 from rpyc.lib import get_methods, get_id_pack
+from rpyc.lib.colls import LRUCache
 from rpyc.lib.compat import pickle, maxint
 from rpyc.core import consts
 
 
 builtin_id_pack_cache = {}  # name_pack -> id_pack
 builtin_classes_cache = {}  # id_pack -> class
+# (peer token,) + id_pack of a remote class -> netref class, shared by the connections whose config
+# enables shared_class_cache; set its maxsize to resize it
+shared_classes_cache = LRUCache(4096)
 # If these can be accessed, numpy will try to load the array from local memory,
 # resulting in exceptions and/or segfaults, see #236:
 DELETED_ATTRS = frozenset([
@@ -63,6 +67,29 @@ def syncreq(proxy, handler, *args):
     return conn.sync_request(handler, proxy, *args)
 
 
+def unpickle_remote(proxy, proto):
+    """Pickles the object of the given proxy on the other party, with the given protocol,
+    and unpickles it locally (``allow_pickle`` must be enabled on the other party).
+    Not intended to be invoked directly.
+
+    If ``pickle_out_of_band`` is enabled, the large buffers of the object (pickle protocol 5)
+    are sent as raw frames after the reply, and loaded without copying them again.
+
+    :param proxy: the proxy object
+    :param proto: the pickle protocol
+
+    :returns: a copy of the object
+    """
+    conn = object.__getattribute__(proxy, "____conn__")
+    if conn._config["pickle_out_of_band"] and not conn._bind_threads:
+        reply = conn.sync_request(consts.HANDLE_PICKLE, proxy, proto if proto < 0 else max(proto, 5), True)
+        if type(reply) is tuple:
+            data, buffers = reply
+            return pickle.loads(data, buffers=buffers)
+        return pickle.loads(reply)
+    return pickle.loads(conn.sync_request(consts.HANDLE_PICKLE, proxy, proto))
+
+
 def asyncreq(proxy, handler, *args):
     """Performs an asynchronous request on the given proxy object.
     Not intended to be invoked directly.
@@ -119,7 +146,7 @@ class BaseNetref(object, metaclass=NetrefMetaclass):
 
     def __del__(self):
         try:
-            asyncreq(self, consts.HANDLE_DEL, self.____refcount__)
+            self.____conn__._release_netref(self)
         except Exception:
             # raised in a destructor, most likely on program termination,
             # when the connection might have already been closed.
@@ -144,23 +171,25 @@ class BaseNetref(object, metaclass=NetrefMetaclass):
         elif name == "__array__":
             return object.__getattribute__(self, "__array__")
         else:
-            return syncreq(self, consts.HANDLE_GETATTR, name)
+            return object.__getattribute__(self, "____conn__")._getattr_request(self, name)
 
     def __getattr__(self, name):
         if name in DELETED_ATTRS:
             raise AttributeError()
-        return syncreq(self, consts.HANDLE_GETATTR, name)
+        return object.__getattribute__(self, "____conn__")._getattr_request(self, name)
 
     def __delattr__(self, name):
         if name in LOCAL_ATTRS:
             object.__delattr__(self, name)
         else:
+            self.____conn__.invalidate_attr_cache(self, name)
             syncreq(self, consts.HANDLE_DELATTR, name)
 
     def __setattr__(self, name, value):
         if name in LOCAL_ATTRS:
             object.__setattr__(self, name, value)
         else:
+            self.____conn__.invalidate_attr_cache(self, name)
             syncreq(self, consts.HANDLE_SETATTR, name, value)
 
     def __dir__(self):
@@ -254,7 +283,7 @@ def _make_method(name, doc):
             if not object.__getattribute__(self,'____conn__')._config["allow_pickle"]:
                 # Security check that server side allows pickling per #551
                 raise ValueError("pickling is disabled")
-            array = pickle.loads(syncreq(self, consts.HANDLE_PICKLE, -1))
+            array = unpickle_remote(self, -1)
             return array.__array__(*args, **kwargs)
         __array__.__doc__ = doc
         return __array__
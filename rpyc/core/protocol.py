@@ -1,22 +1,27 @@
 """The RPyC protocol
 """
 import sys
+import asyncio
 import itertools
 import socket
-import time  # noqa: F401
+import time
 import gc  # noqa: F401
 
 import collections
 import concurrent.futures as c_futures
 import os
 import threading
+import uuid
+import weakref
 
+from contextlib import contextmanager
 from threading import Lock, Condition, RLock
 from rpyc.lib import spawn, Timeout, get_methods, get_id_pack, hasattr_static
 from rpyc.lib.compat import pickle, next, maxint, select_error, acquire_lock  # noqa: F401
 from rpyc.lib.colls import WeakValueDict, RefCountingColl
 from rpyc.core import consts, brine, vinegar, netref
 from rpyc.core.async_ import AsyncResult
+from rpyc.core.stats import ConnectionStats
 
 
 class PingError(Exception):
@@ -69,6 +74,26 @@ DEFAULT_CONFIG = dict(
     before_closed=None,
     close_catchall=False,
     bind_threads=os.environ.get('RPYC_BIND_THREADS') == 'true',
+    batch_max_messages=100,
+    netref_attr_cache=False,
+    netref_attr_cache_ttl=None,
+    netref_attr_cache_types=frozenset(['builtins.function', 'builtins.builtin_function_or_method',
+                                       'builtins.method', 'builtins.method-wrapper']),
+    netref_attr_cache_modules=frozenset(),
+    del_batch_size=0,
+    compression_codec=None,
+    compression_level=None,
+    compression_threshold=None,
+    compression_adaptive=None,
+    collect_stats=False,
+    by_value_containers=False,
+    pickle_out_of_band=False,
+    fragment_size=None,
+    bulk_reply_size=None,
+    inline_methods=False,
+    shared_class_cache=False,
+    inspect_docstrings=True,
+    promise_pipelining=False,
 )
 """
 The default configuration dictionary of the protocol. You can override these parameters
@@ -129,11 +154,149 @@ Parameter                                Default value     Description
 ``bind_threads``                         ``False``         Whether to restrict request/reply by thread (experimental).
                                                            The default value is False. Setting the environment variable
                                                            `RPYC_BIND_THREADS` to `"true"` will enable this feature.
+``batch_max_messages``                   ``100``           The number of messages collected by :func:`Connection.batch`
+                                                           before they are flushed as a single frame
+``netref_attr_cache``                    ``False``         Whether to cache the results of getting attributes of netrefs
+                                                           locally. Only the attributes of modules listed in
+                                                           ``netref_attr_cache_modules`` and attributes whose value is
+                                                           of one of ``netref_attr_cache_types`` are cached. See
+                                                           :func:`Connection.invalidate_attr_cache`
+``netref_attr_cache_ttl``                ``None``          The number of seconds a cached attribute remains valid, or
+                                                           ``None`` to keep it until it is invalidated
+``netref_attr_cache_types``              ``frozenset``     The remote types (as ``module.name``) whose instances are
+                                                           considered immutable attributes (by default, functions and
+                                                           methods)
+``netref_attr_cache_modules``            ``frozenset()``   The names of remote modules whose attributes are considered
+                                                           immutable (e.g., ``posixpath`` for ``os.path``)
+``del_batch_size``                       ``0``             When positive, the releases of garbage collected netrefs
+                                                           are buffered and sent as a single ``HANDLE_DEL_MANY``
+                                                           request once this many are pending, along with the next
+                                                           outgoing request, or when the connection is served.
+                                                           Both parties must support ``HANDLE_DEL_MANY``
+``compression_codec``                    ``None``          The codec that compresses large frames (``"zlib"``,
+                                                           ``"bz2"``, ``"lzma"`` or any :func:`registered
+                                                           <rpyc.core.channel.register_codec>` codec), ``False`` to
+                                                           disable compression, or ``None`` to keep the channel's codec
+                                                           (zlib). Each frame names its codec, but the other party must
+                                                           know that codec to decompress it
+``compression_level``                    ``None``          The compression level, or ``None`` for the codec's default
+``compression_threshold``                ``None``          The size (in bytes) from which frames are compressed, or
+                                                           ``None`` for the channel's default (3000)
+``compression_adaptive``                 ``None``          Whether to skip compression for a while, when the recent
+                                                           frames compressed poorly (``None`` keeps the channel's
+                                                           setting)
+``collect_stats``                        ``False``         Whether to count the bytes and messages the connection moves
+                                                           and the requests it serves, with their latencies, per
+                                                           handler. See :func:`Connection.stats`
+``by_value_containers``                  ``False``         Whether to pass ``list``, ``dict``, ``set``, ``bytearray``
+                                                           and ``memoryview`` objects by value (as copies), rather than
+                                                           by reference, when all of their items are :func:`dumpable
+                                                           <rpyc.core.brine.dumpable>`. Changes to the copy do not
+                                                           affect the original. The other party must support brine's
+                                                           container tags
+``pickle_out_of_band``                   ``False``         Whether :func:`~rpyc.utils.classic.obtain` and ``__array__``
+                                                           of netrefs ask the other party to send the large buffers of
+                                                           the pickled object (e.g., of NumPy arrays; pickle protocol 5)
+                                                           as raw frames after the reply, rather than inside it. They
+                                                           are received into buffers of their own. Both parties must
+                                                           support ``MSG_REPLY_OOB``. Not available with
+                                                           ``bind_threads``
+``fragment_size``                        ``None``          When set, frames larger than this many bytes are sent as a
+                                                           sequence of fragments of this size, which are reassembled by
+                                                           the other party, and small replies queued meanwhile are sent
+                                                           between the fragments rather than after the whole frame.
+                                                           Frames may then exceed 4GB. The other party must support
+                                                           fragments
+``bulk_reply_size``                      ``None``          When set, replies larger than this many bytes (e.g., 32768)
+                                                           are sent in the bulk lane (see :func:`Connection.priority`),
+                                                           so that they do not delay small messages; ``None`` sends
+                                                           them in the interactive lane
+``inline_methods``                       ``False``         Whether to send the methods of a class along with the first
+                                                           reference to an object of the class, so that the other party
+                                                           does not request them (``HANDLE_INSPECT``) before it creates
+                                                           the netref. The other party must support
+                                                           ``LABEL_REMOTE_REF_METHODS``
+``shared_class_cache``                   ``False``         Whether to share the netref classes created for remote
+                                                           classes (but not for their instances, whose methods may
+                                                           change) with the other connections to the same process (which
+                                                           the other party identifies with ``HANDLE_PEER_TOKEN``), in
+                                                           the process-wide LRU cache
+                                                           ``rpyc.core.netref.shared_classes_cache``, so that new
+                                                           connections do not inspect those classes again
+``inspect_docstrings``                   ``True``          Whether to send the docstrings of methods to the other party,
+                                                           when it inspects a class (which makes the reply much larger
+                                                           for classes with many methods); otherwise, the methods of
+                                                           netrefs have no docstrings
+``promise_pipelining``                   ``False``         Whether the requests of :func:`rpyc.async_` ask the other
+                                                           party to keep their results, so that their
+                                                           :class:`~rpyc.core.async_.AsyncResult` can be passed, before
+                                                           the result arrives, as an argument (or callee) of further
+                                                           requests, which the other party resolves to the result it
+                                                           computed. The results are kept until the ``AsyncResult`` is
+                                                           garbage collected. A request that uses a promise must not be
+                                                           sent in a more urgent lane than the request of the promise.
+                                                           The other party must support ``MSG_PIPELINE_REQUEST``. Not
+                                                           available with ``bind_threads``
 =======================================  ================  =====================================================
 """
 
 
 _connection_id_generator = itertools.count(1)
+_process_token = uuid.uuid4().hex  # identifies this process to the other party, see HANDLE_PEER_TOKEN
+_REPLY_MESSAGES = (consts.MSG_REPLY, consts.MSG_EXCEPTION)
+# requests that must not overtake the requests sent before them (e.g., releasing an object
+# that a queued request uses), and are thus always sent in the bulk (last) lane
+_IN_ORDER_HANDLERS = (consts.HANDLE_DEL, consts.HANDLE_DEL_MANY, consts.HANDLE_DEL_PROMISE, consts.HANDLE_CLOSE)
+
+
+class _Promise(object):
+    """The result of a ``MSG_PIPELINE_REQUEST``, which the later requests of the other party
+    may use (see ``promise_pipelining``)"""
+    __slots__ = ("ready", "is_exc", "obj", "held", "lock")
+
+    def __init__(self):
+        self.ready = False
+        self.is_exc = False
+        self.obj = None
+        self.held = []  # (seq, raw_args, promise) of the requests that use the promise before it is resolved
+        self.lock = Lock()
+
+    def hold(self, request):
+        """holds a request until the promise is resolved; returns ``False`` if it already is"""
+        with self.lock:
+            if self.ready:
+                return False
+            self.held.append(request)
+            return True
+
+    def __call__(self, is_exc, obj):
+        """resolves the promise; returns the requests held for it, which the caller dispatches"""
+        with self.lock:
+            self.is_exc = is_exc
+            self.obj = obj
+            self.ready = True
+            held, self.held = self.held, None
+        return held
+
+
+def _release_promise(conn_ref, seq):
+    """called when the AsyncResult of a ``MSG_PIPELINE_REQUEST`` is garbage collected"""
+    conn = conn_ref()
+    if conn is None or conn.closed:
+        return
+    try:
+        conn._async_request(consts.HANDLE_DEL_PROMISE, (seq,))
+    except Exception:
+        pass  # e.g., on program termination, like netref releases
+
+
+class _OutOfBandPickle(object):
+    """The result of ``HANDLE_PICKLE`` whose buffers are sent out-of-band (see ``pickle_out_of_band``)"""
+    __slots__ = ("data", "buffers")
+
+    def __init__(self, data, buffers):
+        self.data = data
+        self.buffers = buffers
 
 
 class Connection(object):
@@ -158,7 +321,15 @@ class Connection(object):
             self._config["connid"] = f"conn{next(_connection_id_generator)}"
 
         self._HANDLERS = self._request_handlers()
+        self._stats = ConnectionStats() if self._config["collect_stats"] else None
+        if self._stats is not None:
+            self._HANDLERS = dict((handler, self._stats.timed(handler, func))
+                                  for handler, func in self._HANDLERS.items())
         self._channel = channel
+        self._channel.set_compression(self._config["compression_codec"], self._config["compression_level"],
+                                      self._config["compression_threshold"], self._config["compression_adaptive"])
+        if self._config["fragment_size"] is not None:
+            self._channel.fragment_size = self._config["fragment_size"]
         self._seqcounter = itertools.count()
         self._recvlock = RLock()  # AsyncResult implementation means that synchronous requests have multiple acquires
         self._sendlock = Lock()
@@ -167,9 +338,20 @@ class Connection(object):
         self._local_objects = RefCountingColl()
         self._last_traceback = None
         self._proxy_cache = WeakValueDict()
-        self._netref_classes_cache = {}
+        self._netref_classes_cache = {}  # id_pack of a class, or (name_pack, class id) of its instances -> netref class
+        self._inlined_classes = {} if self._config["inline_methods"] else None  # key -> the methods sent, see _box
+        self._peer_token = None  # see _shared_class_key
+        self._promises = {}  # seq of a MSG_PIPELINE_REQUEST of the other party -> _Promise
+        self._promises_lock = Lock()
+        self._held_requests = 0  # the requests that wait for promises, see _dispatch_request
+        self._released_promises = []  # released while requests are held, which may use them
+        self._attr_cache = {} if self._config["netref_attr_cache"] else None  # id_pack -> (weakref, {name: entry})
         self._remote_root = None
-        self._send_queue = []
+        self._send_queues = ([], [], [])  # a queue per priority (lane), see _send_data
+        self._sending_priority = None  # the lane of the frame being sent
+        self._batch_local = threading.local()  # per-thread buffer of messages collected by batch()
+        self._priority_local = threading.local()  # per-thread lane of requests, see priority()
+        self._pending_releases = collections.deque()  # (id_pack, refcount) of collected netrefs, see del_batch_size
         self._local_root = root
         self._closed = False
         # Settings for bind_threads
@@ -202,9 +384,15 @@ class Connection(object):
         self._channel.close()
         self._local_root.on_disconnect(self)
         self._request_callbacks.clear()
+        self._pending_releases.clear()
         self._local_objects.clear()
         self._proxy_cache.clear()
         self._netref_classes_cache.clear()
+        if self._inlined_classes is not None:
+            self._inlined_classes.clear()
+        self._promises.clear()
+        if self._attr_cache is not None:
+            self._attr_cache.clear()
         self._last_traceback = None
         self._remote_root = None
         self._local_root = None
@@ -250,6 +438,20 @@ class Connection(object):
         """Returns the connectin's underlying file descriptor"""
         return self._channel.fileno()
 
+    def stats(self):  # IO
+        """Returns a snapshot of the connection's statistics, as a dict: the number of
+        requests in the send queue (``send_queue``), of local objects referenced by the other
+        party (``local_objects``) and of live proxies (``proxies``). When the connection
+        collects statistics (see ``collect_stats``), it also holds the number of bytes and
+        messages sent and received (before compression), the maximal depth of the send queue,
+        and, per handler name, the number of requests served, failed, and a histogram of their
+        latencies (see :mod:`rpyc.core.stats`).
+        """
+        snapshot = self._stats.snapshot() if self._stats is not None else {}
+        snapshot.update(connid=self._config["connid"], send_queue=sum(len(queue) for queue in self._send_queues),
+                        local_objects=len(self._local_objects), proxies=len(self._proxy_cache))
+        return snapshot
+
     def ping(self, data=None, timeout=3):  # IO
         """Asserts that the other party is functioning properly, by making sure
         the *data* is echoed back before the *timeout* expires
@@ -269,9 +471,13 @@ class Connection(object):
     def _get_seq_id(self):  # IO
         return next(self._seqcounter)
 
-    def _send(self, msg, seq, args):  # IO
+    def _send(self, msg, seq, args, priority=consts.PRIORITY_INTERACTIVE):  # IO
         data = brine.I1.pack(msg) + brine.dump((seq, args))  # see _dispatch
+        if msg in _REPLY_MESSAGES and self._config["bulk_reply_size"] is not None \
+                and len(data) > self._config["bulk_reply_size"]:
+            priority = consts.PRIORITY_BULK
         if self._bind_threads:
+            priority = consts.PRIORITY_INTERACTIVE  # lanes could reorder the messages of a thread
             this_thread = self._get_thread()
             data = brine.I8I8.pack(this_thread.id, this_thread._remote_thread_id) + data
             if msg == consts.MSG_REQUEST:
@@ -280,6 +486,20 @@ class Connection(object):
                 this_thread._occupation_count -= 1
                 if this_thread._occupation_count == 0:
                     this_thread._remote_thread_id = UNBOUND_THREAD_ID
+        else:
+            batch = getattr(self._batch_local, "messages", None)
+            if batch is not None:
+                # collected by batch(); sent as a single MSG_BATCH frame (in the lowest lane
+                # of its messages) by _flush_batch
+                batch.append(data)
+                if priority > self._batch_local.priority:
+                    self._batch_local.priority = priority
+                if len(batch) >= self._config["batch_max_messages"]:
+                    self._flush_batch()
+                return
+        self._send_data(data, priority)
+
+    def _send_data(self, data, priority=consts.PRIORITY_INTERACTIVE):  # IO
         # GC might run while sending data
         # if so, a BaseNetref.__del__ might be called
         # BaseNetref.__del__ must call asyncreq,
@@ -289,9 +509,17 @@ class Connection(object):
         # holds the sendlock send it when it's done with its current job.
         # NOTE: Atomic list operations should be thread safe,
         # please call me out if they are not on all implementations!
-        self._send_queue.append(data)
+        # A list of frames (see _send_out_of_band) is sent as a whole; its frames after the first
+        # are raw buffers, which are not compressed.
+        # There is a queue per priority (lane): the queued frames of a lane are sent before
+        # those of the lanes after it.
+        queues = self._send_queues
+        queues[priority].append(data)
+        if self._stats is not None:
+            size = sum(len(frame) for frame in data) if type(data) is list else len(data)
+            self._stats.record_sent(size, sum(len(queue) for queue in queues))
         # It is crucial to check the queue each time AFTER releasing the lock:
-        while self._send_queue:
+        while queues[0] or queues[1] or queues[2]:
             if not self._sendlock.acquire(False):
                 # Another thread holds the lock. It will send the data after
                 # it's done with its current job. We can safely return.
@@ -299,28 +527,149 @@ class Connection(object):
             try:
                 # Can happen if another consumer was scheduled in between
                 # `while` and `acquire`:
-                if not self._send_queue:
+                for priority, queue in enumerate(queues):
+                    if queue:
+                        break
+                else:
                     # Must `continue` to ensure that `send_queue` is checked
                     # after releasing the lock! (in case another producer is
                     # scheduled before `release`)
                     continue
-                data = self._send_queue.pop(0)
-                self._channel.send(data)
+                self._sending_priority = priority  # before popping, see _may_overtake
+                data = queue.pop(0)
+                if type(data) is list:
+                    self._channel.send(data[0])
+                    for frame in data[1:]:
+                        self._channel.send(frame, compress=False)
+                elif self._channel.fragment_size and len(data) > self._channel.fragment_size and not self._bind_threads:
+                    for _ in self._channel.send_fragments(data):
+                        self._send_overtaking(priority)
+                else:
+                    self._channel.send(data)
             finally:
+                self._sending_priority = None
                 self._sendlock.release()
 
+    def _send_overtaking(self, priority):  # IO
+        """sends the frames queued while a fragmented frame of the given lane is being sent (the
+        sendlock is held) that may overtake it: those of the lanes before it, and small replies.
+        Requests of the same lane keep their order, e.g., a ``HANDLE_DEL`` never overtakes a
+        request that uses the object"""
+        queues = self._send_queues
+        for queue in queues[:priority]:
+            while queue:
+                data = queue.pop(0)
+                if type(data) is list:
+                    self._channel.send(data[0])
+                    for frame in data[1:]:
+                        self._channel.send(frame, compress=False)
+                else:
+                    self._channel.send(data)
+        fragment_size = self._channel.fragment_size
+        for queue in queues[priority:]:
+            i = 0
+            while i < len(queue):
+                data = queue[i]
+                if type(data) is not list and len(data) <= fragment_size and data[0] in _REPLY_MESSAGES:
+                    del queue[i]
+                    self._channel.send(data)
+                else:
+                    i += 1
+
+    def _may_overtake(self, priority):  # IO
+        """whether a message sent in the given lane now is sent after every message sent before"""
+        sending = self._sending_priority
+        return not any(self._send_queues[priority + 1:]) and (sending is None or sending <= priority)
+
+    def _flush_batch(self):  # IO
+        """sends the messages collected by :func:`batch` on the current thread"""
+        messages = getattr(self._batch_local, "messages", None)
+        if not messages:
+            return
+        self._batch_local.messages = []
+        priority, self._batch_local.priority = self._batch_local.priority, consts.PRIORITY_CONTROL
+        if len(messages) == 1:
+            self._send_data(messages[0], priority)
+        else:
+            self._send_data(brine.I1.pack(consts.MSG_BATCH) + brine.dump(tuple(messages)), priority)
+
+    @contextmanager
+    def batch(self):  # IO
+        """A context manager that collects the messages sent by the current thread
+        and sends them as a single frame, either when the block exits or when
+        ``batch_max_messages`` messages have been collected. This saves a frame header
+        and a system call per message, which matters when issuing many asynchronous
+        requests in a tight loop::
+
+            async_getsize = rpyc.async_(conn.modules.os.path.getsize)
+            with conn.batch():
+                results = [async_getsize(fn) for fn in filenames]
+
+        The replies to a batch are coalesced by the other party in the same manner.
+        Waiting for a result inside the block (e.g., a synchronous request) flushes
+        the messages collected so far. Batching is not available with ``bind_threads``,
+        in which case messages are sent immediately.
+        """
+        if self._bind_threads or getattr(self._batch_local, "messages", None) is not None:
+            yield  # thread binding or nested batch
+            return
+        self._batch_local.messages = []
+        self._batch_local.priority = consts.PRIORITY_CONTROL
+        try:
+            yield
+        finally:
+            try:
+                self._flush_batch()
+            finally:
+                self._batch_local.messages = None
+
+    @contextmanager
+    def priority(self, priority):  # IO
+        """A context manager that sets the priority (lane) of the requests sent by the current
+        thread: ``consts.PRIORITY_CONTROL``, ``PRIORITY_INTERACTIVE`` (the default) or
+        ``PRIORITY_BULK``. The queued frames of a lane are sent before those of the lanes after
+        it, so that, e.g., small requests are not delayed by a large transfer on another thread::
+
+            with conn.priority(rpyc.core.consts.PRIORITY_BULK):
+                remote_file.write(data)
+
+        Asynchronous requests of different lanes may thus be handled out of order. Replies are
+        sent in the interactive lane, unless they are large (see ``bulk_reply_size``), and
+        requests that must keep their order (e.g., releasing netrefs) in the bulk lane. With
+        ``bind_threads``, all messages are sent in the interactive lane, since lanes could reorder
+        the messages of a thread.
+        """
+        previous = getattr(self._priority_local, "priority", None)
+        self._priority_local.priority = priority
+        try:
+            yield
+        finally:
+            self._priority_local.priority = previous
+
     def _box(self, obj):  # boxing
         """store a local object in such a way that it could be recreated on
         the remote party either by-value or by-reference"""
-        if brine.dumpable(obj):
+        if brine.dumpable(obj, self._config["by_value_containers"]):
             return consts.LABEL_VALUE, obj
         if type(obj) is tuple:
             return consts.LABEL_TUPLE, tuple(self._box(item) for item in obj)
         elif isinstance(obj, netref.BaseNetref) and obj.____conn__ is self:
             return consts.LABEL_LOCAL_REF, obj.____id_pack__
+        elif type(obj) is AsyncResult and obj._promise_seq is not None and obj._conn is self:
+            return consts.LABEL_PROMISE, obj._promise_seq
         else:
             id_pack = get_id_pack(obj)
             self._local_objects.add(id_pack, obj)
+            if self._inlined_classes is not None and id_pack[0] not in netref.builtin_classes_cache \
+                    and not isinstance(obj, netref.BaseNetref):
+                # the other party caches the netref class of a class by its id_pack, and of its instances
+                # by its name and id (see _netref_factory), so its methods are sent once, and again
+                # whenever they change (get_methods memoizes them until the class changes)
+                key = id_pack if id_pack[2] == 0 else id_pack[:2]
+                methods = get_methods(netref.LOCAL_ATTRS, obj, self._config["inspect_docstrings"])
+                if self._inlined_classes.get(key) != methods:
+                    self._inlined_classes[key] = methods
+                    return consts.LABEL_REMOTE_REF_METHODS, (id_pack, methods)
             return consts.LABEL_REMOTE_REF, id_pack
 
     def _unbox(self, package):  # boxing
@@ -334,35 +683,154 @@ class Connection(object):
             return tuple(self._unbox(item) for item in value)
         if label == consts.LABEL_LOCAL_REF:
             return self._local_objects[value]
+        if label == consts.LABEL_PROMISE:
+            return self._resolve_promise(value)
+        methods = None
+        if label == consts.LABEL_REMOTE_REF_METHODS:
+            value, methods = value
+            label = consts.LABEL_REMOTE_REF
         if label == consts.LABEL_REMOTE_REF:
             id_pack = (str(value[0]), value[1], value[2])  # so value is a id_pack
             proxy = self._proxy_cache.get(id_pack)  # Ensure referents exist until we increment refcount issue #558
             if proxy is not None:
                 proxy.____refcount__ += 1  # if cached then remote incremented refcount, so sync refcount
             else:
-                proxy = self._netref_factory(id_pack)
+                proxy = self._netref_factory(id_pack, methods)
                 self._proxy_cache[id_pack] = proxy
             return proxy
         raise ValueError(f"invalid label {label!r}")
 
-    def _netref_factory(self, id_pack):  # boxing
-        """id_pack is for remote, so when class id fails to directly match """
+    def _resolve_promise(self, seq):  # boxing
+        """the result of the ``MSG_PIPELINE_REQUEST`` of the given seq; if it failed, its
+        exception is raised. The requests that use unresolved promises are held, see
+        :func:`_dispatch_request`"""
+        promise = self._promises.get(seq)
+        if promise is None:
+            raise ValueError(f"unknown promise {seq!r}")
+        if not promise.ready:
+            raise ValueError(f"promise {seq!r} is not resolved")
+        if promise.is_exc:
+            raise promise.obj
+        return promise.obj
+
+    def _pending_promise(self, package):  # boxing
+        """the first unresolved promise in the given boxed object, or ``None``"""
+        label, value = package
+        if label == consts.LABEL_PROMISE:
+            promise = self._promises.get(value)
+            if promise is not None and not promise.ready:
+                return promise
+        elif label == consts.LABEL_TUPLE:
+            for item in value:
+                promise = self._pending_promise(item)
+                if promise is not None:
+                    return promise
+        return None
+
+    def _netref_factory(self, id_pack, methods=None):  # boxing
+        """id_pack is for remote, so when class id fails to directly match; *methods* are
+        the methods of the class, if the other party sent them (see ``inline_methods``)"""
         cls = None
-        if id_pack[2] == 0 and id_pack in self._netref_classes_cache:
+        if methods is not None:
+            pass  # the methods of a new (or changed) class, which replace the cached netref class
+        elif id_pack[2] == 0 and id_pack in self._netref_classes_cache:
             cls = self._netref_classes_cache[id_pack]
         elif id_pack[0] in netref.builtin_classes_cache:
             cls = netref.builtin_classes_cache[id_pack[0]]
+        elif id_pack[2] != 0:
+            # an instance of a class whose methods were sent along with an earlier instance
+            cls = self._netref_classes_cache.get(id_pack[:2])
+        shared_key = None
+        if cls is None and methods is None and id_pack[2] == 0 and self._config["shared_class_cache"]:
+            # only the netref classes of classes are shared; those of instances are created from
+            # the methods of their class, which may have changed since (see get_methods)
+            shared_key = self._shared_class_key(id_pack)
+            if shared_key is not None:
+                cls = netref.shared_classes_cache.get(shared_key)
+                if cls is not None:
+                    self._netref_classes_cache[id_pack] = cls
         if cls is None:
-            # in the future, it could see if a sys.module cache/lookup hits first
-            cls_methods = self.sync_request(consts.HANDLE_INSPECT, id_pack)
+            if methods is None:
+                # in the future, it could see if a sys.module cache/lookup hits first
+                cls_methods = self.sync_request(consts.HANDLE_INSPECT, id_pack)
+            else:
+                cls_methods = methods
             cls = netref.class_factory(id_pack, cls_methods)
             if id_pack[2] == 0:
                 # only use cached netrefs for classes
                 # ... instance caching after gc of a proxy will take some mental gymnastics
                 self._netref_classes_cache[id_pack] = cls
+            elif methods is not None:
+                # the other party sends the methods of a class for the first of its instances, and
+                # again once the class changes
+                self._netref_classes_cache[id_pack[:2]] = cls
+            if shared_key is not None:
+                netref.shared_classes_cache[shared_key] = cls
         return cls(self, id_pack)
 
-    def _dispatch_request(self, seq, raw_args):  # dispatch
+    def _shared_class_key(self, id_pack):  # boxing
+        """the key of the netref class of the given id_pack (of a class) in ``netref.shared_classes_cache``,
+        or ``None`` if the other party does not identify itself"""
+        if self._peer_token is None:
+            try:
+                self._peer_token = self.sync_request(consts.HANDLE_PEER_TOKEN)
+            except Exception:
+                self._peer_token = False  # e.g., an older version
+        if not self._peer_token:
+            return None
+        return (self._peer_token,) + id_pack
+
+    def _release_netref(self, proxy):  # boxing
+        """called by the destructor of a netref to release the remote object"""
+        if self._config["del_batch_size"] <= 0:
+            self.async_request(consts.HANDLE_DEL, proxy, proxy.____refcount__)
+        elif not self._closed:
+            # deque.append is atomic, so it is safe even when the GC runs in the middle of a send
+            self._pending_releases.append((proxy.____id_pack__, proxy.____refcount__))
+            if len(self._pending_releases) >= self._config["del_batch_size"]:
+                self._flush_releases()
+
+    def _flush_releases(self):  # boxing
+        releases = []
+        try:
+            while True:
+                releases.append(self._pending_releases.popleft())
+        except IndexError:
+            pass
+        if releases:
+            self._async_request(consts.HANDLE_DEL_MANY, (tuple(releases),))
+
+    def _dispatch_request(self, seq, raw_args, promise=None):  # dispatch
+        held = self._dispatch_one(seq, raw_args, promise)
+        if not held:
+            return
+        # the requests held for the resolved promise may resolve promises of their own; they are
+        # dispatched in a loop rather than recursively, so that a long chain of promises does not
+        # exhaust the stack. The held requests are dispatched inline (rather than on the executor
+        # of an AsyncioConnection), so that the promises they use are not removed before they are unboxed
+        work = collections.deque(held)
+        while work:
+            seq, raw_args, promise = work.popleft()
+            try:
+                held = self._dispatch_one(seq, raw_args, promise)
+            finally:
+                self._release_held()
+            if held:
+                work.extend(held)
+
+    def _dispatch_one(self, seq, raw_args, promise):  # dispatch
+        """dispatches a single request; returns the requests held for its promise, if any"""
+        if self._promises:
+            # a request that uses an unresolved promise (e.g., whose request waits for a nested
+            # reply) is held until the promise is resolved, and is checked before it is unboxed,
+            # since unboxing has side effects (netref refcounts)
+            pending = self._pending_promise(raw_args[1])
+            if pending is not None:
+                with self._promises_lock:
+                    self._held_requests += 1
+                if pending.hold((seq, raw_args, promise)):
+                    return None
+                self._release_held()  # resolved meanwhile
         try:
             handler, args = raw_args
             args = self._unbox(args)
@@ -379,8 +847,55 @@ class Connection(object):
             if t is KeyboardInterrupt and self._config["propagate_KeyboardInterrupt_locally"]:
                 raise
             self._send(consts.MSG_EXCEPTION, seq, self._box_exc(t, v, tb))
+            if promise is not None:
+                return promise(True, v)  # the requests held for it are dispatched after the reply is sent
         else:
-            self._send(consts.MSG_REPLY, seq, self._box(res))
+            if type(res) is _OutOfBandPickle:
+                self._send_out_of_band(seq, res)
+            elif handler == consts.HANDLE_PING:
+                self._send(consts.MSG_REPLY, seq, self._box(res), consts.PRIORITY_CONTROL)
+            else:
+                self._send(consts.MSG_REPLY, seq, self._box(res))
+            if promise is not None:
+                return promise(False, res)
+        return None
+
+    def _release_held(self):  # dispatch
+        with self._promises_lock:
+            self._held_requests -= 1
+            if self._held_requests:
+                return
+            released, self._released_promises = self._released_promises, []
+        for seq in released:
+            self._promises.pop(seq, None)
+
+    def _send_out_of_band(self, seq, pickled):  # IO
+        """sends the pickle data in a ``MSG_REPLY_OOB`` frame, followed by its buffers
+        in raw (uncompressed) frames of up to ``OOB_CHUNK`` bytes"""
+        views = []
+        for buf in pickled.buffers:
+            try:
+                views.append(buf.raw())
+            except BufferError:  # not contiguous
+                views.append(memoryview(memoryview(buf).tobytes()))
+        header = brine.dump((seq, (pickled.data, tuple(view.nbytes for view in views))))
+        frames = [brine.I1.pack(consts.MSG_REPLY_OOB) + header]
+        for view in views:
+            frames.extend(view[i:i + consts.OOB_CHUNK] for i in range(0, view.nbytes, consts.OOB_CHUNK))
+        self._send_data(frames, consts.PRIORITY_BULK if self._config["bulk_reply_size"] is not None
+                        else consts.PRIORITY_INTERACTIVE)
+
+    def _recv_out_of_band(self, size):  # serving
+        """receives a buffer of the given size, sent by :func:`_send_out_of_band`, with its frames
+        read directly into it. The size is the other party's claim, so at most ``OOB_PREALLOC``
+        bytes are allocated upfront; a larger buffer grows as its frames arrive"""
+        buf = bytearray(min(size, consts.OOB_PREALLOC))
+        pos = 0
+        while pos < size:
+            if len(buf) - pos < consts.OOB_CHUNK and len(buf) < size:
+                buf += bytes(min(size, max(2 * len(buf), pos + consts.OOB_CHUNK)) - len(buf))
+            pos += self._channel.recv_into(memoryview(buf)[pos:])
+        return buf
 
     def _box_exc(self, typ, val, tb):  # dispatch?
         return vinegar.dump(typ, val, tb,
@@ -402,6 +917,8 @@ class Connection(object):
             self._config["logger"].debug(debug_msg.format(msg, seq))
 
     def _dispatch(self, data):  # serving---dispatch?
+        if self._stats is not None:
+            self._stats.record_received(len(data))
         msg, = brine.I1.unpack(data[:1])  # unpack just msg to minimize time to release
         if msg == consts.MSG_REQUEST:
             if self._bind_threads:
@@ -410,6 +927,17 @@ class Connection(object):
                 self._recvlock.release()
             seq, args = brine.load(data[1:])
             self._dispatch_request(seq, args)
+        elif msg == consts.MSG_PIPELINE_REQUEST:
+            seq, args = brine.load(data[1:])
+            # registered before another thread can receive a request that uses it
+            promise = self._promises[seq] = _Promise()
+            if self._bind_threads:
+                self._get_thread()._occupation_count += 1
+            else:
+                self._recvlock.release()
+            self._dispatch_request(seq, args, promise)
+        elif msg == consts.MSG_BATCH:
+            self._dispatch_batch(brine.load(data[1:]))
         else:
             if self._bind_threads:
                 this_thread = self._get_thread()
@@ -422,6 +950,12 @@ class Connection(object):
                 self._seq_request_callback(msg, seq, False, obj)
                 if not self._bind_threads:
                     self._recvlock.release()  # releasing here fixes race condition with AsyncResult.wait
+            elif msg == consts.MSG_REPLY_OOB:
+                seq, (payload, sizes) = brine.load(data[1:])
+                buffers = tuple(self._recv_out_of_band(size) for size in sizes)
+                self._seq_request_callback(msg, seq, False, (payload, buffers))
+                if not self._bind_threads:
+                    self._recvlock.release()
             elif msg == consts.MSG_EXCEPTION:
                 if not self._bind_threads:
                     self._recvlock.release()
@@ -431,6 +965,32 @@ class Connection(object):
             else:
                 raise ValueError(f"invalid message type: {msg!r}")
 
+    def _dispatch_batch(self, messages):  # serving---dispatch?
+        # replies are handled while the recvlock is held, like in _dispatch, and requests after
+        # it is released; the replies to the requests of a batch are sent as a batch as well
+        requests = []
+        try:
+            for data in messages:
+                msg, = brine.I1.unpack(data[:1])
+                seq, args = brine.load(data[1:])
+                if msg == consts.MSG_REQUEST:
+                    requests.append((seq, args, None))
+                elif msg == consts.MSG_PIPELINE_REQUEST:
+                    promise = self._promises[seq] = _Promise()
+                    requests.append((seq, args, promise))
+                elif msg == consts.MSG_REPLY:
+                    self._seq_request_callback(msg, seq, False, self._unbox(args))
+                elif msg == consts.MSG_EXCEPTION:
+                    self._seq_request_callback(msg, seq, True, self._unbox_exc(args))
+                else:
+                    raise ValueError(f"invalid message type in batch: {msg!r}")
+        finally:
+            self._recvlock.release()
+        if requests:
+            with self.batch():
+                for seq, args, promise in requests:
+                    self._dispatch_request(seq, args, promise)
+
     def serve(self, timeout=1, wait_for_lock=True, waiting=lambda: True):  # serving
         """Serves a single request or reply that arrives within the given
         time frame (default is 1 sec). Note that the dispatching of a request
@@ -440,8 +1000,11 @@ class Connection(object):
         :returns: ``True`` if a request or reply were received, ``False`` otherwise.
         """
         timeout = Timeout(timeout)
+        if self._pending_releases:
+            self._flush_releases()
         if self._bind_threads:
             return self._serve_bound(timeout, wait_for_lock)
+        self._flush_batch()  # whoever waits for a reply must not hold back the request
         with self._recv_event:
             # Exit early if we cannot acquire the recvlock
             if not self._recvlock.acquire(False):
@@ -731,45 +1294,83 @@ class Connection(object):
             pass
         return at_least_once
 
-    def sync_request(self, handler, *args):
+    def sync_request(self, handler, *args, priority=None):
         """requests, sends a synchronous request (waits for the reply to arrive)
 
+        :param priority: the lane of the request (see :func:`priority`)
+
         :raises: any exception that the requests may be generated
         :returns: the result of the request
         """
         timeout = self._config["sync_request_timeout"]
-        _async_res = self.async_request(handler, *args, timeout=timeout)
+        _async_res = self.async_request(handler, *args, timeout=timeout, priority=priority)
         # _async_res is an instance of AsyncResult, the value property invokes Connection.serve via AsyncResult.wait
         # So, the _recvlock can be acquired multiple times by the owning thread and warrants the use of RLock
         return _async_res.value
 
-    def _async_request(self, handler, args=(), callback=(lambda a, b: None)):  # serving
+    def _request_priority(self, handler, priority):  # serving
+        if handler in _IN_ORDER_HANDLERS:
+            return consts.PRIORITY_BULK
+        if priority is None:
+            priority = getattr(self._priority_local, "priority", None)
+            if priority is None:
+                return consts.PRIORITY_CONTROL if handler == consts.HANDLE_PING else consts.PRIORITY_INTERACTIVE
+        return priority
+
+    def _async_request(self, handler, args=(), callback=(lambda a, b: None), priority=None,
+                       msg=consts.MSG_REQUEST):  # serving
         seq = self._get_seq_id()
         self._request_callbacks[seq] = callback
+        priority = self._request_priority(handler, priority)
         try:
-            self._send(consts.MSG_REQUEST, seq, (handler, self._box(args)))
+            if self._pending_releases and self._may_overtake(priority):
+                # piggyback the pending releases on the frame of this request, unless they could
+                # overtake the requests that use the released objects
+                with self.batch():
+                    self._flush_releases()
+                    self._send(msg, seq, (handler, self._box(args)), priority)
+            else:
+                self._send(msg, seq, (handler, self._box(args)), priority)
         except Exception:
             # TODO: review test_remote_exception, logging exceptions show attempt to write on closed stream
             # depending on the case, the MSG_REQUEST may or may not have been sent completely
             # so, pop the callback and raise to keep response integrity is consistent
             self._request_callbacks.pop(seq, None)
             raise
+        return seq
 
     def async_request(self, handler, *args, **kwargs):  # serving
         """Send an asynchronous request (does not wait for it to finish)
 
+        :param priority: the lane of the request (see :func:`priority`)
+        :param pipeline: whether the result is a promise, which can be passed to further
+                         requests (see ``promise_pipelining``); ignored with ``bind_threads``
+
         :returns: an :class:`rpyc.core.async_.AsyncResult` object, which will
                   eventually hold the result (or exception)
         """
         timeout = kwargs.pop("timeout", None)
+        priority = kwargs.pop("priority", None)
+        pipeline = kwargs.pop("pipeline", False)
         if kwargs:
             raise TypeError("got unexpected keyword argument(s) {list(kwargs.keys()}")
         res = AsyncResult(self)
-        self._async_request(handler, args, res)
+        if pipeline and not self._bind_threads:
+            seq = self._async_request(handler, args, res, priority, consts.MSG_PIPELINE_REQUEST)
+            # the other party keeps the result until the AsyncResult is collected
+            res._promise_seq = seq
+            weakref.finalize(res, _release_promise, weakref.ref(self), seq)
+        else:
+            self._async_request(handler, args, res, priority)
         if timeout is not None:
             res.set_expiry(timeout)
         return res
 
+    async def _await_result(self, res):  # serving
+        # awaiting an AsyncResult (see AsyncResult.__await__): the connection is served by a worker
+        # thread so that the event loop is not blocked
+        await asyncio.get_running_loop().run_in_executor(None, res.wait)
+
     @property
     def root(self):  # serving
         """Fetches the root object (service) of the other party"""
@@ -806,6 +1407,57 @@ class Connection(object):
             name = self._check_attr(obj, name, param)
         return accessor(obj, name, *args)
 
+    def _getattr_request(self, proxy, name):  # attribute access
+        """gets an attribute of a netref, using the attribute cache when it is enabled"""
+        cache = self._attr_cache
+        if cache is None:
+            return self.sync_request(consts.HANDLE_GETATTR, proxy, name)
+        id_pack = proxy.____id_pack__
+        entry = cache.get(id_pack)
+        if entry is not None:
+            cached = entry[1].get(name)
+            if cached is not None and (cached[1] is None or cached[1] > time.monotonic()):
+                return cached[0]
+        value = self.sync_request(consts.HANDLE_GETATTR, proxy, name)
+        if self._is_attr_cacheable(id_pack, value):
+            if entry is None:
+                # the entry lives as long as the proxy does, since the remote id may be reused afterwards
+                def remover(wr, cache=cache, id_pack=id_pack):
+                    if cache.get(id_pack, (None,))[0] is wr:
+                        del cache[id_pack]
+                entry = cache[id_pack] = (weakref.ref(proxy, remover), {})
+            ttl = self._config["netref_attr_cache_ttl"]
+            entry[1][name] = (value, None if ttl is None else time.monotonic() + ttl)
+        return value
+
+    def _is_attr_cacheable(self, id_pack, value):  # attribute access
+        if id_pack[0] in self._config["netref_attr_cache_modules"]:
+            return True
+        if isinstance(value, netref.BaseNetref):
+            return value.____id_pack__[0] in self._config["netref_attr_cache_types"]
+        return False
+
+    def invalidate_attr_cache(self, proxy=None, name=None):  # attribute access
+        """Invalidates the cached attributes of netrefs (see ``netref_attr_cache``).
+        Setting or deleting an attribute through a netref invalidates it automatically.
+
+        :param proxy: the netref whose attributes to invalidate, or ``None`` for all netrefs
+        :param name: the attribute to invalidate, or ``None`` for all attributes of *proxy*
+        """
+        cache = self._attr_cache
+        if cache is None:
+            return
+        if proxy is None:
+            cache.clear()
+            return
+        entry = cache.get(proxy.____id_pack__)
+        if entry is None:
+            return
+        if name is None:
+            entry[1].clear()
+        else:
+            entry[1].pop(name, None)
+
     @classmethod
     def _request_handlers(cls):  # request handlers
         return {
@@ -817,6 +1469,7 @@ class Connection(object):
             consts.HANDLE_SETATTR: cls._handle_setattr,
             consts.HANDLE_CALL: cls._handle_call,
             consts.HANDLE_CALLATTR: cls._handle_callattr,
+            consts.HANDLE_CALLPATH: cls._handle_callpath,
             consts.HANDLE_REPR: cls._handle_repr,
             consts.HANDLE_STR: cls._handle_str,
             consts.HANDLE_CMP: cls._handle_cmp,
@@ -825,7 +1478,10 @@ class Connection(object):
             consts.HANDLE_DIR: cls._handle_dir,
             consts.HANDLE_PICKLE: cls._handle_pickle,
             consts.HANDLE_DEL: cls._handle_del,
+            consts.HANDLE_DEL_MANY: cls._handle_del_many,
             consts.HANDLE_INSPECT: cls._handle_inspect,
+            consts.HANDLE_PEER_TOKEN: cls._handle_peer_token,
+            consts.HANDLE_DEL_PROMISE: cls._handle_del_promise,
             consts.HANDLE_BUFFITER: cls._handle_buffiter,
             consts.HANDLE_OLDSLICING: cls._handle_oldslicing,
             consts.HANDLE_CTXEXIT: cls._handle_ctxexit,
@@ -843,6 +1499,9 @@ class Connection(object):
     def _handle_del(self, obj, count=1):  # request handler
         self._local_objects.decref(get_id_pack(obj), count)
 
+    def _handle_del_many(self, releases):  # request handler
+        self._local_objects.decref_many(releases)
+
     def _handle_repr(self, obj):  # request handler
         return repr(obj)
 
@@ -865,6 +1524,17 @@ class Connection(object):
     def _handle_dir(self, obj):  # request handler
         return tuple(dir(obj))
 
+    def _handle_del_promise(self, seq):  # request handler
+        with self._promises_lock:
+            if self._held_requests:
+                self._released_promises.append(seq)  # a held request may use it, see _release_held
+                return
+        self._promises.pop(seq, None)
+
+    def _handle_peer_token(self):  # request handler
+        # the ids of classes are unique within a process (and its children, after a fork, have other pids)
+        return f"{_process_token}:{os.getpid()}"
+
     def _handle_inspect(self, id_pack):  # request handler
         if hasattr(self._local_objects[id_pack], '____conn__'):
             # When RPyC is chained (RPyC over RPyC), id_pack is cached in local objects as a netref
@@ -873,7 +1543,7 @@ class Connection(object):
             conn = self._local_objects[id_pack].____conn__
             return conn.sync_request(consts.HANDLE_INSPECT, id_pack)
         else:
-            return tuple(get_methods(netref.LOCAL_ATTRS, self._local_objects[id_pack]))
+            return get_methods(netref.LOCAL_ATTRS, self._local_objects[id_pack], self._config["inspect_docstrings"])
 
     def _handle_getattr(self, obj, name):  # request handler
         return self._access_attr(obj, name, (), "_rpyc_getattr", "allow_getattr", getattr)
@@ -888,6 +1558,11 @@ class Connection(object):
         obj = self._handle_getattr(obj, name)
         return self._handle_call(obj, args, kwargs)
 
+    def _handle_callpath(self, obj, names, args, kwargs=()):  # request handler
+        for name in names:
+            obj = self._handle_getattr(obj, name)
+        return self._handle_call(obj, args, kwargs)
+
     def _handle_ctxexit(self, obj, exc):  # request handler
         if exc:
             try:
@@ -921,9 +1596,15 @@ class Connection(object):
             return False
         return isinstance(other, obj)
 
-    def _handle_pickle(self, obj, proto):  # request handler
+    def _handle_pickle(self, obj, proto, out_of_band=False):  # request handler
         if not self._config["allow_pickle"]:
             raise ValueError("pickling is disabled")
+        if out_of_band and not self._bind_threads and (proto < 0 or proto >= 5):
+            buffers = []
+            data = pickle.dumps(obj, proto, buffer_callback=buffers.append)
+            if buffers:
+                return _OutOfBandPickle(data, buffers)
+            return data
         return bytes(pickle.dumps(obj, proto))
 
     def _handle_buffiter(self, obj, count):  # request handler
@@ -942,6 +1623,145 @@ class Connection(object):
             return getslice(start, stop, *args)
 
 
+class AsyncioConnection(Connection):
+    """A connection that is served by an :mod:`asyncio` event loop: incoming data is received
+    when the loop reports the socket as readable, and requests and replies are dispatched by
+    the loop, so no thread has to call :func:`serve`. Awaiting an
+    :class:`~rpyc.core.async_.AsyncResult` (e.g., ``await rpyc.async_(proxy.func)(...)``)
+    suspends the awaiting coroutine, rather than blocking the loop.
+
+    Synchronous operations (e.g., accessing an attribute of a netref) are still possible, but
+    they block the loop until the reply arrives, so they are best kept out of hot paths.
+    Incoming requests are handled in the loop thread, unless an *executor* is given; other
+    threads that wait for replies let the loop receive them.
+
+    :param root: the :class:`~rpyc.core.service.Service` object to expose
+    :param channel: a :class:`~rpyc.core.channel.Channel` over an
+                    :class:`~rpyc.core.stream.AsyncioSocketStream`
+    :param config: the connection's configuration dict
+    :param loop: the event loop to use (defaults to the running loop)
+    :param executor: a :class:`concurrent.futures.Executor` on which incoming requests are
+                     handled, or ``None`` to handle them inline, in the loop thread
+    """
+
+    def __init__(self, root, channel, config={}, loop=None, executor=None):
+        self._closed = True  # until Connection.__init__, so that __del__ does not close it
+        if config.get("bind_threads", DEFAULT_CONFIG["bind_threads"]):
+            raise ValueError("AsyncioConnection does not support bind_threads")
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._executor = executor
+        self._closed_event = asyncio.Event()
+        self._fileno = channel.fileno()
+        Connection.__init__(self, root, channel, config)
+        self._loop.add_reader(self._fileno, self._on_readable)
+
+    def _cleanup(self, _anyway=True):  # IO
+        if self._closed and not _anyway:
+            return
+        self._call_in_loop(self._loop.remove_reader, self._fileno)
+        Connection._cleanup(self, _anyway)
+        self._call_in_loop(self._closed_event.set)
+        with self._recv_event:
+            self._recv_event.notify_all()  # wake up the threads that wait in serve()
+
+    def _call_in_loop(self, func, *args):
+        if self._in_loop():
+            func(*args)
+            return
+        try:
+            self._loop.call_soon_threadsafe(func, *args)
+        except RuntimeError:
+            pass  # the loop is closed
+
+    def _in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _dispatch_request(self, seq, raw_args, promise=None):  # dispatch
+        if self._executor is None:
+            Connection._dispatch_request(self, seq, raw_args, promise)
+        else:
+            self._executor.submit(Connection._dispatch_request, self, seq, raw_args, promise)
+
+    def serve(self, timeout=1, wait_for_lock=True, waiting=lambda: True):  # serving
+        if self._in_loop() or not self._loop.is_running():
+            return Connection.serve(self, timeout, wait_for_lock, waiting)
+        # the loop receives and dispatches the incoming data; wait until it did
+        if self._closed:
+            raise EOFError("connection closed")
+        timeout = Timeout(timeout)
+        if self._pending_releases:
+            self._flush_releases()
+        self._flush_batch()
+        with self._recv_event:
+            if not waiting():
+                return False
+            return self._recv_event.wait(timeout.timeleft())
+
+    def _on_readable(self):  # serving
+        if self._closed:
+            return
+        if not self._recvlock.acquire(False):
+            return  # another thread is receiving from the stream
+        try:
+            self._channel.stream.feed()
+        except EOFError:
+            self._recvlock.release()
+            self.close()
+            return
+        except Exception:
+            self._recvlock.release()
+            raise
+        self._recvlock.release()
+        self._dispatch_buffered()
+
+    def _dispatch_buffered(self):  # serving
+        channel = self._channel
+        stream = channel.stream
+        header_size = channel.FRAME_HEADER.size
+        while not self._closed and stream.buffered >= header_size:
+            if stream.buffered < channel.frame_size(stream.peek(header_size)):
+                break  # the rest of the frame has not arrived yet
+            if not self._recvlock.acquire(False):
+                break
+            try:
+                data = channel.recv_frame()
+            except Exception:
+                self._recvlock.release()
+                raise
+            if data is None:  # a fragment of a frame that is still being reassembled
+                self._recvlock.release()
+                continue
+            try:
+                self._dispatch(data)
+            except EOFError:
+                self.close()  # e.g., the reply to HANDLE_CLOSE
+                return
+            finally:
+                with self._recv_event:
+                    self._recv_event.notify_all()
+
+    async def _await_result(self, res):  # serving
+        future = self._loop.create_future()
+
+        def resolve(_):
+            if not future.done():
+                future.set_result(None)
+        res.add_callback(lambda _: self._call_in_loop(resolve, None))
+        try:
+            await asyncio.wait_for(future, res._ttl.timeleft())
+        except asyncio.TimeoutError:
+            pass  # AsyncResult raises AsyncResultTimeout
+
+    async def wait_closed(self):
+        """Waits until the connection is closed (by either party)"""
+        await self._closed_event.wait()
+
+
 class _Thread:
     """Internal thread information for the RPYC protocol used for thread binding."""
 
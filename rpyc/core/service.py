@@ -95,14 +95,17 @@ class Service(object):
     exposed_get_service_name = get_service_name
 
     @hybridmethod
-    def _connect(self, channel, config={}):
-        """Setup a connection via the given channel."""
+    def _connect(self, channel, config={}, protocol=None):
+        """Setup a connection via the given channel. *protocol* overrides the
+        connection class (``_protocol``)."""
         if isinstance(self, type):  # autovivify if accessed as class method
             self = self()
         # Note that we are here passing in `self` as root object for backward
         # compatibility and convenience. You could pass in a different root if
         # you wanted:
-        conn = self._protocol(self, channel, config)
+        if protocol is None:
+            protocol = self._protocol
+        conn = protocol(self, channel, config)
         self.on_connect(conn)
         return conn
 
@@ -0,0 +1,135 @@
+"""Optional instrumentation of connections (see the ``collect_stats`` configuration
+parameter): request counters and latency histograms per handler, and the number of
+bytes and messages moved by each connection. :func:`Connection.stats
+<rpyc.core.protocol.Connection.stats>` returns a snapshot, and :func:`merge` aggregates
+the snapshots of many connections (e.g., :func:`Server.stats <rpyc.utils.server.Server.stats>`).
+"""
+import bisect
+import threading
+from time import perf_counter
+from rpyc.core import consts
+
+
+# the upper bounds (in seconds) of the latency histogram buckets; the last bucket is unbounded
+BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2,
+           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+HANDLER_NAMES = dict((v, k[len("HANDLE_"):].lower()) for k, v in vars(consts).items() if k.startswith("HANDLE_"))
+
+
+class HandlerStats(object):
+    """The number of requests a handler served, the failures among them, and a histogram
+    of their latencies"""
+    __slots__ = ["count", "errors", "total_time", "max_time", "buckets"]
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def record(self, duration, failed):
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.buckets[bisect.bisect_left(BUCKETS, duration)] += 1
+
+    def snapshot(self):
+        return dict(count=self.count, errors=self.errors, total_time=self.total_time,
+                    max_time=self.max_time, buckets=list(self.buckets))
+
+
+class ConnectionStats(object):
+    """Collects the statistics of a single connection (thread safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.handlers = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.max_send_queue = 0
+
+    def record_request(self, handler, duration, failed):
+        with self._lock:
+            stats = self.handlers.get(handler)
+            if stats is None:
+                stats = self.handlers[handler] = HandlerStats()
+            stats.record(duration, failed)
+
+    def record_sent(self, size, queue_depth):
+        with self._lock:
+            self.bytes_sent += size
+            self.messages_sent += 1
+            if queue_depth > self.max_send_queue:
+                self.max_send_queue = queue_depth
+
+    def record_received(self, size):
+        with self._lock:
+            self.bytes_received += size
+            self.messages_received += 1
+
+    def timed(self, handler, func):
+        """wraps the given request handler, so that its calls are recorded"""
+        def timed_handler(conn, *args):
+            start = perf_counter()
+            try:
+                res = func(conn, *args)
+            except BaseException:
+                self.record_request(handler, perf_counter() - start, True)
+                raise
+            self.record_request(handler, perf_counter() - start, False)
+            return res
+        return timed_handler
+
+    def snapshot(self):
+        with self._lock:
+            return dict(
+                bytes_sent=self.bytes_sent,
+                bytes_received=self.bytes_received,
+                messages_sent=self.messages_sent,
+                messages_received=self.messages_received,
+                max_send_queue=self.max_send_queue,
+                handlers=dict((HANDLER_NAMES.get(handler, handler), stats.snapshot())
+                              for handler, stats in self.handlers.items()),
+            )
+
+
+def percentile(handler_stats, fraction):
+    """Estimates a percentile of the latencies in a handler snapshot: returns the upper bound
+    of the bucket that holds it (e.g., ``percentile(stats["handlers"]["call"], 0.99)``)"""
+    target = handler_stats["count"] * fraction
+    seen = 0
+    for bound, count in zip(BUCKETS, handler_stats["buckets"]):
+        seen += count
+        if count and seen >= target:
+            return min(bound, handler_stats["max_time"])
+    return 0.0
+
+
+def merge(snapshots):
+    """Aggregates the snapshots of several connections into one: counters are summed and
+    histograms merged; the maxima are the maxima of all snapshots"""
+    total = dict(connections=0, bytes_sent=0, bytes_received=0, messages_sent=0, messages_received=0,
+                 max_send_queue=0, send_queue=0, local_objects=0, proxies=0, handlers={})
+    for snap in snapshots:
+        total["connections"] += 1
+        for key in ("bytes_sent", "bytes_received", "messages_sent", "messages_received",
+                    "send_queue", "local_objects", "proxies"):
+            total[key] += snap.get(key, 0)
+        total["max_send_queue"] = max(total["max_send_queue"], snap.get("max_send_queue", 0))
+        for name, stats in snap.get("handlers", {}).items():
+            agg = total["handlers"].get(name)
+            if agg is None:
+                total["handlers"][name] = dict(stats, buckets=list(stats["buckets"]))
+                continue
+            agg["count"] += stats["count"]
+            agg["errors"] += stats["errors"]
+            agg["total_time"] += stats["total_time"]
+            agg["max_time"] = max(agg["max_time"], stats["max_time"])
+            agg["buckets"] = [a + b for a, b in zip(agg["buckets"], stats["buckets"])]
+    return total
@@ -4,8 +4,10 @@ consistent view of a *duplex byte stream*.
 """
 import sys
 import os
+import platform
 import socket
 import errno
+import threading
 from rpyc.lib import safe_import, Timeout, socket_backoff_connect
 from rpyc.lib.compat import poll, select_error, BYTES_LITERAL, get_exc_errno, maxint  # noqa: F401
 from rpyc.core.consts import STREAM_CHUNK
@@ -18,6 +20,17 @@ ssl = safe_import("ssl")
 retry_errnos = (errno.EAGAIN, errno.EWOULDBLOCK)
 
 
+def _consume(views, count):
+    """drops the first *count* bytes from a list of memoryviews (after a partial vectored write)"""
+    while count:
+        size = len(views[0])
+        if count < size:
+            views[0] = views[0][count:]
+            break
+        del views[0]
+        count -= size
+
+
 class Stream(object):
     """Base Stream"""
 
@@ -72,6 +85,14 @@ class Stream(object):
         """
         raise NotImplementedError()
 
+    def read_into(self, view):
+        """reads **exactly** ``len(view)`` bytes into the given writable memoryview, or raise
+        EOFError; streams that receive directly into it avoid copying the data
+
+        :param view: a writable memoryview of bytes
+        """
+        view[:] = self.read(len(view))
+
     def write(self, data):
         """writes the entire *data*, or raise EOFError
 
@@ -79,6 +100,14 @@ class Stream(object):
         """
         raise NotImplementedError()
 
+    def writev(self, buffers):
+        """writes the given sequence of buffers, in order, as if their concatenation was
+        written; streams that support vectored I/O avoid concatenating them
+
+        :param buffers: a sequence of bytes-like objects
+        """
+        self.write(BYTES_LITERAL("").join(buffers))
+
     def __enter__(self):
         return self
 
@@ -262,10 +291,17 @@ class SocketStream(Stream):
                 raise
 
     def read(self, count):
-        data = []
-        while count > 0:
+        data = bytearray(count)
+        self.read_into(memoryview(data))
+        return data
+
+    def read_into(self, view):
+        # receives directly into the given memoryview (no intermediate chunks)
+        pos = 0
+        count = len(view)
+        while pos < count:
             try:
-                buf = self.sock.recv(min(self.MAX_IO_CHUNK, count))
+                received = self.sock.recv_into(view[pos:])
             except socket.timeout:
                 continue
             except socket.error:
@@ -275,14 +311,13 @@ class SocketStream(Stream):
                     continue
                 self.close()
                 raise EOFError(ex)
-            if not buf:
+            if not received:
                 self.close()
                 raise EOFError("connection closed by peer")
-            data.append(buf)
-            count -= len(buf)
-        return BYTES_LITERAL("").join(data)
+            pos += received
 
     def write(self, data):
+        data = memoryview(data)
         try:
             while data:
                 count = self.sock.send(data[:self.MAX_IO_CHUNK])
@@ -292,6 +327,90 @@ class SocketStream(Stream):
             self.close()
             raise EOFError(ex)
 
+    def writev(self, buffers):
+        if not hasattr(self.sock, "sendmsg") or (ssl and isinstance(self.sock, ssl.SSLSocket)):
+            return Stream.writev(self, buffers)  # SSL sockets do not support sendmsg
+        views = [memoryview(buf) for buf in buffers if len(buf)]
+        try:
+            while views:
+                _consume(views, self.sock.sendmsg(views))
+        except socket.error:
+            ex = sys.exc_info()[1]
+            self.close()
+            raise EOFError(ex)
+
+
+class AsyncioSocketStream(SocketStream):
+    """A socket stream whose incoming data is received into a buffer by an :mod:`asyncio`
+    event loop, whenever the loop reports the socket as readable (see
+    :class:`~rpyc.core.protocol.AsyncioConnection`). Blocking reads remain possible; they
+    consume the buffered data before reading from the socket."""
+
+    __slots__ = ("_rbuf",)
+
+    def __init__(self, sock):
+        SocketStream.__init__(self, sock)
+        self._rbuf = bytearray()
+
+    @property
+    def buffered(self):
+        """the number of received bytes that were not read yet"""
+        return len(self._rbuf)
+
+    def peek(self, count):
+        """returns up to *count* buffered bytes, without consuming them"""
+        return bytes(self._rbuf[:count])
+
+    def feed(self):
+        """receives the data that is available on the (readable) socket into the buffer
+
+        :returns: the number of bytes received
+        """
+        count = 0
+        while True:
+            try:
+                buf = self.sock.recv(self.MAX_IO_CHUNK)
+            except socket.error:
+                ex = sys.exc_info()[1]
+                if get_exc_errno(ex) in retry_errnos:
+                    return count
+                self.close()
+                raise EOFError(ex)
+            if not buf:
+                self.close()
+                raise EOFError("connection closed by peer")
+            self._rbuf += buf
+            count += len(buf)
+            # an SSL socket may have decrypted data pending although the socket itself is not readable
+            pending = getattr(self.sock, "pending", None)
+            if pending is None or not pending():
+                return count
+
+    def poll(self, timeout):
+        if self._rbuf:
+            return True
+        return SocketStream.poll(self, timeout)
+
+    def read(self, count):
+        buffered = len(self._rbuf)
+        if buffered >= count:
+            data = self._rbuf[:count]
+            del self._rbuf[:count]
+            return data
+        data = bytearray(count)
+        data[:buffered] = self._rbuf
+        del self._rbuf[:]
+        SocketStream.read_into(self, memoryview(data)[buffered:])
+        return data
+
+    def read_into(self, view):
+        buffered = min(len(self._rbuf), len(view))
+        if buffered:
+            view[:buffered] = self._rbuf[:buffered]
+            del self._rbuf[:buffered]
+        if buffered < len(view):
+            SocketStream.read_into(self, view[buffered:])
+
 
 class TunneledSocketStream(SocketStream):
     """A socket stream over an SSH tunnel (terminates the tunnel when the connection closes)"""
@@ -358,14 +477,24 @@ class PipeStream(Stream):
         return self.incoming.fileno()
 
     def read(self, count):
-        data = []
+        data = bytearray(count)
+        self.read_into(memoryview(data))
+        return data
+
+    def read_into(self, view):
+        count = len(view)
+        pos = 0
         try:
-            while count > 0:
-                buf = os.read(self.incoming.fileno(), min(self.MAX_IO_CHUNK, count))
-                if not buf:
+            while pos < count:
+                if hasattr(os, "readv"):
+                    received = os.readv(self.incoming.fileno(), [view[pos:]])
+                else:
+                    buf = os.read(self.incoming.fileno(), min(self.MAX_IO_CHUNK, count - pos))
+                    received = len(buf)
+                    view[pos:pos + received] = buf
+                if not received:
                     raise EOFError("connection closed by peer")
-                data.append(buf)
-                count -= len(buf)
+                pos += received
         except EOFError:
             self.close()
             raise
@@ -373,9 +502,9 @@ class PipeStream(Stream):
             ex = sys.exc_info()[1]
             self.close()
             raise EOFError(ex)
-        return BYTES_LITERAL("").join(data)
 
     def write(self, data):
+        data = memoryview(data)
         try:
             while data:
                 chunk = data[:self.MAX_IO_CHUNK]
@@ -386,6 +515,292 @@ class PipeStream(Stream):
             self.close()
             raise EOFError(ex)
 
+    def writev(self, buffers):
+        if not hasattr(os, "writev"):
+            return Stream.writev(self, buffers)
+        views = [memoryview(buf) for buf in buffers if len(buf)]
+        try:
+            while views:
+                _consume(views, os.writev(self.outgoing.fileno(), views))
+        except EnvironmentError:
+            ex = sys.exc_info()[1]
+            self.close()
+            raise EOFError(ex)
+
+
+# the ring buffers of SharedMemoryStream publish their data with plain stores, so the stores
+# must become visible to the other process in program order (total store order)
+_TOTAL_STORE_ORDER = platform.machine().lower() in ("x86_64", "amd64", "i386", "i686", "x86")
+
+
+class _SharedRing(object):
+    """A single-producer single-consumer ring buffer in a shared memory segment. The
+    producer only advances ``head`` and the consumer only advances ``tail``; both are
+    free-running 8-byte counters, so no lock is needed between the processes (this relies
+    on aligned 8-byte stores being atomic and ordered, as they are on x86, see
+    ``_TOTAL_STORE_ORDER``). Within a process, :func:`close` waits for the copies in
+    progress, since the memory cannot be released while they use it."""
+
+    __slots__ = ("shm", "owner", "capacity", "_counters", "_data", "_lock", "_copies", "_released")
+    HEADER_SIZE = 64  # head, tail, closed flag, capacity (8 bytes each), padded
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self._counters = shm.buf[:32].cast("Q")
+        if owner:
+            self._counters[3] = shm.size - self.HEADER_SIZE
+        self.capacity = self._counters[3]
+        self._data = shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + self.capacity]
+        self._lock = threading.Condition()
+        self._copies = 0  # in progress, by the threads of this process
+        self._released = False
+
+    def _enter(self):
+        with self._lock:
+            if self._released:
+                raise ValueError("ring buffer is released")
+            self._copies += 1
+
+    def _exit(self):
+        with self._lock:
+            self._copies -= 1
+            if not self._copies:
+                self._lock.notify_all()
+
+    @classmethod
+    def create(cls, capacity):
+        from multiprocessing import shared_memory
+        return cls(shared_memory.SharedMemory(create=True, size=cls.HEADER_SIZE + capacity), True)
+
+    @classmethod
+    def attach(cls, name):
+        from multiprocessing import shared_memory
+        return cls(shared_memory.SharedMemory(name), False)
+
+    @property
+    def available(self):
+        """the number of bytes that can be read"""
+        return self._counters[0] - self._counters[1]
+
+    @property
+    def closed(self):
+        return self._counters[2] != 0
+
+    def mark_closed(self):
+        self._counters[2] = 1
+
+    def write_from(self, view):
+        """copies as much of *view* as fits into the ring; returns the number of bytes copied"""
+        self._enter()
+        try:
+            head = self._counters[0]
+            count = min(len(view), self.capacity - (head - self._counters[1]))
+            if count:
+                pos = head % self.capacity
+                first = min(count, self.capacity - pos)
+                self._data[pos:pos + first] = view[:first]
+                if count > first:
+                    self._data[:count - first] = view[first:count]
+                self._counters[0] = head + count
+            return count
+        finally:
+            self._exit()
+
+    def read_into(self, view):
+        """copies up to ``len(view)`` available bytes into *view*; returns the number of bytes copied"""
+        self._enter()
+        try:
+            tail = self._counters[1]
+            count = min(len(view), self._counters[0] - tail)
+            if count:
+                pos = tail % self.capacity
+                first = min(count, self.capacity - pos)
+                view[:first] = self._data[pos:pos + first]
+                if count > first:
+                    view[first:count] = self._data[:count - first]
+                self._counters[1] = tail + count
+            return count
+        finally:
+            self._exit()
+
+    def close(self, unlink=True):
+        with self._lock:
+            self._released = True
+            while self._copies:
+                self._lock.wait()
+        self._counters.release()
+        self._data.release()
+        self.shm.close()
+        if unlink and self.owner:
+            self.shm.unlink()
+
+
+class SharedMemoryStream(Stream):
+    """A stream between two processes (or threads) on the same host, which passes the data
+    through a pair of ring buffers in shared memory (:mod:`multiprocessing.shared_memory`),
+    one for each direction. Two pipes are used only for wakeups: one signals the arrival of
+    data and the other the release of space. Available on POSIX compatible systems on x86 only.
+
+    Use :func:`create_pair` to create the two sides; when they are used by different
+    processes, call :func:`detach` on the side that the process does not use (e.g., after
+    ``fork()``).
+    """
+
+    __slots__ = ("_incoming", "_outgoing", "_data_in", "_space_in", "_data_out", "_space_out")
+    RING_SIZE = 1024 * 1024
+
+    def __init__(self, incoming, outgoing, data_in, space_in, data_out, space_out):
+        self._incoming = incoming
+        self._outgoing = outgoing
+        self._data_in = data_in  # signaled by the peer when it wrote data to incoming
+        self._space_in = space_in  # signaled by the peer when it read data from outgoing
+        self._data_out = data_out
+        self._space_out = space_out
+
+    @classmethod
+    def create_pair(cls, ring_size=None):
+        """factory method that creates the two sides of a shared memory stream
+
+        :param ring_size: the capacity (in bytes) of each ring buffer (defaults to ``RING_SIZE``)
+
+        :returns: a tuple of two :class:`SharedMemoryStream` instances
+        """
+        if not _TOTAL_STORE_ORDER:
+            raise NotImplementedError(f"SharedMemoryStream is not supported on {platform.machine()!r} "
+                                      "(its ring buffers require the store ordering of x86)")
+        if ring_size is None:
+            ring_size = cls.RING_SIZE
+        ring1 = _SharedRing.create(ring_size)  # side1 -> side2
+        ring2 = _SharedRing.create(ring_size)  # side2 -> side1
+        data1_r, data1_w = os.pipe()
+        space1_r, space1_w = os.pipe()
+        data2_r, data2_w = os.pipe()
+        space2_r, space2_w = os.pipe()
+        for fd in (data1_w, space1_w, data2_w, space2_w):
+            os.set_blocking(fd, False)  # a full pipe already holds a pending wakeup
+        side1 = cls(_SharedRing.attach(ring2.shm.name), ring1, data2_r, space1_r, data1_w, space2_w)
+        side2 = cls(_SharedRing.attach(ring1.shm.name), ring2, data1_r, space2_r, data2_w, space1_w)
+        # each side owns (unlinks) the ring it writes to
+        return side1, side2
+
+    @property
+    def closed(self):
+        return self._incoming is None
+
+    def close(self):
+        if self.closed:
+            return
+        self._outgoing.mark_closed()
+        self._signal(self._data_out)
+        self._release(unlink=True)
+
+    def detach(self):
+        """releases this side's resources without closing the stream for the peer;
+        used by a process that inherited the side it does not use"""
+        if self.closed:
+            return
+        self._release(unlink=False)
+
+    def _release(self, unlink):
+        for fd in (self._data_in, self._space_in, self._data_out, self._space_out):
+            os.close(fd)
+        self._incoming.close(unlink)
+        self._outgoing.close(unlink)
+        self._incoming = self._outgoing = None
+
+    def fileno(self):
+        if self.closed:
+            raise EOFError("stream has been closed")
+        return self._data_in
+
+    @staticmethod
+    def _signal(fd):
+        try:
+            os.write(fd, b"\0")
+        except BlockingIOError:
+            pass  # the pipe is full of pending wakeups
+        except OSError:
+            return False  # the peer is gone
+        return True
+
+    @staticmethod
+    def _wait(fd):
+        # blocks until signaled; returns False if the peer is gone
+        return bool(os.read(fd, 4096))
+
+    def poll(self, timeout):
+        timeout = Timeout(timeout)
+        incoming = self._incoming
+        try:
+            while True:
+                if incoming is None or self.closed:
+                    raise EOFError("stream has been closed")
+                if incoming.available or incoming.closed:
+                    return True
+                if not Stream.poll(self, timeout.timeleft()):
+                    return False
+                if not self._wait(self._data_in):
+                    return True  # the peer is gone; read() raises EOFError
+        except (ValueError, OSError):
+            # closed by another thread (released buffers or closed pipes)
+            raise EOFError(sys.exc_info()[1])
+
+    def read(self, count):
+        data = bytearray(count)
+        self.read_into(memoryview(data))
+        return data
+
+    def read_into(self, view):
+        count = len(view)
+        pos = 0
+        incoming = self._incoming
+        try:
+            if incoming is None:
+                raise EOFError("stream has been closed")
+            while pos < count:
+                received = incoming.read_into(view[pos:])
+                if received:
+                    pos += received
+                    self._signal(self._space_out)
+                elif incoming.closed or not self._wait(self._data_in):
+                    if not incoming.available:
+                        raise EOFError("connection closed by peer")
+        except EOFError:
+            self.close()
+            raise
+        except (ValueError, OSError):
+            # closed by another thread (released buffers or closed pipes)
+            ex = sys.exc_info()[1]
+            self.close()
+            raise EOFError(ex)
+
+    def write(self, data):
+        self.writev((data,))
+
+    def writev(self, buffers):
+        outgoing = self._outgoing
+        try:
+            if outgoing is None:
+                raise EOFError("stream has been closed")
+            for buf in buffers:
+                view = memoryview(buf)
+                while view:
+                    written = outgoing.write_from(view)
+                    if written:
+                        view = view[written:]
+                    elif not self._signal(self._data_out) or not self._wait(self._space_in):
+                        raise EOFError("connection closed by peer")
+            if not self._signal(self._data_out):
+                raise EOFError("connection closed by peer")
+        except EOFError:
+            self.close()
+            raise
+        except (ValueError, OSError):
+            ex = sys.exc_info()[1]
+            self.close()
+            raise EOFError(ex)
+
 
 class Win32PipeStream(Stream):
     """A stream over two simplex pipes (one used to input, another for output).
@@ -8,6 +8,7 @@ import logging
 import threading
 import time
 import random
+import weakref
 from rpyc.lib.compat import maxint  # noqa: F401
 
 
@@ -216,25 +217,53 @@ def get_id_pack(obj):
     return (name_pack, id(obj), 0)
 
 
-def get_methods(obj_attrs, obj):
+# class -> {(obj_attrs, of the class itself, docs): (signature, methods)}
+_methods_cache = weakref.WeakKeyDictionary()
+
+
+def get_methods(obj_attrs, obj, docs=True):
     """introspects the given (local) object, returning a list of all of its
-    methods (going up the MRO).
+    methods (going up the MRO). The methods are memoized per class, until an
+    attribute of a class in the MRO is added, removed or replaced
 
     :param obj: any local (not proxy) python object
+    :param docs: whether to include the docstrings (otherwise they are ``None``)
 
-    :returns: a list of ``(method name, docstring)`` tuples of all the methods
+    :returns: a tuple of ``(method name, docstring)`` tuples of all the methods
               of the given object
     """
-    methods = {}
-    attrs = {}
-    if isinstance(obj, type):
+    is_class = isinstance(obj, type)
+    cls = obj if is_class else type(obj)
+    key = (obj_attrs, is_class, docs)
+    try:
+        cached = _methods_cache.get(cls)
+    except TypeError:  # not weakly referenceable
+        cached = None
+    else:
+        if cached is None:
+            cached = _methods_cache[cls] = {}
+    if is_class:
         # don't forget the darn metaclass
         mros = list(reversed(type(obj).__mro__)) + list(reversed(obj.__mro__))
     else:
-        mros = reversed(type(obj).__mro__)
+        mros = list(reversed(type(obj).__mro__))
+    # a cheap signature of the state of the classes, which the memoized methods must match: the names
+    # and the ids of the values of their attributes (ids rather than the values, which could keep
+    # the class alive)
+    signature = tuple([(id(basecls), tuple(basecls.__dict__), tuple(map(id, basecls.__dict__.values())))
+                       for basecls in mros])
+    if cached is not None:
+        entry = cached.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+    methods = {}
+    attrs = {}
     for basecls in mros:
         attrs.update(basecls.__dict__)
     for name, attr in attrs.items():
         if name not in obj_attrs and inspect.isroutine(attr):
-            methods[name] = inspect.getdoc(attr)
-    return methods.items()
+            methods[name] = inspect.getdoc(attr) if docs else None
+    methods = tuple(methods.items())
+    if cached is not None:
+        cached[key] = (signature, methods)
+    return methods
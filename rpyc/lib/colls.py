@@ -1,4 +1,5 @@
 from __future__ import with_statement
+import collections
 import weakref
 from threading import Lock
 
@@ -82,6 +83,9 @@ class RefCountingColl(object):
     def __repr__(self):
         return repr(self._dict)
 
+    def __len__(self):
+        return len(self._dict)
+
     def add(self, key, obj):
         """Add object to refcounting coll."""
         with self._lock:
@@ -105,6 +109,58 @@ class RefCountingColl(object):
                 slot[1] -= count
                 self._dict[key] = slot
 
+    def decref_many(self, items):
+        """Decrement the refcounts of many ``(key, count)`` pairs under a single lock acquisition,
+        skipping keys which are no longer present."""
+        with self._lock:
+            for key, count in items:
+                slot = self._dict.get(key)
+                if slot is None:
+                    continue
+                if slot[1] < count:
+                    del self._dict[key]
+                else:
+                    slot[1] -= count
+
     def __getitem__(self, key):
         with self._lock:
             return self._dict[key][0]
+
+
+class LRUCache(object):
+    """a thread-safe dict-like object that holds up to *maxsize* items, evicting the least
+    recently used item"""
+    __slots__ = ("_lock", "_dict", "maxsize")
+
+    def __init__(self, maxsize):
+        self._lock = Lock()
+        self._dict = collections.OrderedDict()
+        self.maxsize = maxsize
+
+    def __repr__(self):
+        return repr(self._dict)
+
+    def __len__(self):
+        return len(self._dict)
+
+    def __contains__(self, key):
+        return key in self._dict
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._dict.move_to_end(key)
+            except KeyError:
+                return default
+            return self._dict[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._dict[key] = value
+            self._dict.move_to_end(key)
+            while len(self._dict) > self.maxsize:
+                self._dict.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._dict.clear()
@@ -2,11 +2,16 @@ from __future__ import with_statement
 import sys
 import os
 import inspect
+import collections
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from rpyc.lib.compat import pickle, execute
+from rpyc.core import netref
 from rpyc.core.service import ClassicService, Slave
 from rpyc.utils import factory
+from rpyc.utils.helpers import async_
 from rpyc.core.service import ModuleNamespace  # noqa: F401
-from rpyc.core.consts import STREAM_CHUNK
+from rpyc.core.consts import STREAM_CHUNK, STREAM_WINDOW, SYNC_BLOCK, PRIORITY_BULK
 from contextlib import contextmanager
 
 
@@ -175,7 +180,8 @@ def connect_multiprocess(args={}):
 # remoting utilities
 # ===============================================================================
 
-def upload(conn, localpath, remotepath, filter=None, ignore_invalid=False, chunk_size=STREAM_CHUNK):
+def upload(conn, localpath, remotepath, filter=None, ignore_invalid=False, chunk_size=STREAM_CHUNK,
+           window=STREAM_WINDOW, parallel=1):
     """uploads a file or a directory to the given remote path
 
     :param localpath: the local file or directory
@@ -183,37 +189,110 @@ def upload(conn, localpath, remotepath, filter=None, ignore_invalid=False, chunk
     :param filter: a predicate that accepts the filename and determines whether
                    it should be uploaded; None means any file
     :param chunk_size: the IO chunk size
+    :param window: the number of chunks in flight (see :func:`upload_file`)
+    :param parallel: the number of files of a directory uploaded concurrently
     """
     if os.path.isdir(localpath):
-        upload_dir(conn, localpath, remotepath, filter, chunk_size)
+        upload_dir(conn, localpath, remotepath, filter, chunk_size, window, parallel)
     elif os.path.isfile(localpath):
-        upload_file(conn, localpath, remotepath, chunk_size)
+        upload_file(conn, localpath, remotepath, chunk_size, window)
     else:
         if not ignore_invalid:
             raise ValueError(f"cannot upload {localpath!r}")
 
 
-def upload_file(conn, localpath, remotepath, chunk_size=STREAM_CHUNK):
-    with open(localpath, "rb") as lf:
-        with conn.builtin.open(remotepath, "wb") as rf:
+def upload_file(conn, localpath, remotepath, chunk_size=STREAM_CHUNK, window=STREAM_WINDOW, offset=0):
+    """uploads a file to the given remote path. Up to *window* chunks are written
+    asynchronously, at their position in the file (``os.pwrite``), rather than waiting
+    for each write to complete; without ``os.pwrite`` on the remote side (Windows),
+    chunks are written one at a time
+
+    :param offset: the position from which to upload, e.g., the size of a partially
+                   uploaded remote file, to resume its upload (the remote file is
+                   truncated there, rather than replaced)
+    """
+    ros = conn.modules.os
+    with open(localpath, "rb") as lf, conn.priority(PRIORITY_BULK):  # do not delay the requests of other threads
+        lf.seek(offset)
+        if window <= 1 or not hasattr(ros, "pwrite"):
+            with conn.builtin.open(remotepath, "r+b" if offset else "wb") as rf:
+                rf.seek(offset)
+                rf.truncate()
+                while True:
+                    buf = lf.read(chunk_size)
+                    if not buf:
+                        break
+                    rf.write(buf)
+            return
+        fd = ros.open(remotepath, ros.O_WRONLY | ros.O_CREAT, 0o666)
+        pending = collections.deque()  # (result, buffer, position) of the writes in flight
+        try:
+            ros.ftruncate(fd, offset)
+            pwrite = async_(ros.pwrite)
+            pos = offset
             while True:
                 buf = lf.read(chunk_size)
                 if not buf:
                     break
-                rf.write(buf)
+                if len(pending) >= window:
+                    _complete_write(ros, fd, *pending.popleft())
+                pending.append((pwrite(fd, buf, pos), buf, pos))
+                pos += len(buf)
+            while pending:
+                _complete_write(ros, fd, *pending.popleft())
+        finally:
+            for res, _, _ in pending:
+                res.wait()  # before closing the file; the write failed anyway
+            ros.close(fd)
 
 
-def upload_dir(conn, localpath, remotepath, filter=None, chunk_size=STREAM_CHUNK):
+def _complete_write(ros, fd, res, buf, pos):
+    written = res.value
+    while written < len(buf):  # a short write
+        written += ros.pwrite(fd, buf[written:], pos + written)
+
+
+def upload_dir(conn, localpath, remotepath, filter=None, chunk_size=STREAM_CHUNK, window=STREAM_WINDOW,
+               parallel=1):
+    """uploads a directory to the given remote path, *parallel* files at a time"""
+    with _transfers(parallel) as submit:
+        _upload_dir(conn, localpath, remotepath, filter, chunk_size, window, submit)
+
+
+def _upload_dir(conn, localpath, remotepath, filter, chunk_size, window, submit):
     if not conn.modules.os.path.isdir(remotepath):
         conn.modules.os.makedirs(remotepath)
     for fn in os.listdir(localpath):
         if not filter or filter(fn):
             lfn = os.path.join(localpath, fn)
             rfn = conn.modules.os.path.join(remotepath, fn)
-            upload(conn, lfn, rfn, filter=filter, ignore_invalid=True, chunk_size=chunk_size)
+            if os.path.isdir(lfn):
+                _upload_dir(conn, lfn, rfn, filter, chunk_size, window, submit)
+            elif os.path.isfile(lfn):
+                submit(upload_file, conn, lfn, rfn, chunk_size, window)
 
 
-def download(conn, remotepath, localpath, filter=None, ignore_invalid=False, chunk_size=STREAM_CHUNK):
+@contextmanager
+def _transfers(parallel):
+    """yields a function that submits a file transfer, which runs on one of *parallel*
+    threads; raises the first error once all of the transfers are done"""
+    if parallel <= 1:
+        yield lambda func, *args: func(*args)
+        return
+    futures = []
+    with ThreadPoolExecutor(parallel) as executor:
+        try:
+            yield lambda func, *args: futures.append(executor.submit(func, *args))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    for future in futures:
+        future.result()
+
+
+def download(conn, remotepath, localpath, filter=None, ignore_invalid=False, chunk_size=STREAM_CHUNK,
+             window=STREAM_WINDOW, parallel=1):
     """
     download a file or a directory to the given remote path
 
@@ -222,37 +301,250 @@ def download(conn, remotepath, localpath, filter=None, ignore_invalid=False, chu
     :param filter: a predicate that accepts the filename and determines whether
                    it should be downloaded; None means any file
     :param chunk_size: the IO chunk size
+    :param window: the number of chunks in flight (see :func:`download_file`)
+    :param parallel: the number of files of a directory downloaded concurrently
     """
     if conn.modules.os.path.isdir(remotepath):
-        download_dir(conn, remotepath, localpath, filter, chunk_size)
+        download_dir(conn, remotepath, localpath, filter, chunk_size, window, parallel)
     elif conn.modules.os.path.isfile(remotepath):
-        download_file(conn, remotepath, localpath, chunk_size)
+        download_file(conn, remotepath, localpath, chunk_size, window)
     else:
         if not ignore_invalid:
             raise ValueError(f"cannot download {remotepath!r}")
 
 
-def download_file(conn, remotepath, localpath, chunk_size=STREAM_CHUNK):
-    with conn.builtin.open(remotepath, "rb") as rf:
-        with open(localpath, "wb") as lf:
-            while True:
-                buf = rf.read(chunk_size)
+def download_file(conn, remotepath, localpath, chunk_size=STREAM_CHUNK, window=STREAM_WINDOW, offset=0):
+    """downloads a remote file to the given local path. Up to *window* chunks are read
+    asynchronously, at their position in the file (``os.pread``), rather than waiting
+    for each read to complete; without ``os.pread`` on the remote side (Windows),
+    chunks are read one at a time
+
+    :param offset: the position from which to download, e.g., the size of a partially
+                   downloaded local file, to resume its download (the local file is
+                   truncated there, rather than replaced)
+    """
+    ros = conn.modules.os
+    with open(localpath, "r+b" if offset else "wb") as lf:
+        lf.seek(offset)
+        lf.truncate()
+        if window <= 1 or not hasattr(ros, "pread"):
+            with conn.builtin.open(remotepath, "rb") as rf:
+                rf.seek(offset)
+                while True:
+                    buf = rf.read(chunk_size)
+                    if not buf:
+                        break
+                    lf.write(buf)
+            return
+        fd = ros.open(remotepath, ros.O_RDONLY)
+        pending = collections.deque()  # (result, position) of the reads in flight
+        try:
+            size = ros.fstat(fd).st_size
+            pread = async_(ros.pread)
+            pos = offset
+            while pos < size or pending:
+                while pos < size and len(pending) < window:
+                    pending.append((pread(fd, chunk_size, pos), pos))
+                    pos += chunk_size
+                res, chunk_pos = pending.popleft()
+                buf = res.value
+                expected = min(chunk_size, size - chunk_pos)
+                while buf and len(buf) < expected:  # a short read
+                    more = ros.pread(fd, expected - len(buf), chunk_pos + len(buf))
+                    if not more:
+                        break
+                    buf += more
+                lf.write(buf)
+                if len(buf) < expected:  # the file shrank meanwhile
+                    break
+            while True:  # the file grew meanwhile
+                buf = ros.pread(fd, chunk_size, lf.tell())
                 if not buf:
                     break
                 lf.write(buf)
+        finally:
+            for res, _ in pending:
+                res.wait()  # before closing the file; the read failed anyway
+            ros.close(fd)
+
 
+def download_dir(conn, remotepath, localpath, filter=None, chunk_size=STREAM_CHUNK, window=STREAM_WINDOW,
+                 parallel=1):
+    """downloads a remote directory to the given local path, *parallel* files at a time"""
+    with _transfers(parallel) as submit:
+        _download_dir(conn, remotepath, localpath, filter, chunk_size, window, submit)
 
-def download_dir(conn, remotepath, localpath, filter=None, chunk_size=STREAM_CHUNK):
+
+def _download_dir(conn, remotepath, localpath, filter, chunk_size, window, submit):
     if not os.path.isdir(localpath):
         os.makedirs(localpath)
     for fn in conn.modules.os.listdir(remotepath):
         if not filter or filter(fn):
             rfn = conn.modules.os.path.join(remotepath, fn)
             lfn = os.path.join(localpath, fn)
-            download(conn, rfn, lfn, filter=filter, ignore_invalid=True, chunk_size=chunk_size)
+            if conn.modules.os.path.isdir(rfn):
+                _download_dir(conn, rfn, lfn, filter, chunk_size, window, submit)
+            elif conn.modules.os.path.isfile(rfn):
+                submit(download_file, conn, rfn, lfn, chunk_size, window)
+
+
+def sync_dir(conn, localpath, remotepath, filter=None, delete=False, checksum=False, block_size=SYNC_BLOCK,
+             chunk_size=STREAM_CHUNK, window=STREAM_WINDOW):
+    """uploads only the differences between a local directory and the given remote path:
+    the :func:`manifest` of the remote tree is fetched in a single request, and files that
+    differ in size or modification time (or content, with *checksum*) are uploaded. Of a
+    file larger than two blocks, only the blocks whose hashes differ from those of the remote
+    file are uploaded. The modification times of the uploaded files are set to those of the
+    local files, so that unchanged files are skipped by the next sync. If the remote side does
+    not support syncing (an older version, or no ``os.pwrite``), the directory is uploaded
+
+    :param filter: a predicate that accepts the filename and determines whether
+                   it should be synced; None means any file
+    :param delete: whether to remove remote files and directories that do not exist locally
+    :param checksum: whether to compare the content of files, rather than their size and
+                     modification time
+    :param block_size: the block size of delta transfers
+    """
+    ros = conn.modules.os
+    try:
+        remote_classic = conn.modules["rpyc.utils.classic"]
+        remote_manifest, remote_block_digests = remote_classic.manifest, remote_classic.block_digests
+    except (ImportError, AttributeError):
+        remote_manifest = None
+    if remote_manifest is None or not hasattr(ros, "pwrite"):
+        upload_dir(conn, localpath, remotepath, filter, chunk_size, window)
+        return
+    remote = dict((entry[0], entry[1:]) for entry in remote_manifest(remotepath, checksum))
+    local = manifest(localpath, checksum, filter)
+    sep = ros.sep
+    if not remote:
+        ros.makedirs(remotepath, exist_ok=True)
+
+    def remote_path(path):
+        return remotepath + sep + path.replace("/", sep)
+
+    deltas = []
+    removed = set()  # the removed directories, whose remote entries are gone
+    for path, size, mtime, digest in local:
+        rpath = remote_path(path)
+        other = remote.get(path)
+        if size is None:
+            if other is None:
+                ros.mkdir(rpath)
+            elif other[0] is not None:
+                ros.remove(rpath)
+                ros.mkdir(rpath)
+            continue
+        if other is not None and other[0] == size and (other[2] == digest if checksum else other[1] == mtime):
+            continue
+        lpath = os.path.join(localpath, *path.split("/"))
+        if other is not None and other[0] is not None and size > 2 * block_size:
+            deltas.append((lpath, rpath, mtime))
+            continue
+        if other is not None and other[0] is None:
+            conn.modules.shutil.rmtree(rpath)
+            removed.add(path)
+        upload_file(conn, lpath, rpath, chunk_size, window)
+        ros.utime(rpath, ns=(mtime, mtime))
+    if deltas:
+        all_digests = remote_block_digests(tuple(rpath for _, rpath, _ in deltas), block_size)
+        for (lpath, rpath, mtime), digests in zip(deltas, all_digests):
+            _upload_blocks(conn, lpath, rpath, digests, block_size, window)
+            ros.utime(rpath, ns=(mtime, mtime))
+    if delete:
+        local_paths = set(entry[0] for entry in local)
+        for path in sorted(remote):
+            names = path.split("/")
+            if removed and any("/".join(names[:i]) in removed for i in range(1, len(names))):
+                continue  # in a removed directory
+            if path in local_paths or (filter and not all(filter(name) for name in names)):
+                continue
+            if remote[path][0] is None:
+                conn.modules.shutil.rmtree(remote_path(path))
+                removed.add(path)
+            else:
+                ros.remove(remote_path(path))
+
+
+def _upload_blocks(conn, localpath, remotepath, digests, block_size, window):
+    """uploads the blocks of a local file whose hashes differ from the given *digests*
+    of the blocks of the remote file"""
+    ros = conn.modules.os
+    fd = ros.open(remotepath, ros.O_WRONLY)
+    pending = collections.deque()  # (result, buffer, position) of the writes in flight
+    try:
+        pwrite = async_(ros.pwrite)
+        with open(localpath, "rb") as lf, conn.priority(PRIORITY_BULK):
+            pos = 0
+            for buf in iter(lambda: lf.read(block_size), b""):
+                index = pos // block_size
+                if index >= len(digests) or _digest(buf) != digests[index]:
+                    if len(pending) >= window:
+                        _complete_write(ros, fd, *pending.popleft())
+                    pending.append((pwrite(fd, buf, pos), buf, pos))
+                pos += len(buf)
+            while pending:
+                _complete_write(ros, fd, *pending.popleft())
+            ros.ftruncate(fd, pos)
+    finally:
+        for res, _, _ in pending:
+            res.wait()
+        ros.close(fd)
+
+
+def _digest(buf):
+    return hashlib.blake2b(buf, digest_size=16).digest()
 
 
-def upload_package(conn, module, remotepath=None, chunk_size=STREAM_CHUNK):
+def _file_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for buf in iter(lambda: f.read(STREAM_CHUNK), b""):
+            digest.update(buf)
+    return digest.digest()
+
+
+def manifest(root, checksum=False, filter=None):
+    """returns the manifest of the directory tree under *root* (see :func:`sync_dir`): a tuple
+    of ``(path, size, mtime_ns, digest)`` for each file and directory under it, where *path*
+    is relative to *root* (with ``/`` separators), *size* is ``None`` for directories, and
+    *digest* is the hash of the file's content with *checksum* (otherwise ``None``). The tuple
+    is empty if *root* does not exist
+
+    :param filter: a predicate that accepts the filename and determines whether
+                   it should be listed; None means any file
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if filter:
+            dirnames[:] = [name for name in dirnames if filter(name)]
+            filenames = [name for name in filenames if filter(name)]
+        prefix = os.path.relpath(dirpath, root).replace(os.sep, "/") + "/"
+        if prefix == "./":
+            prefix = ""
+        for name in dirnames:
+            entries.append((prefix + name, None, None, None))
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+                digest = _file_digest(path) if checksum else None
+            except OSError:
+                continue  # e.g., a broken symlink
+            entries.append((prefix + name, st.st_size, st.st_mtime_ns, digest))
+    return tuple(entries)
+
+
+def block_digests(paths, block_size=SYNC_BLOCK):
+    """returns the hashes of the blocks of each of the given files (see :func:`sync_dir`)"""
+    digests = []
+    for path in paths:
+        with open(path, "rb") as f:
+            digests.append(tuple(_digest(buf) for buf in iter(lambda: f.read(block_size), b"")))
+    return tuple(digests)
+
+
+def upload_package(conn, module, remotepath=None, chunk_size=STREAM_CHUNK, sync=False, delete=False):
     """
     uploads a module or a package to the remote party
 
@@ -262,6 +554,8 @@ def upload_package(conn, module, remotepath=None, chunk_size=STREAM_CHUNK):
                        remote system's python library (as reported by
                        ``distutils``)
     :param chunk_size: the IO chunk size
+    :param sync: whether to upload only the differences from the remote copy (see :func:`sync_dir`)
+    :param delete: whether to remove remote files that do not exist locally (with *sync*)
 
     .. note:: ``upload_module`` is just an alias to ``upload_package``
 
@@ -276,7 +570,10 @@ def upload_package(conn, module, remotepath=None, chunk_size=STREAM_CHUNK):
         site = conn.modules["distutils.sysconfig"].get_python_lib()
         remotepath = conn.modules.os.path.join(site, module.__name__)
     localpath = os.path.dirname(os.path.abspath(inspect.getsourcefile(module)))
-    upload(conn, localpath, remotepath, chunk_size=chunk_size)
+    if sync:
+        sync_dir(conn, localpath, remotepath, delete=delete, chunk_size=chunk_size)
+    else:
+        upload(conn, localpath, remotepath, chunk_size=chunk_size)
 
 
 upload_module = upload_package
@@ -291,8 +588,14 @@ def obtain(proxy):
 
     .. note:: the remote object to must be ``pickle``-able
 
+    .. note:: with ``pickle_out_of_band`` enabled, large buffers of the object (e.g., of NumPy
+              arrays) are sent as raw frames and received into buffers of their own, rather than
+              copied into and out of a single pickle
+
     :returns: a copy of the remote object
     """
+    if isinstance(proxy, netref.BaseNetref):
+        return netref.unpickle_remote(proxy, pickle.DEFAULT_PROTOCOL)
     return pickle.loads(pickle.dumps(proxy))
 
 
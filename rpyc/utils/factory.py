@@ -4,7 +4,11 @@ cases)
 """
 from __future__ import with_statement
 import socket
-from contextlib import closing
+import asyncio
+import collections
+import random
+import time
+from contextlib import closing, contextmanager
 from functools import partial
 import threading
 try:
@@ -18,7 +22,8 @@ except ImportError:
         interrupt_main = System.exit
 
 from rpyc.core.channel import Channel
-from rpyc.core.stream import SocketStream, TunneledSocketStream, PipeStream
+from rpyc.core.stream import SocketStream, TunneledSocketStream, PipeStream, AsyncioSocketStream, SharedMemoryStream
+from rpyc.core.protocol import AsyncioConnection
 from rpyc.core.service import VoidService, MasterService, SlaveService
 from rpyc.utils.registry import UDPRegistryClient
 from rpyc.lib import safe_import, spawn
@@ -117,6 +122,38 @@ def unix_connect(path, service=VoidService, config={}):
     return connect_stream(s, service, config)
 
 
+async def asyncio_connect(host, port, service=VoidService, config={}, ipv6=False, keepalive=False):
+    """
+    creates a socket-connection to the given host and port, which is served by
+    the running :mod:`asyncio` event loop (see :class:`~rpyc.core.protocol.AsyncioConnection`).
+    This is a coroutine; the connection is established without blocking the loop.
+
+    :param host: the hostname to connect to
+    :param port: the TCP port to use
+    :param service: the local service to expose (defaults to Void)
+    :param config: configuration dict
+    :param ipv6: whether to create an IPv6 socket (defaults to ``False``)
+    :param keepalive: whether to set TCP keepalive on the socket (defaults to ``False``)
+
+    :returns: an :class:`~rpyc.core.protocol.AsyncioConnection`
+    """
+    loop = asyncio.get_running_loop()
+    family = socket.AF_INET6 if ipv6 else socket.AF_INET
+    addrinfo = await loop.getaddrinfo(host, port, family=family, type=socket.SOCK_STREAM)
+    family, socktype, proto, _, sockaddr = addrinfo[0]
+    s = socket.socket(family, socktype, proto)
+    try:
+        s.setblocking(False)
+        await loop.sock_connect(s, sockaddr)
+        s.setblocking(True)
+        if keepalive:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except BaseException:
+        s.close()
+        raise
+    return service._connect(Channel(AsyncioSocketStream(s)), config, protocol=AsyncioConnection)
+
+
 def ssl_connect(host, port, keyfile=None, certfile=None, ca_certs=None,
                 cert_reqs=None, ssl_version=None, ciphers=None,
                 service=VoidService, config={}, ipv6=False, keepalive=False, verify_mode=None):
@@ -286,24 +323,38 @@ def _server(listener, remote_service, remote_config, args=None):
     try:
         with closing(listener):
             client = listener.accept()[0]
-        conn = connect_stream(SocketStream(client), service=remote_service, config=remote_config)
-        if isinstance(args, dict):
-            _oldstyle = (MasterService, SlaveService)
-            is_newstyle = isinstance(remote_service, type) and not issubclass(remote_service, _oldstyle)
-            is_newstyle |= not isinstance(remote_service, type) and not isinstance(remote_service, _oldstyle)
-            is_voidservice = isinstance(remote_service, type) and issubclass(remote_service, VoidService)
-            is_voidservice |= not isinstance(remote_service, type) and isinstance(remote_service, VoidService)
-            if is_newstyle and not is_voidservice:
-                conn._local_root.exposed_namespace.update(args)
-            elif not is_voidservice:
-                conn._local_root.namespace.update(args)
-
-        conn.serve_all()
+        _serve_stream(SocketStream(client), remote_service, remote_config, args)
     except KeyboardInterrupt:
         interrupt_main()
 
 
-def connect_thread(service=VoidService, config={}, remote_service=VoidService, remote_config={}):
+def _shm_server(unused_side, stream, remote_service, remote_config, args=None):
+    try:
+        if unused_side is not None:
+            unused_side.detach()  # inherited by the child process
+        _serve_stream(stream, remote_service, remote_config, args)
+    except KeyboardInterrupt:
+        interrupt_main()
+
+
+def _serve_stream(stream, remote_service, remote_config, args=None):
+    conn = connect_stream(stream, service=remote_service, config=remote_config)
+    if isinstance(args, dict):
+        _oldstyle = (MasterService, SlaveService)
+        is_newstyle = isinstance(remote_service, type) and not issubclass(remote_service, _oldstyle)
+        is_newstyle |= not isinstance(remote_service, type) and not isinstance(remote_service, _oldstyle)
+        is_voidservice = isinstance(remote_service, type) and issubclass(remote_service, VoidService)
+        is_voidservice |= not isinstance(remote_service, type) and isinstance(remote_service, VoidService)
+        if is_newstyle and not is_voidservice:
+            conn._local_root.exposed_namespace.update(args)
+        elif not is_voidservice:
+            conn._local_root.namespace.update(args)
+
+    conn.serve_all()
+
+
+def connect_thread(service=VoidService, config={}, remote_service=VoidService, remote_config={},
+                   shared_memory=False):
     """starts an rpyc server on a new thread, bound to an arbitrary port,
     and connects to it over a socket.
 
@@ -311,7 +362,13 @@ def connect_thread(service=VoidService, config={}, remote_service=VoidService, r
     :param config: configuration dict
     :param remote_service: the remote service to expose (of the server; defaults to Void)
     :param remote_config: remote configuration dict (of the server)
+    :param shared_memory: connect over a :class:`~rpyc.core.stream.SharedMemoryStream`
+                          instead of a socket (POSIX on x86 only)
     """
+    if shared_memory:
+        stream, remote_stream = SharedMemoryStream.create_pair()
+        spawn(_shm_server, None, remote_stream, remote_service, remote_config)
+        return connect_stream(stream, service=service, config=config)
     listener = socket.socket()
     listener.bind(("localhost", 0))
     listener.listen(1)
@@ -321,7 +378,8 @@ def connect_thread(service=VoidService, config={}, remote_service=VoidService, r
     return connect(host, port, service=service, config=config)
 
 
-def connect_multiprocess(service=VoidService, config={}, remote_service=VoidService, remote_config={}, args={}):
+def connect_multiprocess(service=VoidService, config={}, remote_service=VoidService, remote_config={}, args={},
+                         shared_memory=False):
     """starts an rpyc server on a new process, bound to an arbitrary port,
     and connects to it over a socket. Basically a copy of connect_thread().
     However if args is used and if these are shared memory then changes
@@ -332,11 +390,22 @@ def connect_multiprocess(service=VoidService, config={}, remote_service=VoidServ
     :param remote_service: the remote service to expose (of the server; defaults to Void)
     :param remote_config: remote configuration dict (of the server)
     :param args: dict of local vars to pass to new connection, form {'name':var}
+    :param shared_memory: connect over a :class:`~rpyc.core.stream.SharedMemoryStream`
+                          instead of a socket (the process is forked; POSIX on x86 only)
 
     Contributed by *@tvanzyl*
     """
     from multiprocessing import Process
 
+    if shared_memory:
+        import multiprocessing
+        stream, remote_stream = SharedMemoryStream.create_pair()
+        remote_server = partial(_shm_server, stream, remote_stream, remote_service, remote_config, args)
+        t = multiprocessing.get_context("fork").Process(target=remote_server)
+        t.start()
+        remote_stream.detach()
+        return connect_stream(stream, service=service, config=config)
+
     listener = socket.socket()
     listener.bind(("localhost", 0))
     listener.listen(1)
@@ -345,3 +414,358 @@ def connect_multiprocess(service=VoidService, config={}, remote_service=VoidServ
     t.start()
     host, port = listener.getsockname()
     return connect(host, port, service=service, config=config)
+
+
+class ConnectionPool(object):
+    """A pool of warm connections per ``(host, port, service)``, which saves the cost of
+    connecting (and of authenticating and fetching the remote root) per use::
+
+        pool = rpyc.ConnectionPool(max_size=4)
+        with pool.connection("myhost", 18861) as conn:
+            conn.root.do_something()
+
+    Connections idle for more than *ping_interval* seconds are pinged before they are handed
+    out, and dead ones are evicted (as are connections whose use raised an exception). At most
+    *max_size* connections per key are open at a time; :func:`connection` waits for one to be
+    returned, up to *timeout* seconds.
+
+    :param factory: the function that creates a connection, called as
+                    ``factory(host, port, service=service, config=config)``
+                    (e.g., :func:`connect` or ``functools.partial(ssl_connect, ...)``)
+    :param service: the default local service to expose
+    :param config: the configuration dict of the connections
+    :param max_size: the maximal number of connections per key
+    :param min_idle: the number of idle connections :func:`prewarm` keeps per key
+    :param ping_interval: the idle time (in seconds) after which a connection is pinged before
+                          it is handed out (``None`` to never ping)
+    :param ping_timeout: the time (in seconds) to wait for the echo of a ping
+    :param timeout: the time (in seconds) to wait for a connection when *max_size* connections
+                    are in use (``None`` to wait forever)
+    """
+
+    def __init__(self, factory=connect, service=VoidService, config={}, max_size=8, min_idle=0,
+                 ping_interval=30, ping_timeout=3, timeout=None):
+        self.factory = factory
+        self.service = service
+        self.config = config
+        self.max_size = max_size
+        self.min_idle = min_idle
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._idle = collections.defaultdict(list)  # key -> [(conn, idle since)]; the most recent last
+        self._sizes = collections.defaultdict(int)  # key -> the number of open connections, idle or not
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def connection(self, host, port, service=None):
+        """A context manager that checks a connection out of the pool, and returns it to the pool
+        when the block exits (unless the connection was closed or lost). If the block raises,
+        the connection is closed instead, since an interrupted request (e.g., by a timeout or
+        ``KeyboardInterrupt``) may still have a reply in flight
+
+        :raises: ``TimeoutError`` if no connection is available within the pool's *timeout*
+        """
+        key = (host, port, service or self.service)
+        conn = self._checkout(key)
+        try:
+            yield conn
+        except BaseException:
+            self._discard(key, conn)
+            raise
+        else:
+            self._checkin(key, conn)
+
+    def prewarm(self, host, port, service=None):
+        """opens connections until *min_idle* connections to the given address are idle
+        (within *max_size*)"""
+        key = (host, port, service or self.service)
+        while True:
+            with self._cond:
+                if len(self._idle[key]) >= self.min_idle or self._sizes[key] >= self.max_size:
+                    return
+                self._sizes[key] += 1
+            conn = self._create(key)
+            self._checkin(key, conn)
+
+    def evict(self):
+        """closes the idle connections that are dead, or fail a ping"""
+        with self._cond:
+            idle = [(key, conn) for key, conns in self._idle.items() for conn, _ in conns]
+            self._idle.clear()
+        for key, conn in idle:
+            if self._alive(conn):
+                self._checkin(key, conn)
+            else:
+                self._discard(key, conn)
+
+    def close(self):
+        """closes the idle connections; connections in use are closed when they are returned"""
+        with self._cond:
+            self._closed = True
+            idle = [(key, conn) for key, conns in self._idle.items() for conn, _ in conns]
+            self._idle.clear()
+            self._cond.notify_all()
+        for key, conn in idle:
+            self._discard(key, conn)
+
+    def stats(self):
+        """returns the number of open and of idle connections, per key"""
+        with self._cond:
+            return dict((key, dict(size=size, idle=len(self._idle[key]))) for key, size in self._sizes.items())
+
+    def _create(self, key):
+        host, port, service = key
+        try:
+            conn = self.factory(host, port, service=service, config=self.config)
+            conn.root  # fetched once, rather than by every user of the connection
+        except BaseException:
+            with self._cond:
+                self._sizes[key] -= 1
+                self._cond.notify()
+            raise
+        return conn
+
+    def _alive(self, conn):
+        if conn.closed:
+            return False
+        try:
+            conn.ping(timeout=self.ping_timeout)
+        except Exception:
+            return False
+        return True
+
+    def _checkout(self, key):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise ValueError("the pool is closed")
+                idle = self._idle[key]
+                if idle:
+                    conn, since = idle.pop()
+                elif self._sizes[key] < self.max_size:
+                    self._sizes[key] += 1
+                    break
+                else:
+                    timeleft = None if deadline is None else deadline - time.monotonic()
+                    if timeleft is not None and timeleft <= 0:
+                        raise TimeoutError(f"no connection to {key[0]}:{key[1]} is available")
+                    self._cond.wait(timeleft)
+                    continue
+            if self.ping_interval is not None and time.monotonic() - since >= self.ping_interval:
+                alive = self._alive(conn)
+            else:
+                alive = not conn.closed
+            if alive:
+                return conn
+            self._discard(key, conn)
+        return self._create(key)
+
+    def _checkin(self, key, conn):
+        if conn.closed:
+            self._discard(key, conn)
+            return
+        with self._cond:
+            if not self._closed:
+                self._idle[key].append((conn, time.monotonic()))
+                self._cond.notify()
+                return
+        self._discard(key, conn)
+
+    def _discard(self, key, conn):
+        with self._cond:
+            self._sizes[key] -= 1
+            self._cond.notify()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class _Node(object):
+    """a server of a :class:`ServiceBalancer`"""
+    __slots__ = ["addr", "conn", "rtt"]
+
+    def __init__(self, addr):
+        self.addr = addr
+        self.conn = None
+        self.rtt = None  # a moving average of the ping round trip time, in seconds
+
+    @property
+    def outstanding(self):
+        return len(self.conn._request_callbacks) if self.conn is not None else 0
+
+
+class ServiceBalancer(object):
+    """Balances the load of a client across the servers of a service, discovered through the
+    registry (rather than connecting to the first server, like :func:`connect_by_service`)::
+
+        balancer = rpyc.ServiceBalancer("MYSERVICE")
+        with balancer.connection() as conn:
+            conn.root.do_something()
+        balancer.call(lambda conn: conn.root.do_something())  # retried on another server on failure
+
+    A connection is kept to each server that is used, and each use goes to the server with the
+    least outstanding requests (``"least_outstanding"``), or to the better of two random servers
+    (``"two_choices"``), weighing the outstanding requests by the measured round trip time. The
+    servers are discovered again every *refresh_interval* seconds; a server whose connection
+    fails is dropped until then.
+
+    :param service_name: the service to balance across
+    :param host: limit discovery to the given host only (None means any host)
+    :param registrar: the registry client (see :func:`discover`)
+    :param service: the local service to expose
+    :param config: the configuration dict of the connections
+    :param strategy: ``"least_outstanding"`` or ``"two_choices"``
+    :param refresh_interval: the number of seconds between discoveries of the servers
+    :param ping_timeout: the time (in seconds) to wait for the echo of a ping, which measures
+                         the round trip time of a server
+    :param timeout: the discovery timeout
+    """
+    RTT_WEIGHT = 0.3  # the weight of a new measurement in the moving average
+
+    def __init__(self, service_name, host=None, registrar=None, service=VoidService, config={},
+                 strategy="least_outstanding", refresh_interval=30, ping_timeout=3, timeout=2):
+        if strategy not in ("least_outstanding", "two_choices"):
+            raise ValueError(f"invalid strategy: {strategy!r}")
+        self.service_name = service_name
+        self.host = host
+        self.registrar = registrar
+        self.service = service
+        self.config = config
+        self.strategy = strategy
+        self.refresh_interval = refresh_interval
+        self.ping_timeout = ping_timeout
+        self.timeout = timeout
+        self._lock = threading.RLock()
+        self._nodes = {}  # addr -> _Node
+        self._refreshed = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def connection(self):
+        """A context manager that yields the connection to the least loaded server, and drops
+        the server if the connection fails (``EOFError``)
+
+        :raises: ``DiscoveryError`` if no server is available
+        """
+        node = self._choose()
+        try:
+            yield node.conn
+        except EOFError:
+            self._drop(node)
+            raise
+
+    def call(self, func, *args, **kwargs):
+        """calls ``func(conn, *args, **kwargs)`` with the connection to the least loaded server,
+        and calls it again with another server if the connection fails (``EOFError``), until no
+        server is left
+
+        :raises: ``DiscoveryError`` if no server is available
+        :returns: the result of *func*
+        """
+        while True:
+            node = self._choose()
+            try:
+                return func(node.conn, *args, **kwargs)
+            except EOFError:
+                self._drop(node)
+
+    def refresh(self):
+        """discovers the servers of the service, connecting to new servers lazily and closing the
+        connections to servers that are gone, and measures the round trip times"""
+        addrs = set(tuple(addr) for addr in discover(self.service_name, self.host, self.registrar, self.timeout))
+        with self._lock:
+            self._refreshed = time.monotonic()
+            gone = [node for addr, node in self._nodes.items() if addr not in addrs]
+            for node in gone:
+                del self._nodes[node.addr]
+            for addr in addrs:
+                if addr not in self._nodes:
+                    self._nodes[addr] = _Node(addr)
+            nodes = list(self._nodes.values())
+        for node in gone:
+            if node.conn is not None:
+                node.conn.close()
+        for node in nodes:
+            if node.conn is not None:
+                self._ping(node)
+
+    def stats(self):
+        """returns the outstanding requests and the round trip time of each known server, by
+        address (a server that was not connected yet has no round trip time)"""
+        with self._lock:
+            return dict((addr, dict(outstanding=node.outstanding, rtt=node.rtt)) for addr, node in self._nodes.items())
+
+    def close(self):
+        """closes the connections to the servers"""
+        with self._lock:
+            nodes = list(self._nodes.values())
+            self._nodes.clear()
+            self._refreshed = None
+        for node in nodes:
+            if node.conn is not None:
+                node.conn.close()
+
+    def _choose(self):
+        if self._refreshed is None or time.monotonic() - self._refreshed >= self.refresh_interval:
+            self.refresh()
+        while True:
+            with self._lock:
+                nodes = list(self._nodes.values())
+            if not nodes:
+                raise DiscoveryError(f"All services are down: {self.service_name!r}")
+            if self.strategy == "two_choices" and len(nodes) > 2:
+                nodes = random.sample(nodes, 2)
+            # servers of unknown round trip time are tried first
+            node = min(nodes, key=lambda node: (node.outstanding + 1) * (node.rtt or 0)
+                       if self.strategy == "two_choices" else (node.outstanding, node.rtt or 0))
+            if node.conn is not None and not node.conn.closed:
+                return node
+            if node.conn is None:
+                try:
+                    conn = connect(node.addr[0], node.addr[1], self.service, config=self.config)
+                except socket.error:
+                    self._drop(node)
+                    continue
+                with self._lock:
+                    if node.conn is None:
+                        node.conn, conn = conn, None
+                if conn is not None:
+                    conn.close()  # another thread connected meanwhile
+            if self._ping(node):
+                return node
+
+    def _ping(self, node):
+        start = time.perf_counter()
+        try:
+            node.conn.ping(timeout=self.ping_timeout)
+        except Exception:
+            self._drop(node)
+            return False
+        rtt = time.perf_counter() - start
+        node.rtt = rtt if node.rtt is None else node.rtt + self.RTT_WEIGHT * (rtt - node.rtt)
+        return True
+
+    def _drop(self, node):
+        with self._lock:
+            if self._nodes.get(node.addr) is node:
+                del self._nodes[node.addr]
+        if node.conn is not None:
+            try:
+                node.conn.close()
+            except Exception:
+                pass
@@ -5,8 +5,9 @@ import time
 from rpyc.lib import spawn
 from rpyc.lib.colls import WeakValueDict
 from rpyc.lib.compat import callable
-from rpyc.core.consts import HANDLE_BUFFITER, HANDLE_CALL
-from rpyc.core.netref import syncreq, asyncreq
+from rpyc.core.consts import HANDLE_BUFFITER, HANDLE_CALL, HANDLE_CALLPATH
+from rpyc.core.netref import syncreq
+from rpyc.core.async_ import AsyncResult
 
 
 def buffiter(obj, chunk=10, max_chunk=1000, factor=2):
@@ -99,7 +100,13 @@ class _Async(object):
         self.proxy = proxy
 
     def __call__(self, *args, **kwargs):
-        return asyncreq(self.proxy, HANDLE_CALL, args, tuple(kwargs.items()))
+        proxy = self.proxy
+        if type(proxy) is AsyncResult:
+            conn = proxy._conn  # calling a promise
+        else:
+            conn = object.__getattribute__(proxy, "____conn__")
+        return conn.async_request(HANDLE_CALL, proxy, args, tuple(kwargs.items()),
+                                  pipeline=conn._config["promise_pipelining"])
 
     def __repr__(self):
         return f"async_({self.proxy!r})"
@@ -114,7 +121,7 @@ def async_(proxy):
     proxy will not block; instead it will return an
     :class:`rpyc.core.async_.AsyncResult` object that you can test for completion
 
-    :param proxy: any **callable** RPyC proxy
+    :param proxy: any **callable** RPyC proxy, or a promise (see below)
 
     :returns: the proxy, wrapped by an asynchronous wrapper
 
@@ -123,6 +130,21 @@ def async_(proxy):
         async_sleep = rpyc.async_(conn.modules.time.sleep)
         res = async_sleep(5)
 
+    When the connection's ``promise_pipelining`` is enabled, the returned
+    :class:`~rpyc.core.async_.AsyncResult` is a promise: it can be passed as an argument
+    of further requests, or wrapped by ``async_`` and called, before its result arrives,
+    and the other party uses the result it computed::
+
+        async_getattr = rpyc.async_(conn.builtins.getattr)
+        client = rpyc.async_(conn.modules.mylib.connect)("db")
+        query = async_getattr(client, "query")
+        rows = rpyc.async_(query)("select 1")
+        rows.value  # three dependent calls, in a single round trip
+
+    In a coroutine, the result may be awaited (``await async_sleep(5)``); see
+    :class:`rpyc.core.protocol.AsyncioConnection` for connections that are served by an
+    :mod:`asyncio` event loop.
+
     .. _async_note:
 
     .. note::
@@ -144,9 +166,12 @@ def async_(proxy):
     pid = id(proxy)
     if pid in _async_proxies_cache:
         return _async_proxies_cache[pid]
-    if not hasattr(proxy, "____conn__") or not hasattr(proxy, "____id_pack__"):
+    if type(proxy) is AsyncResult:
+        if proxy._promise_seq is None:
+            raise TypeError(f"'proxy' must be a promise (see promise_pipelining): {proxy!r}")
+    elif not hasattr(proxy, "____conn__") or not hasattr(proxy, "____id_pack__"):
         raise TypeError(f"'proxy' must be a Netref: {proxy!r}")
-    if not callable(proxy):
+    elif not callable(proxy):
         raise TypeError(f"'proxy' must be callable: {proxy!r}")
     caller = _Async(proxy)
     _async_proxies_cache[id(caller)] = _async_proxies_cache[pid] = caller
@@ -189,6 +214,43 @@ class timed(object):
         return f"timed({self.proxy.proxy!r}, {self.timeout!r})"
 
 
+class attrpath(object):
+    """Creates a lazy attribute path over a proxy. Getting attributes of the path
+    does not access the network; calling it gets the attributes and calls the last
+    one on the other party, in a single request (``HANDLE_CALLPATH``), rather than a
+    request per attribute. Each attribute is subject to the attribute access rules
+    of the other party, like getting it from the proxy.
+
+    :param proxy: any RPyC proxy
+
+    :returns: an ``attrpath`` of the proxy
+
+    Example::
+
+        getsize = rpyc.attrpath(conn.modules.os).path.getsize
+        getsize("/etc/passwd")  # a single request
+
+    .. note::
+       The attributes ``_proxy`` and ``_names`` cannot be part of a path. The other
+       party must support ``HANDLE_CALLPATH``.
+    """
+
+    __slots__ = ("_proxy", "_names")
+
+    def __init__(self, proxy, _names=()):
+        self._proxy = proxy
+        self._names = _names
+
+    def __getattr__(self, name):
+        return attrpath(self._proxy, self._names + (name,))
+
+    def __call__(self, *args, **kwargs):
+        return syncreq(self._proxy, HANDLE_CALLPATH, self._names, args, tuple(kwargs.items()))
+
+    def __repr__(self):
+        return "".join([f"attrpath({self._proxy!r})"] + [f".{name}" for name in self._names])
+
+
 class BgServingThread(object):
     """Runs an RPyC server in the background to serve all requests and replies
     that arrive on the given RPyC connection. The thread is started upon the
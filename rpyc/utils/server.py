@@ -8,12 +8,16 @@ import time
 import threading  # noqa: F401
 import errno
 import logging
+import asyncio
+import weakref
 from contextlib import closing
+from functools import partial
 try:
     import Queue
 except ImportError:
     import queue as Queue
-from rpyc.core import SocketStream, Channel
+from rpyc.core import SocketStream, Channel, AsyncioSocketStream, AsyncioConnection
+from rpyc.core import stats
 from rpyc.utils.registry import UDPRegistryClient
 from rpyc.utils.authenticators import AuthenticationError
 from rpyc.lib import safe_import, spawn, spawn_waitready
@@ -66,6 +70,7 @@ class Server(object):
 
         self.protocol_config = protocol_config
         self.clients = set()
+        self._connections = weakref.WeakSet()
 
         if socket_path is not None:
             if hostname is not None or port != 0 or ipv6 is not False:
@@ -130,6 +135,14 @@ class Server(object):
         self.clients.clear()
         self._closed = True
 
+    def stats(self):
+        """Returns the statistics of the server's open connections, aggregated (see
+        :func:`Connection.stats <rpyc.core.protocol.Connection.stats>` and
+        :func:`rpyc.core.stats.merge`). Set ``collect_stats`` in the ``protocol_config`` to
+        collect the counters and latencies. The connections of a :class:`ForkingServer` are
+        served by its child processes, so they are not included."""
+        return stats.merge(conn.stats() for conn in list(self._connections) if not conn.closed)
+
     def fileno(self):
         """returns the listener socket's file descriptor"""
         return self.listener.fileno()
@@ -202,6 +215,7 @@ class Server(object):
             config = dict(self.protocol_config, credentials=credentials,
                           endpoints=(sock.getsockname(), addrinfo), logger=self.logger)
             conn = self.service._connect(Channel(SocketStream(sock)), config)
+            self._connections.add(conn)
             self._handle_connection(conn)
         finally:
             self.logger.info(f"goodbye {addrinfo}")
@@ -481,7 +495,9 @@ class ThreadPoolServer(Server):
         addrinfo = sock.getpeername()
         config = dict(self.protocol_config, credentials=credentials, connid="{}".format(addrinfo),
                       endpoints=(sock.getsockname(), addrinfo))
-        return sock, self.service._connect(Channel(SocketStream(sock)), config)
+        conn = self.service._connect(Channel(SocketStream(sock)), config)
+        self._connections.add(conn)
+        return sock, conn
 
     def _accept_method(self, sock):
         '''Implementation of the accept method : only pushes the work to the internal queue.
@@ -569,3 +585,146 @@ class GeventServer(Server):
 
     def _accept_method(self, sock):
         gevent.spawn(self._authenticate_and_serve_client, sock)
+
+
+class AsyncioServer(Server):
+    """
+    A server that serves all of its connections on a single :mod:`asyncio` event loop
+    (see :class:`~rpyc.core.protocol.AsyncioConnection`): idle connections cost no thread.
+    Incoming requests are handled inline, in the loop thread, which suits cheap handlers;
+    pass an *executor* for handlers that block. Authentication (e.g., an SSL handshake)
+    runs on the *executor* (or the loop's default executor).
+
+    Use :meth:`start` to run the server on a new event loop (blocking), or await
+    :meth:`serve` to run it on the current loop.
+
+    Parameters: see :class:`Server`, plus
+
+    :param executor: a :class:`concurrent.futures.Executor` on which requests are handled,
+                     or ``None`` (the default) to handle them in the loop thread
+    """
+
+    close_timeout = 5  # seconds that close() waits for the event loop to stop the server
+
+    def __init__(self, *args, **kwargs):
+        self.executor = kwargs.pop('executor', None)
+        Server.__init__(self, *args, **kwargs)
+        self._loop = None
+        self._serve_task = None
+        self._client_tasks = set()
+        self._stopped = threading.Event()
+
+    def close(self):
+        """Closes the server and all of its clients; may be called from any thread"""
+        if self._closed:
+            return
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            Server.close(self)
+            return
+        try:
+            in_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            in_loop = False
+        if in_loop:
+            self._shutdown()
+            return
+        try:
+            loop.call_soon_threadsafe(self._shutdown)
+        except RuntimeError:
+            pass  # the loop was closed meanwhile
+        if not self._stopped.wait(self.close_timeout):
+            # the loop is stuck (e.g., in a blocking handler) or gone
+            self.logger.warning("the event loop did not stop the server in time")
+            Server.close(self)
+
+    def _shutdown(self):
+        self.active = False
+        for c in set(self.clients):
+            try:
+                c.shutdown(socket.SHUT_RDWR)  # the connections close on EOF
+            except Exception:
+                pass
+        if self._serve_task is not None:
+            self._serve_task.cancel()
+
+    def start(self):
+        """Starts the server on a new event loop (blocking). Use :meth:`close` to stop"""
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            print("")
+            self.logger.warn("keyboard interrupt!")
+            self.close()
+
+    async def serve(self):
+        """Serves clients on the running event loop, until the server is closed"""
+        self._loop = asyncio.get_running_loop()
+        self._serve_task = asyncio.current_task()
+        self._stopped.clear()
+        self._listen()
+        self._register()
+        self.listener.setblocking(False)
+        try:
+            while self.active:
+                sock, addrinfo = await self._loop.sock_accept(self.listener)
+                sock.setblocking(True)
+                self.logger.info(f"accepted {addrinfo} with fd {sock.fileno()}")
+                self.clients.add(sock)
+                task = self._loop.create_task(self._authenticate_and_serve_client_async(sock))
+                self._client_tasks.add(task)
+                task.add_done_callback(self._client_tasks.discard)
+        except asyncio.CancelledError:
+            pass  # server closed
+        finally:
+            self._serve_task = None
+            self._shutdown()
+            try:
+                if self._client_tasks:
+                    await asyncio.gather(*self._client_tasks, return_exceptions=True)
+            finally:
+                self.logger.info("server has terminated")
+                Server.close(self)
+                self._stopped.set()
+
+    async def _authenticate_and_serve_client_async(self, sock):
+        try:
+            if self.authenticator:
+                addrinfo = sock.getpeername()
+                try:
+                    sock2, credentials = await self._loop.run_in_executor(self.executor, self.authenticator, sock)
+                except AuthenticationError:
+                    self.logger.info(f"{addrinfo} failed to authenticate... rejecting connection")
+                    return
+                else:
+                    self.logger.info(f"{addrinfo} authenticated successfully")
+            else:
+                credentials = None
+                sock2 = sock
+            try:
+                await self._serve_client_async(sock2, credentials)
+            except Exception:
+                self.logger.exception("client connection terminated abruptly")
+        finally:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+            sock.close()
+            self.clients.discard(sock)
+
+    async def _serve_client_async(self, sock, credentials):
+        addrinfo = sock.getpeername()
+        if credentials:
+            self.logger.info(f"welcome {addrinfo} ({credentials!r})")
+        else:
+            self.logger.info(f"welcome {addrinfo}")
+        try:
+            config = dict(self.protocol_config, credentials=credentials,
+                          endpoints=(sock.getsockname(), addrinfo), logger=self.logger)
+            protocol = partial(AsyncioConnection, loop=self._loop, executor=self.executor)
+            conn = self.service._connect(Channel(AsyncioSocketStream(sock)), config, protocol=protocol)
+            self._connections.add(conn)
+            await conn.wait_closed()
+        finally:
+            self.logger.info(f"goodbye {addrinfo}")
@@ -0,0 +1,98 @@
+import asyncio
+import socket
+import sys
+import time
+import rpyc
+from rpyc.core.channel import Channel
+from rpyc.core.protocol import DEFAULT_CONFIG
+from rpyc.core.stream import AsyncioSocketStream
+from rpyc.utils.server import ThreadedServer
+from rpyc import SlaveService
+import unittest
+
+
+@unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "AsyncioConnection does not support bind_threads")
+class Test_AsyncioConnection(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadedServer(SlaveService, port=0, auto_register=False)
+        self.server.logger.quiet = True
+        self.server._start_in_thread()
+
+    def tearDown(self):
+        self.server.close()
+
+    def run_with_connection(self, func):
+        async def main():
+            conn = await rpyc.asyncio_connect("localhost", self.server.port, service=rpyc.MasterService)
+            try:
+                return await func(conn)
+            finally:
+                conn.close()
+        return asyncio.run(main())
+
+    def test_await(self):
+        async def func(conn):
+            a_abs = rpyc.async_(conn.builtins.abs)
+            return await asyncio.gather(*[a_abs(-i) for i in range(100)])
+        self.assertEqual(self.run_with_connection(func), list(range(100)))
+
+    def test_sync_access(self):
+        async def func(conn):
+            conn.execute("x = 5")
+            return conn.eval("1 + x"), conn.modules.sys.platform
+        self.assertEqual(self.run_with_connection(func), (6, sys.platform))
+
+    def test_exception(self):
+        async def func(conn):
+            a_int = rpyc.async_(conn.builtins.int)
+            with self.assertRaises(ValueError):
+                await a_int("foo")
+        self.run_with_connection(func)
+
+    def test_loop_not_blocked(self):
+        async def func(conn):
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.time())
+                    await asyncio.sleep(0.05)
+            a_sleep = rpyc.async_(conn.modules.time.sleep)
+            await asyncio.gather(a_sleep(0.5), ticker())
+            return ticks
+        self.assertEqual(len(self.run_with_connection(func)), 5)
+
+    def test_expiry(self):
+        async def func(conn):
+            a_sleep = rpyc.async_(conn.modules.time.sleep)
+            res = a_sleep(1)
+            res.set_expiry(0.1)
+            with self.assertRaises(rpyc.AsyncResultTimeout):
+                await res
+        self.run_with_connection(func)
+
+    def test_wait_closed(self):
+        async def func(conn):
+            conn.close()
+            await asyncio.wait_for(conn.wait_closed(), 1)
+            return conn.closed
+        self.assertTrue(self.run_with_connection(func))
+
+
+class Test_AsyncioConnectionConfig(unittest.TestCase):
+    def test_bind_threads(self):
+        async def main():
+            sock, other = socket.socketpair()
+            try:
+                with self.assertRaises(ValueError):
+                    rpyc.AsyncioConnection(rpyc.VoidService(), Channel(AsyncioSocketStream(sock)),
+                                           dict(bind_threads=True))
+            finally:
+                sock.close()
+                other.close()
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import rpyc
+import time
+from concurrent.futures import ThreadPoolExecutor
+from rpyc.core.protocol import DEFAULT_CONFIG
+from rpyc.utils.server import AsyncioServer
+from rpyc import SlaveService
+import unittest
+
+
+@unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "AsyncioConnection does not support bind_threads")
+class Test_AsyncioServer(unittest.TestCase):
+    executor = None
+
+    def setUp(self):
+        self.server = AsyncioServer(SlaveService, port=0, auto_register=False, executor=self.executor)
+        self.server.logger.quiet = False
+        self.server._start_in_thread()
+
+    def tearDown(self):
+        self.server.close()
+        self.assertFalse(self.server.clients)
+
+    def test_connection(self):
+        conn = rpyc.classic.connect("localhost", port=self.server.port)
+        print(conn.modules.sys)
+        print(conn.modules["xml.dom.minidom"].parseString("<a/>"))
+        conn.execute("x = 5")
+        self.assertEqual(conn.namespace["x"], 5)
+        self.assertEqual(conn.eval("1+x"), 6)
+        conn.close()
+
+    def test_many_connections(self):
+        conns = [rpyc.classic.connect("localhost", port=self.server.port) for _ in range(20)]
+        for i, conn in enumerate(conns):
+            self.assertEqual(conn.builtins.abs(-i), i)
+        for conn in conns:
+            conn.close()
+
+    def test_callback(self):
+        conn = rpyc.classic.connect("localhost", port=self.server.port)
+        self.assertEqual(conn.builtins.sum(map(lambda x: x * 2, range(3))), 6)
+        conn.close()
+
+    def test_close_with_clients(self):
+        conn = rpyc.classic.connect("localhost", port=self.server.port)
+        self.assertEqual(conn.eval("1+1"), 2)
+        self.server.close()
+        time.sleep(0.1)
+        with self.assertRaises(EOFError):
+            conn.eval("1+1")
+
+    def test_close_timeout(self):
+        conn = rpyc.classic.connect("localhost", port=self.server.port)
+        a_sleep = rpyc.async_(conn.modules.time.sleep)
+        a_sleep(1)  # blocks the loop thread, unless there is an executor
+        time.sleep(0.1)
+        self.server.close_timeout = 0.3
+        t0 = time.time()
+        self.server.close()
+        self.assertLess(time.time() - t0, 0.9)
+        conn.close()
+
+
+@unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "AsyncioConnection does not support bind_threads")
+class Test_AsyncioServerExecutor(Test_AsyncioServer):
+    executor = ThreadPoolExecutor(4)
+
+    def test_blocking_handlers(self):
+        conns = [rpyc.classic.connect("localhost", port=self.server.port) for _ in range(4)]
+        results = [rpyc.async_(conn.modules.time.sleep) for conn in conns]
+        t0 = time.time()
+        results = [a_sleep(0.3) for a_sleep in results]
+        for res in results:
+            res.wait()
+        self.assertLess(time.time() - t0, 1.0)
+        for conn in conns:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -118,6 +118,12 @@ class TestRestricted(unittest.TestCase):
         self.assertEqual(obj._privy(), "privy")
         self.assertRaises(AttributeError, lambda: obj.spam)
 
+    def test_attrpath(self):
+        path = rpyc.attrpath(self.conn.root).get_one
+        self.assertEqual(path().foo(), "foo")
+        self.assertEqual(rpyc.attrpath(path()).foo(), "foo")
+        self.assertRaises(AttributeError, rpyc.attrpath(path()).spam)
+
 
 class TestConfigAllows(unittest.TestCase):
     def setUp(self):
@@ -153,6 +159,12 @@ class TestConfigAllows(unittest.TestCase):
         self.assertRaises(AttributeError, lambda: obj.bar)
         self.assertRaises(AttributeError, lambda: obj.spam)
 
+    def test_attrpath_default_config(self):
+        obj = self._get_myclass(self.cfg)
+        self.assertEqual(rpyc.attrpath(obj).foobar(), "Fee Fie Foe Foo")
+        self.assertRaises(AttributeError, rpyc.attrpath(obj)._privy)
+        self.assertRaises(AttributeError, rpyc.attrpath(self.conn.root).MyClass.foo, obj)
+
     def test_allow_all(self):
         self._reset_cfg()
         self.cfg['allow_all_attrs'] = True
@@ -0,0 +1,67 @@
+import os
+import time
+import rpyc
+import unittest
+from rpyc.core import consts
+
+
+class TestAttrCache(unittest.TestCase):
+    def setUp(self):
+        config = dict(netref_attr_cache=True, netref_attr_cache_modules=frozenset(["os"]))
+        self.conn = rpyc.utils.factory.connect_thread(rpyc.ClassicService, config=config,
+                                                      remote_service=rpyc.ClassicService)
+        self.requests = []
+        sync_request = self.conn.sync_request
+
+        def counting_sync_request(handler, *args):
+            self.requests.append(handler)
+            return sync_request(handler, *args)
+        self.conn.sync_request = counting_sync_request
+
+    def tearDown(self):
+        self.conn.close()
+
+    def getattr_count(self):
+        return self.requests.count(consts.HANDLE_GETATTR)
+
+    def test_module_attrs(self):
+        ros = self.conn.modules.os
+        path = ros.path
+        self.assertEqual(self.getattr_count(), 1)
+        self.assertIs(ros.path, path)
+        self.assertIs(ros.path.join, ros.path.join)  # a function
+        self.assertEqual(self.getattr_count(), 2)
+        self.assertEqual(ros.path.join("a", "b"), os.path.join("a", "b"))
+
+    def test_mutable_attrs_not_cached(self):
+        self.conn.execute("class Foo(object):\n    counter = 0")
+        foo = self.conn.namespace["Foo"]()
+        self.assertEqual(foo.counter, 0)
+        self.conn.execute("Foo.counter = 1")
+        self.assertEqual(foo.counter, 1)
+
+    def test_invalidation(self):
+        ros = self.conn.modules.os
+        ros.sep
+        ros.sep
+        self.assertEqual(self.getattr_count(), 1)
+        self.conn.invalidate_attr_cache(ros, "sep")
+        ros.sep
+        self.assertEqual(self.getattr_count(), 2)
+        self.conn.invalidate_attr_cache()
+        ros.sep
+        self.assertEqual(self.getattr_count(), 3)
+
+    def test_ttl(self):
+        self.conn._config["netref_attr_cache_ttl"] = 0.2
+        ros = self.conn.modules.os
+        ros.sep
+        ros.sep
+        self.assertEqual(self.getattr_count(), 1)
+        time.sleep(0.3)
+        ros.sep
+        self.assertEqual(self.getattr_count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import rpyc
+from rpyc.utils.factory import DiscoveryError
+from rpyc.utils.server import ThreadedServer
+from rpyc import SlaveService
+import unittest
+
+
+class StaticRegistrar(object):
+    """a registry client that discovers a fixed list of servers"""
+
+    def __init__(self, addrs):
+        self.addrs = addrs
+
+    def discover(self, name):
+        return list(self.addrs)
+
+
+class Test_ServiceBalancer(unittest.TestCase):
+    def setUp(self):
+        self.servers = []
+        for _ in range(3):
+            server = ThreadedServer(SlaveService, hostname="localhost", port=0, auto_register=False)
+            server.logger.quiet = True
+            server._start_in_thread()
+            self.servers.append(server)
+        self.registrar = StaticRegistrar([("localhost", server.port) for server in self.servers])
+
+    def tearDown(self):
+        for server in self.servers:
+            server.close()
+
+    def test_least_outstanding(self):
+        with rpyc.ServiceBalancer("SLAVE", registrar=self.registrar, service=rpyc.ClassicService) as balancer:
+            busy = []
+            for _ in range(3):
+                with balancer.connection() as conn:
+                    # keep a request outstanding, so that the next connection goes to another server
+                    busy.append(rpyc.async_(conn.modules.time.sleep)(0.5))
+            self.assertEqual(sorted(addr[1] for addr in balancer.stats()), sorted(s.port for s in self.servers))
+            outstanding = [stat["outstanding"] for stat in balancer.stats().values()]
+            self.assertTrue(outstanding[0] > 0 and outstanding.count(outstanding[0]) == 3, outstanding)
+            self.assertEqual(len(set(res._conn for res in busy)), 3)
+            for res in busy:
+                res.wait()
+            self.assertTrue(all(stat["rtt"] > 0 for stat in balancer.stats().values()))
+
+    def test_two_choices(self):
+        with rpyc.ServiceBalancer("SLAVE", registrar=self.registrar, service=rpyc.ClassicService,
+                                  strategy="two_choices") as balancer:
+            for _ in range(10):
+                self.assertEqual(balancer.call(lambda conn: conn.eval("1 + 1")), 2)
+
+    def test_failover(self):
+        with rpyc.ServiceBalancer("SLAVE", registrar=self.registrar, service=rpyc.ClassicService) as balancer:
+            first = []
+
+            def fail_once(conn):
+                if not first:
+                    first.append(conn)
+                    conn._channel.stream.close()  # the connection drops
+                return conn.eval("2 * 3")
+            self.assertEqual(balancer.call(fail_once), 6)
+            self.assertEqual(len(balancer.stats()), 2)
+            # until the next refresh
+            balancer.refresh()
+            self.assertEqual(len(balancer.stats()), 3)
+            balancer.close()
+            self.registrar.addrs = []
+            self.assertRaises(DiscoveryError, balancer.call, fail_once)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import rpyc
+from rpyc.core.protocol import DEFAULT_CONFIG
+import unittest
+
+
+class CountingChannel(object):
+    """wraps a channel and counts the frames sent over it"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.sent = 0
+
+    def send(self, data):
+        self.sent += 1
+        self.channel.send(data)
+
+    def __getattr__(self, name):
+        return getattr(self.channel, name)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.conn = rpyc.classic.connect_thread()
+        self.a_abs = rpyc.async_(self.conn.builtin.abs)
+        self.a_int = rpyc.async_(self.conn.builtin.int)
+        self.channel = self.conn._channel = CountingChannel(self.conn._channel)
+
+    def tearDown(self):
+        self.conn.close()
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "batch() sends messages as they come with bind_threads")
+    def test_batch_single_frame(self):
+        with self.conn.batch():
+            results = [self.a_abs(-i) for i in range(50)]
+            self.assertEqual(self.channel.sent, 0)
+        self.assertEqual(self.channel.sent, 1)
+        self.assertEqual([res.value for res in results], list(range(50)))
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "batch() sends messages as they come with bind_threads")
+    def test_batch_max_messages(self):
+        self.conn._config["batch_max_messages"] = 10
+        with self.conn.batch():
+            results = [self.a_abs(-i) for i in range(25)]
+        self.assertEqual(self.channel.sent, 3)
+        self.assertEqual([res.value for res in results], list(range(25)))
+
+    def test_batch_exceptions(self):
+        with self.conn.batch():
+            good = self.a_int("17")
+            bad = self.a_int("foo")
+        self.assertEqual(good.value, 17)
+        self.assertRaises(ValueError, lambda: bad.value)
+
+    def test_batch_sync_request_flushes(self):
+        with self.conn.batch():
+            res = self.a_abs(-5)
+            self.assertEqual(self.conn.eval("1 + 2"), 3)
+            self.assertEqual(res.value, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
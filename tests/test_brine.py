@@ -16,6 +16,69 @@ class BrineTest(unittest.TestCase):
         z = brine.load(y)
         self.assertEqual(x, z)  # noqa
 
+    def test_load_buffer(self):
+        x = (b"x" * 100000, "llo", 900, (1.5, None), frozenset([b"ab"]))
+        y = brine.dump(x)
+        self.assertEqual(brine.load(bytearray(y)), x)
+        self.assertEqual(brine.load(memoryview(b"\x00" + y)[1:]), x)
+
+    def test_containers(self):
+        x = ([1, b"a", (2, [3.5])], {"a": [1], 2: {b"c": None}}, {1, "b", (2, 3)},
+             bytearray(b"xyz"), [], {}, set(), [0] * 300)
+        self.assertFalse(brine.dumpable(x))
+        self.assertTrue(brine.dumpable(x, containers=True))
+        z = brine.load(brine.dump(x))
+        self.assertEqual(z, x)
+        self.assertEqual([type(item) for item in z], [type(item) for item in x])
+        view = brine.load(brine.dump(memoryview(b"abcd")[1:3]))
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.tobytes(), b"bc")
+
+    def test_containers_not_dumpable(self):
+        self.assertFalse(brine.dumpable([1, object()], containers=True))
+        self.assertFalse(brine.dumpable({"a": {1: object()}}, containers=True))
+        self.assertFalse(brine.dumpable(memoryview(b"abcd").cast("I"), containers=True))
+        cycle = [1, 2]
+        cycle.append((3, cycle))
+        self.assertFalse(brine.dumpable(cycle, containers=True))
+        shared = [1]
+        self.assertTrue(brine.dumpable([shared, shared], containers=True))
+
+    def test_deep_nesting(self):
+        x = ()
+        for i in range(100000):
+            x = (i, x) if i % 2 else [x, {b"k": i}]
+        self.assertTrue(brine.dumpable(x, containers=True))
+        y = brine.load(brine.dump(x))
+        for i in reversed(range(100000)):
+            if i % 2:
+                self.assertEqual(y[0], i)
+                y = y[1]
+            else:
+                self.assertEqual(y[1], {b"k": i})
+                y = y[0]
+        self.assertEqual(y, ())
+
+    def test_load_invalid(self):
+        self.assertRaises(ValueError, brine.load, b"\x07")
+        self.assertRaises(TypeError, brine.dump, (1, object()))
+
+    def test_load_malformed(self):
+        # a unicode tag must be followed by a string tag
+        self.assertRaises(ValueError, brine.load, b"\x08\x10\x01")
+        self.assertRaises(ValueError, brine.load, b"\x08\x09")
+        # truncated data
+        self.assertRaises(ValueError, brine.load, b"\x08")
+        self.assertRaises(ValueError, brine.load, b"\x0e\x05ab")
+        self.assertRaises(ValueError, brine.load, b"\x14\x0e")
+        # containers of items they cannot hold, and wrappers of values they are not dumped with
+        self.assertRaises(ValueError, brine.load, b"\x1d\x11\x1c\x02Q")  # a dict with a list key
+        self.assertRaises(ValueError, brine.load, b"\x1e\x10\x1c\x02")  # a set of a list
+        self.assertRaises(ValueError, brine.load, b"\x19Q")  # a slice of an int
+        self.assertRaises(ValueError, brine.load, b"\x1aQ")  # a frozenset of an int
+        self.assertRaises(ValueError, brine.load, b"\x1c\x0aa")  # a list of a string
+        self.assertRaises(ValueError, brine.load, b"\x1d\x10Q")  # a dict of an odd number of items
+
 
 if __name__ == "__main__":
     unittest.main()
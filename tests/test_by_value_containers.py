@@ -0,0 +1,43 @@
+import unittest
+
+import rpyc
+from rpyc.core import netref
+from rpyc.utils.factory import connect_thread
+
+
+class Test_ByValueContainers(unittest.TestCase):
+    def setUp(self):
+        config = dict(by_value_containers=True)
+        self.conn = connect_thread(rpyc.ClassicService, config, rpyc.ClassicService, config)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_returned_by_value(self):
+        remote_list = self.conn.eval("[1, 'a', (2, [3])]")
+        self.assertIs(type(remote_list), list)
+        self.assertEqual(remote_list, [1, "a", (2, [3])])
+        remote_dict = self.conn.eval("{'a': {1, 2}, 'b': bytearray(b'xy')}")
+        self.assertIs(type(remote_dict), dict)
+        self.assertEqual(remote_dict, {"a": {1, 2}, "b": bytearray(b"xy")})
+
+    def test_passed_by_value(self):
+        remote_len = self.conn.builtins.len
+        self.assertEqual(remote_len([1, 2, 3]), 3)
+        self.conn.execute("def mutate(items):\n    items.append(3)\n    return type(items) is list")
+        items = [1, 2]
+        self.assertTrue(self.conn.eval("mutate")(items))
+        self.assertEqual(items, [1, 2])
+
+    def test_not_dumpable_by_reference(self):
+        remote_list = self.conn.eval("[1, object()]")
+        self.assertIsInstance(remote_list, netref.BaseNetref)
+        self.assertEqual(len(remote_list), 2)
+
+    def test_disabled_by_default(self):
+        with rpyc.classic.connect_thread() as conn:
+            self.assertIsInstance(conn.eval("[1, 2]"), netref.BaseNetref)
+
+
+if __name__ == "__main__":
+    unittest.main()
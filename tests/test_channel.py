@@ -0,0 +1,180 @@
+import rpyc
+from rpyc.core.channel import Channel
+from rpyc.core.stream import PipeStream, SocketStream
+import os
+import socket
+import threading
+import unittest
+
+
+class RecordingStream(object):
+    """a stream that records the frames written to it"""
+
+    def __init__(self):
+        self.frames = []
+
+    def writev(self, buffers):
+        self.frames.append(b"".join(buffers))
+
+
+class TestChannel(unittest.TestCase):
+    def _check_roundtrip(self, stream1, stream2):
+        chan1, chan2 = Channel(stream1), Channel(stream2)
+        # an incompressible payload larger than a single I/O chunk
+        payload = bytes(range(256)) * 4000
+        payloads = [b"", b"hello", b"x" * 10000, payload]
+        sender = threading.Thread(target=lambda: [chan1.send(data) for data in payloads])
+        sender.start()
+        try:
+            for data in payloads:
+                self.assertEqual(bytes(chan2.recv()), data)
+        finally:
+            sender.join()
+            chan1.close()
+            chan2.close()
+
+    def test_pipes(self):
+        self._check_roundtrip(*PipeStream.create_pair())
+
+    def test_sockets(self):
+        sock1, sock2 = socket.socketpair()
+        self._check_roundtrip(SocketStream(sock1), SocketStream(sock2))
+
+    def test_recv_into(self):
+        sock1, sock2 = socket.socketpair()
+        chan1, chan2 = Channel(SocketStream(sock1)), Channel(SocketStream(sock2))
+        try:
+            buf = bytearray(20000)
+            chan1.send(b"hello", compress=False)
+            self.assertEqual(chan2.recv_into(memoryview(buf)), 5)
+            chan1.send(b"x" * 10000)  # compressed
+            self.assertEqual(chan2.recv_into(memoryview(buf)[5:]), 10000)
+            self.assertEqual(buf[:10005], b"hello" + b"x" * 10000)
+            chan1.send(b"spam", compress=False)
+            self.assertRaises(ValueError, chan2.recv_into, memoryview(buf)[:3])
+        finally:
+            chan1.close()
+            chan2.close()
+
+    def test_writev_partial(self):
+        sock1, sock2 = socket.socketpair()
+        sock1.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        stream1, stream2 = SocketStream(sock1), SocketStream(sock2)
+        buffers = [b"a" * 100001, b"", b"b", bytearray(b"c" * 70000), memoryview(b"d" * 3)]
+        expected = b"".join(buffers)
+        writer = threading.Thread(target=stream1.writev, args=(buffers,))
+        writer.start()
+        try:
+            self.assertEqual(bytes(stream2.read(len(expected))), expected)
+        finally:
+            writer.join()
+            stream1.close()
+            stream2.close()
+
+
+class TestCompression(unittest.TestCase):
+    def _sent_codec_ids(self, channel, payloads):
+        stream = channel.stream = RecordingStream()
+        for data in payloads:
+            channel.send(data)
+        return [Channel.FRAME_HEADER.unpack(frame[:Channel.FRAME_HEADER.size])[1] for frame in stream.frames]
+
+    def test_codecs(self):
+        payload = b"spam and eggs " * 1000
+        for codec, codec_id in (("zlib", 1), ("bz2", 2), ("lzma", 3)):
+            stream1, stream2 = PipeStream.create_pair()
+            chan1, chan2 = Channel(stream1, codec=codec), Channel(stream2)
+            try:
+                self.assertEqual(self._sent_codec_ids(chan1, [payload]), [codec_id])
+                stream1.write(chan1.stream.frames[0])
+                self.assertEqual(bytes(chan2.recv()), payload)
+            finally:
+                stream1.close()
+                stream2.close()
+
+    def test_threshold_and_disabled(self):
+        channel = Channel(None, threshold=100)
+        self.assertEqual(self._sent_codec_ids(channel, [b"a" * 100, b"a" * 101]), [0, 1])
+        channel.set_compression(False)
+        self.assertEqual(self._sent_codec_ids(channel, [b"a" * 5000]), [0])
+        self.assertRaises(ValueError, channel.set_compression, "nosuchcodec")
+
+    def test_adaptive(self):
+        random_data = os.urandom(10000)
+        channel = Channel(None, adaptive=True)
+        self.assertEqual(self._sent_codec_ids(channel, [random_data]), [0])
+        # after a poor ratio, compression is not even attempted for a while
+        self.assertEqual(channel._backoff, Channel.ADAPTIVE_BACKOFF)
+        ids = self._sent_codec_ids(channel, [b"a" * 5000] * Channel.ADAPTIVE_BACKOFF)
+        self.assertEqual(ids, [0] * Channel.ADAPTIVE_BACKOFF)
+        self.assertEqual(self._sent_codec_ids(channel, [b"a" * 5000]), [1])
+
+    def test_connection_config(self):
+        conn = rpyc.classic.connect_thread()
+        try:
+            self.assertEqual(conn._channel.codec, "zlib")
+        finally:
+            conn.close()
+        conn = rpyc.utils.factory.connect_thread(rpyc.ClassicService, config=dict(compression_codec="lzma"),
+                                                 remote_service=rpyc.ClassicService)
+        try:
+            self.assertEqual(conn._channel.codec, "lzma")
+            self.assertEqual(len(conn.builtins.bytes(10000)), 10000)
+        finally:
+            conn.close()
+
+
+class TestFragments(unittest.TestCase):
+    def setUp(self):
+        self.stream1, self.stream2 = PipeStream.create_pair()
+        self.chan1 = Channel(self.stream1, fragment_size=1000)
+        self.chan2 = Channel(self.stream2)
+
+    def tearDown(self):
+        self.chan1.close()
+        self.chan2.close()
+
+    def test_roundtrip(self):
+        payload = os.urandom(10500)
+        sender = threading.Thread(target=self.chan1.send, args=(payload,))
+        sender.start()
+        try:
+            self.assertEqual(bytes(self.chan2.recv()), payload)
+        finally:
+            sender.join()
+        self.assertEqual(self.chan2._partial, {})
+
+    def test_interleaved(self):
+        payload = b"spam and eggs " * 300  # compressible fragments as well
+        fragments = self.chan1.send_fragments(payload)
+        next(fragments)
+        self.chan1.send(b"small")
+        self.assertIsNone(self.chan2.recv_frame())
+        self.assertEqual(bytes(self.chan2.recv_frame()), b"small")
+        for _ in fragments:
+            pass
+        self.assertEqual(bytes(self.chan2.recv()), payload)
+
+    def test_claimed_size(self):
+        # the buffer grows with the received fragments, whatever size they claim
+        self.chan1._send_frame(b"x" * 100, False, Channel.FRAGMENT_HEADER.pack(1, 2 ** 60))
+        self.assertIsNone(self.chan2.recv_frame())
+        self.assertEqual(len(self.chan2._partial[1]), 100)
+        self.chan1._send_frame(b"x" * 100, False, Channel.FRAGMENT_HEADER.pack(2, 50))
+        self.assertRaises(ValueError, self.chan2.recv_frame)
+
+    def test_connection_config(self):
+        conn = rpyc.utils.factory.connect_thread(rpyc.ClassicService, config=dict(fragment_size=4096),
+                                                 remote_service=rpyc.ClassicService,
+                                                 remote_config=dict(fragment_size=4096))
+        try:
+            self.assertEqual(conn._channel.fragment_size, 4096)
+            data = os.urandom(100000)
+            self.assertEqual(conn.builtins.bytes(data), data)
+            self.assertEqual(conn.builtins.len(data), len(data))
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
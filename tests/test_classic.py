@@ -36,6 +36,21 @@ class ClassicMode(unittest.TestCase):
         bi = rpyc.buffiter(self.conn.builtin.range(10000))
         self.assertEqual(list(bi), list(range(10000)))
 
+    def test_attrpath(self):
+        remote_os = self.conn.modules.os
+        requests = []
+        sync_request = self.conn.sync_request
+
+        def counting_sync_request(handler, *args, **kwargs):
+            requests.append(handler)
+            return sync_request(handler, *args, **kwargs)
+        self.conn.sync_request = counting_sync_request
+        join = rpyc.attrpath(remote_os).path.join
+        self.assertEqual(requests, [])
+        self.assertEqual(join("a", "b"), os.path.join("a", "b"))
+        self.assertEqual(requests, [rpyc.core.consts.HANDLE_CALLPATH])
+        self.assertRaises(AttributeError, rpyc.attrpath(remote_os).path.nonexistent)
+
     def test_classic(self):
         self.conn.execute("x = 5")
         self.assertEqual(self.conn.namespace["x"], 5)
@@ -0,0 +1,102 @@
+import rpyc
+from rpyc.core import consts, netref
+from rpyc.lib import get_methods
+from rpyc.utils.factory import connect_thread
+import unittest
+
+
+class Widget(object):
+    def __init__(self, value):
+        self.value = value
+
+    def double(self):
+        """doubles the value"""
+        return self.value * 2
+
+
+class Test_InlineMethods(unittest.TestCase):
+    def _connect(self, inline_methods):
+        conn = connect_thread(rpyc.ClassicService, dict(inline_methods=inline_methods), rpyc.ClassicService,
+                              dict(inline_methods=inline_methods))
+        self.addCleanup(conn.close)
+        self.inspected = []
+        sync_request = conn.sync_request
+
+        def counting_sync_request(handler, *args, **kwargs):
+            if handler == consts.HANDLE_INSPECT:
+                self.inspected.append(args[0])
+            return sync_request(handler, *args, **kwargs)
+        conn.sync_request = counting_sync_request
+        return conn
+
+    def test_inline(self):
+        conn = self._connect(True)
+        remote_widget = conn.modules[__name__].Widget
+        widgets = conn.eval("[__import__('sys').modules[%r].Widget(i) for i in range(5)]" % (__name__,))
+        self.assertEqual([w.double() for w in widgets], [0, 2, 4, 6, 8])
+        self.assertEqual(remote_widget(21).double(), 42)
+        self.assertEqual(self.inspected, [])
+
+    def test_patched_class(self):
+        conn = self._connect(True)
+        remote_widget = conn.modules[__name__].Widget
+        self.assertRaises(TypeError, len, remote_widget(1))
+        Widget.__len__ = lambda self: self.value  # the other party is in this process
+        try:
+            self.assertEqual(len(remote_widget(3)), 3)
+        finally:
+            del Widget.__len__
+        self.assertEqual(self.inspected, [])
+
+    def test_not_inline(self):
+        conn = self._connect(False)
+        widgets = conn.eval("[__import__('sys').modules[%r].Widget(i) for i in range(5)]" % (__name__,))
+        self.assertEqual([w.double() for w in widgets], [0, 2, 4, 6, 8])
+        self.assertTrue(self.inspected)
+
+
+class Test_Inspect(unittest.TestCase):
+    def test_memoized(self):
+        methods = get_methods(netref.LOCAL_ATTRS, Widget(1))
+        self.assertIn(("double", "doubles the value"), methods)
+        self.assertIs(get_methods(netref.LOCAL_ATTRS, Widget(2)), methods)
+        self.assertIsNot(get_methods(netref.LOCAL_ATTRS, Widget), methods)
+        self.assertIn(("double", None), get_methods(netref.LOCAL_ATTRS, Widget(1), docs=False))
+
+    def test_patched_class(self):
+        class Patched(Widget):
+            pass
+        methods = get_methods(netref.LOCAL_ATTRS, Patched(1))
+        self.assertNotIn("__len__", dict(methods))
+        Patched.__len__ = lambda self: self.value
+        self.assertIn("__len__", dict(get_methods(netref.LOCAL_ATTRS, Patched(1))))
+
+    def test_replaced_method(self):
+        class Patched(Widget):
+            def double(self):
+                """doubles the value"""
+                return self.value * 2
+        self.assertEqual(dict(get_methods(netref.LOCAL_ATTRS, Patched(1)))["double"], "doubles the value")
+
+        def double(self):
+            """doubles the value, again"""
+            return self.value * 2
+        Patched.double = double
+        self.assertEqual(dict(get_methods(netref.LOCAL_ATTRS, Patched(1)))["double"], "doubles the value, again")
+        Patched.double = 2  # no longer a method
+        self.assertNotIn("double", dict(get_methods(netref.LOCAL_ATTRS, Patched(1))))
+
+    def test_docstrings(self):
+        for inspect_docstrings, doc in ((True, "doubles the value"), (False, None)):
+            conn = connect_thread(rpyc.ClassicService, {}, rpyc.ClassicService,
+                                  dict(inspect_docstrings=inspect_docstrings))
+            try:
+                widget = conn.modules[__name__].Widget(4)
+                self.assertEqual(type(widget).double.__doc__, doc)  # of the netref class
+                self.assertEqual(widget.double(), 8)
+            finally:
+                conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
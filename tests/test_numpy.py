@@ -30,6 +30,12 @@ class TestNumpy(unittest.TestCase):
         self.assertEqual(remote_array[0], 0)
         self.assertIsInstance(remote_array[0], np.int64)
 
+    def test_out_of_band(self):
+        self.conn._config["pickle_out_of_band"] = True
+        remote_array = self.conn.root.create_array(np.arange(1000000))
+        self.assertTrue(np.array_equal(rpyc.classic.obtain(remote_array), np.arange(1000000)))
+        self.assertTrue(np.array_equal(np.asarray(remote_array), np.arange(1000000)))
+
 
 if __name__ == "__main__":
     unittest.main()
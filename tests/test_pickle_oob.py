@@ -0,0 +1,83 @@
+import pickle
+import unittest
+from unittest import mock
+
+import rpyc
+from rpyc.core import consts
+from rpyc.core.protocol import DEFAULT_CONFIG
+from rpyc.utils.factory import connect_thread
+
+
+def _rebuild_blob(data):
+    return Blob(data)
+
+
+class Blob(object):
+    """exposes its data to pickle protocol 5 as an out-of-band buffer, like NumPy arrays do"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, proto):
+        if proto >= 5:
+            return _rebuild_blob, (pickle.PickleBuffer(self.data),)
+        return _rebuild_blob, (bytes(self.data),)
+
+
+class Test_PickleOutOfBand(unittest.TestCase):
+    def setUp(self):
+        self.conn = connect_thread(rpyc.ClassicService, dict(allow_pickle=True, pickle_out_of_band=True),
+                                   rpyc.ClassicService, dict(allow_pickle=True))
+
+    def tearDown(self):
+        self.conn.close()
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "pickle_out_of_band is not available with bind_threads")
+    def test_obtain(self):
+        data = bytearray(range(256)) * (consts.OOB_CHUNK // 100)
+        remote_data = self.conn.eval(f"bytearray(range(256)) * {consts.OOB_CHUNK // 100}")
+        remote_blob = self.conn.modules[__name__].Blob(remote_data)
+        with mock.patch.object(self.conn, "_recv_out_of_band", wraps=self.conn._recv_out_of_band) as recv:
+            blob = rpyc.classic.obtain(remote_blob)
+        recv.assert_called_once_with(len(data))
+        self.assertIsInstance(blob, Blob)
+        self.assertIsInstance(blob.data, bytearray)
+        self.assertEqual(blob.data, data)
+        # the connection remains usable after the raw frames
+        self.assertEqual(self.conn.builtins.len(remote_blob.data), len(data))
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "pickle_out_of_band is not available with bind_threads")
+    def test_obtain_growing(self):
+        # a buffer larger than OOB_PREALLOC grows as its frames arrive
+        data = bytearray(range(256)) * (consts.OOB_CHUNK // 100)
+        remote_blob = self.conn.modules[__name__].Blob(self.conn.eval(f"bytearray({bytes(data)!r})"))
+        with mock.patch.object(consts, "OOB_PREALLOC", 1000):
+            blob = rpyc.classic.obtain(remote_blob)
+        self.assertEqual(blob.data, data)
+
+    def test_recv_exceeding_size(self):
+        def recv_into(view):
+            if len(view) < 10:
+                raise ValueError("frame exceeds its buffer")
+            view[:10] = b"x" * 10
+            return 10
+        with mock.patch.object(self.conn, "_channel") as channel:
+            channel.recv_into.side_effect = recv_into
+            self.assertEqual(self.conn._recv_out_of_band(20), b"x" * 20)
+            self.assertRaises(ValueError, self.conn._recv_out_of_band, 15)
+
+    def test_obtain_without_buffers(self):
+        remote_list = self.conn.eval("[1, 'a', (2.5,)]")
+        self.assertEqual(rpyc.classic.obtain(remote_list), [1, "a", (2.5,)])
+
+    def test_disabled(self):
+        self.conn._config["pickle_out_of_band"] = False
+        remote_blob = self.conn.modules[__name__].Blob(self.conn.eval("bytearray(b'xyz')"))
+        with mock.patch.object(self.conn, "_recv_out_of_band") as recv:
+            blob = rpyc.classic.obtain(remote_blob)
+        recv.assert_not_called()
+        self.assertEqual(blob.data, b"xyz")
+
+
+if __name__ == "__main__":
+    unittest.main()
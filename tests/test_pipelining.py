@@ -0,0 +1,86 @@
+import gc
+import rpyc
+from rpyc.core.protocol import DEFAULT_CONFIG
+from rpyc.utils.factory import connect_thread
+import unittest
+
+
+class Box(object):
+    def __init__(self, value):
+        self.value = value
+
+
+def unwrap(box):
+    return [box.value] * box.value
+
+
+@unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "promise pipelining is not available with bind_threads")
+class Test_PromisePipelining(unittest.TestCase):
+    def setUp(self):
+        config = dict(promise_pipelining=True)
+        self.conn = connect_thread(rpyc.ClassicService, config, rpyc.ClassicService, config)
+        self.server_conn = self.conn.root._conn
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_argument(self):
+        async_list = rpyc.async_(self.conn.builtins.list)
+        async_sum = rpyc.async_(self.conn.builtins.sum)
+        nums = async_list((1, 2, 3))
+        # nothing serves the connection until a value is waited for, so the second request is
+        # sent before the reply to the first one is received
+        total = async_sum(nums)
+        self.assertFalse(nums._is_ready)
+        self.assertEqual(total.value, 6)
+        self.assertEqual(list(nums.value), [1, 2, 3])
+
+    def test_callee(self):
+        nums = rpyc.async_(self.conn.builtins.list)((1, 2, 3))
+        index = rpyc.async_(self.conn.builtins.getattr)(nums, "index")
+        self.assertEqual(rpyc.async_(index)(3).value, 2)
+
+    def test_nested_request(self):
+        # the first request gets an attribute of a local object, so the other party receives the
+        # second request while it waits for that nested reply
+        async_unwrap = rpyc.async_(self.conn.modules[__name__].unwrap)
+        async_len = rpyc.async_(self.conn.builtins.len)
+        first = async_unwrap(Box(3))
+        self.assertEqual(async_len(first).value, 3)
+        self.assertEqual(list(first.value), [3, 3, 3])
+
+    def test_long_chain(self):
+        # the chain is held behind a request that waits for a nested reply, and is dispatched
+        # when it is resolved
+        async_unwrap = rpyc.async_(self.conn.modules[__name__].unwrap)
+        async_list = rpyc.async_(self.conn.builtins.list)
+        res = async_unwrap(Box(3))
+        for _ in range(2000):
+            res = async_list(res)
+        self.assertEqual(list(res.value), [3, 3, 3])
+
+    def test_exception(self):
+        bad = rpyc.async_(self.conn.builtins.int)("x")
+        res = rpyc.async_(self.conn.builtins.abs)(bad)
+        self.assertRaises(ValueError, lambda: res.value)
+        self.assertRaises(ValueError, lambda: bad.value)
+
+    def test_release(self):
+        nums = rpyc.async_(self.conn.builtins.list)((1, 2, 3))
+        nums.wait()
+        self.assertEqual(len(self.server_conn._promises), 1)
+        del nums
+        gc.collect()
+        self.conn.ping()
+        self.assertEqual(len(self.server_conn._promises), 0)
+
+    def test_disabled(self):
+        self.conn._config["promise_pipelining"] = False
+        nums = rpyc.async_(self.conn.builtins.list)((1, 2, 3))
+        self.assertRaises(TypeError, rpyc.async_, nums)
+        nums.wait()
+        self.assertEqual(len(self.server_conn._promises), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import threading
+import rpyc
+from rpyc.utils.server import ThreadedServer
+from rpyc import SlaveService
+import unittest
+
+
+class Test_ConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadedServer(SlaveService, hostname="localhost", port=0, auto_register=False)
+        self.server.logger.quiet = True
+        self.server._start_in_thread()
+        self.port = self.server.port
+        self.pool = rpyc.ConnectionPool(max_size=2, timeout=1)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.close()
+
+    def test_reuse(self):
+        with self.pool.connection("localhost", self.port) as conn1:
+            self.assertEqual(conn1.root.eval("1 + 1"), 2)
+        with self.pool.connection("localhost", self.port) as conn2:
+            self.assertIs(conn2, conn1)
+        self.assertEqual(self.pool.stats(), {("localhost", self.port, rpyc.VoidService): dict(size=1, idle=1)})
+
+    def test_max_size(self):
+        handed_out = []
+
+        def wait_for_connection():
+            with self.pool.connection("localhost", self.port) as conn:
+                handed_out.append(conn)
+
+        with self.pool.connection("localhost", self.port) as conn1:
+            with self.pool.connection("localhost", self.port) as conn2:
+                self.assertIsNot(conn1, conn2)
+                self.assertRaises(TimeoutError, self.pool.connection("localhost", self.port).__enter__)
+                waiter = threading.Thread(target=wait_for_connection)
+                waiter.start()
+            waiter.join()
+            self.assertEqual(handed_out, [conn2])
+        self.assertEqual(self.pool.stats()[("localhost", self.port, rpyc.VoidService)], dict(size=2, idle=2))
+
+    def test_evict_dead(self):
+        self.pool.ping_interval = 0
+        with self.pool.connection("localhost", self.port) as conn1:
+            pass
+        conn1._channel.stream.close()  # e.g., the server went away
+        with self.pool.connection("localhost", self.port) as conn2:
+            self.assertIsNot(conn2, conn1)
+            self.assertEqual(conn2.root.eval("2 * 3"), 6)
+        with self.pool.connection("localhost", self.port) as conn3:
+            self.assertIs(conn3, conn2)
+            conn3.close()
+        self.assertEqual(self.pool.stats()[("localhost", self.port, rpyc.VoidService)], dict(size=0, idle=0))
+
+    def test_discard_on_exception(self):
+        for exc in (ValueError, KeyboardInterrupt):
+            with self.assertRaises(exc):
+                with self.pool.connection("localhost", self.port) as conn:
+                    raise exc()
+            self.assertTrue(conn.closed)
+            self.assertEqual(self.pool.stats()[("localhost", self.port, rpyc.VoidService)], dict(size=0, idle=0))
+        with self.pool.connection("localhost", self.port) as conn2:
+            self.assertIsNot(conn2, conn)
+
+    def test_prewarm(self):
+        self.pool.min_idle = 2
+        self.pool.prewarm("localhost", self.port)
+        self.assertEqual(self.pool.stats()[("localhost", self.port, rpyc.VoidService)], dict(size=2, idle=2))
+        self.pool.evict()
+        self.assertEqual(self.pool.stats()[("localhost", self.port, rpyc.VoidService)], dict(size=2, idle=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
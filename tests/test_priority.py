@@ -0,0 +1,95 @@
+import rpyc
+from rpyc.core import brine, consts
+from rpyc.core.protocol import DEFAULT_CONFIG
+import unittest
+
+
+class RecordingChannel(object):
+    """wraps a channel and records the frames sent over it"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.frames = []
+
+    def send(self, data, compress=True):
+        self.frames.append(bytes(data))
+        self.channel.send(data, compress)
+
+    def __getattr__(self, name):
+        return getattr(self.channel, name)
+
+
+class TestPriority(unittest.TestCase):
+    def setUp(self):
+        self.conn = rpyc.classic.connect_thread()
+        self.channel = self.conn._channel = RecordingChannel(self.conn._channel)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _sent_pings(self):
+        pings = []
+        for frame in self.channel.frames:
+            msg, (_, (handler, args)) = frame[0], brine.load(frame[1:])
+            if msg == consts.MSG_REQUEST and handler == consts.HANDLE_PING:
+                pings.append(args[1][0])
+        return pings
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "with bind_threads, all messages are sent in the interactive lane")
+    def test_lanes(self):
+        with self.conn._sendlock:  # queue the requests as if another thread was sending
+            results = [self.conn.async_request(consts.HANDLE_PING, "bulk", priority=consts.PRIORITY_BULK),
+                       self.conn.async_request(consts.HANDLE_PING, "interactive",
+                                               priority=consts.PRIORITY_INTERACTIVE),
+                       self.conn.async_request(consts.HANDLE_PING, "control")]
+            self.assertEqual(self.channel.frames, [])
+            self.assertEqual(self.conn.stats()["send_queue"], 3)
+        self.conn.ping("flush")
+        self.assertEqual(self._sent_pings(), ["control", "flush", "interactive", "bulk"])
+        self.assertEqual([res.value for res in results], ["bulk", "interactive", "control"])
+
+    def test_request_priority(self):
+        self.assertEqual(self.conn._request_priority(consts.HANDLE_PING, None), consts.PRIORITY_CONTROL)
+        self.assertEqual(self.conn._request_priority(consts.HANDLE_CALL, None), consts.PRIORITY_INTERACTIVE)
+        with self.conn.priority(consts.PRIORITY_BULK):
+            self.assertEqual(self.conn._request_priority(consts.HANDLE_CALL, None), consts.PRIORITY_BULK)
+            self.assertEqual(self.conn._request_priority(consts.HANDLE_CALL, consts.PRIORITY_CONTROL),
+                             consts.PRIORITY_CONTROL)
+            self.assertEqual(self.conn.builtins.abs(-3), 3)
+        self.assertEqual(self.conn._request_priority(consts.HANDLE_CALL, None), consts.PRIORITY_INTERACTIVE)
+        # releasing objects never overtakes the requests that may use them
+        for handler in (consts.HANDLE_DEL, consts.HANDLE_DEL_MANY, consts.HANDLE_CLOSE):
+            self.assertEqual(self.conn._request_priority(handler, consts.PRIORITY_CONTROL), consts.PRIORITY_BULK)
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "with bind_threads, all messages are sent in the interactive lane")
+    def test_bulk_reply_size(self):
+        sent = []
+        send_data = self.conn._send_data
+
+        def recording_send_data(data, priority):
+            sent.append((data[:1], priority))
+            return send_data(data, priority)
+        self.conn._send_data = recording_send_data
+        large = b"x" * 100
+        self.conn._send(consts.MSG_REPLY, 1, (consts.LABEL_VALUE, large))  # no such request; the reply is ignored
+        self.conn._config["bulk_reply_size"] = 50
+        self.conn._send(consts.MSG_REPLY, 2, (consts.LABEL_VALUE, large))
+        self.conn._send(consts.MSG_REPLY, 3, (consts.LABEL_VALUE, b"small"))
+        reply = brine.I1.pack(consts.MSG_REPLY)
+        self.assertEqual(sent, [(reply, consts.PRIORITY_INTERACTIVE), (reply, consts.PRIORITY_BULK),
+                                (reply, consts.PRIORITY_INTERACTIVE)])
+
+    @unittest.skipIf(DEFAULT_CONFIG["bind_threads"], "with bind_threads, all messages are sent in the interactive lane")
+    def test_may_overtake(self):
+        self.assertTrue(self.conn._may_overtake(consts.PRIORITY_CONTROL))
+        with self.conn._sendlock:
+            res = self.conn.async_request(consts.HANDLE_PING, "bulk", priority=consts.PRIORITY_BULK)
+            self.assertFalse(self.conn._may_overtake(consts.PRIORITY_INTERACTIVE))
+            self.assertTrue(self.conn._may_overtake(consts.PRIORITY_BULK))
+        self.conn.ping()
+        self.assertEqual(res.value, "bulk")
+        self.assertTrue(self.conn._may_overtake(consts.PRIORITY_CONTROL))
+
+
+if __name__ == "__main__":
+    unittest.main()
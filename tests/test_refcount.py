@@ -1,4 +1,5 @@
 import rpyc
+from rpyc.core import consts
 import gc
 import unittest
 
@@ -37,5 +38,34 @@ class DummyObject(object):
         self.assertEqual(set(self.conn.namespace["deleted_objects"]), set(["d1", "d2", "d3"]))
 
 
+class TestBatchedRefcount(TestRefcount):
+    def setUp(self):
+        self.conn = rpyc.utils.factory.connect_thread(rpyc.ClassicService, config=dict(del_batch_size=3),
+                                                      remote_service=rpyc.ClassicService)
+
+    def test_del_many(self):
+        self.conn.execute("""
+import weakref
+class DummyObject(object):
+    pass
+objs = [DummyObject() for i in range(10)]
+refs = [weakref.ref(o) for o in objs]""")
+        proxies = list(self.conn.namespace["objs"])
+        self.conn.execute("del objs[:]")
+        requests = []
+        async_request = self.conn._async_request
+
+        def counting_async_request(handler, *args, **kwargs):
+            requests.append(handler)
+            return async_request(handler, *args, **kwargs)
+        self.conn._async_request = counting_async_request
+        del proxies
+        gc.collect()
+        self.conn.ping()
+        self.assertEqual(requests.count(consts.HANDLE_DEL), 0)
+        self.assertTrue(1 <= requests.count(consts.HANDLE_DEL_MANY) <= 5)
+        self.assertTrue(self.conn.eval("all(r() is None for r in refs)"))
+
+
 if __name__ == "__main__":
     unittest.main()
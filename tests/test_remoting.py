@@ -2,6 +2,7 @@ import os
 import tempfile
 import shutil
 import unittest
+from unittest import mock
 import rpyc
 
 
@@ -31,6 +32,88 @@ class Test_Remoting(unittest.TestCase):
 
         shutil.rmtree(base)
 
+    def test_file_transfer(self):
+        base = tempfile.mkdtemp()
+        try:
+            local, remote, back = (os.path.join(base, name) for name in ("local", "remote", "back"))
+            data = os.urandom(1000003)
+            with open(local, "wb") as f:
+                f.write(data)
+            for window in (8, 1):
+                rpyc.classic.upload_file(self.conn, local, remote, chunk_size=10000, window=window)
+                rpyc.classic.download_file(self.conn, remote, back, chunk_size=10000, window=window)
+                with open(back, "rb") as f:
+                    self.assertEqual(f.read(), data)
+                # resuming, from a partial (or stale) copy
+                for path in (remote, back):
+                    with open(path, "r+b") as f:
+                        f.seek(500000)
+                        f.write(b"garbage")
+                        f.truncate(600000)
+                rpyc.classic.upload_file(self.conn, local, remote, chunk_size=10000, window=window, offset=500000)
+                rpyc.classic.download_file(self.conn, remote, back, chunk_size=10000, window=window, offset=500000)
+                with open(back, "rb") as f:
+                    self.assertEqual(f.read(), data)
+        finally:
+            shutil.rmtree(base)
+
+    def test_dir_transfer(self):
+        base = tempfile.mkdtemp()
+        try:
+            base1, base2, base3 = (os.path.join(base, name) for name in ("1", "2", "3"))
+            os.makedirs(os.path.join(base1, "sub"))
+            for i in range(20):
+                with open(os.path.join(base1, "sub" if i % 2 else "", f"file{i}"), "wb") as f:
+                    f.write(os.urandom(i * 5000))
+            rpyc.classic.upload(self.conn, base1, base2, parallel=4)
+            rpyc.classic.download(self.conn, base2, base3, parallel=4)
+            for i in range(20):
+                name = os.path.join("sub" if i % 2 else "", f"file{i}")
+                with open(os.path.join(base1, name), "rb") as f1, open(os.path.join(base3, name), "rb") as f3:
+                    self.assertEqual(f1.read(), f3.read())
+        finally:
+            shutil.rmtree(base)
+
+    def test_sync_dir(self):
+        base = tempfile.mkdtemp()
+        try:
+            local, remote = os.path.join(base, "local"), os.path.join(base, "remote")
+            os.makedirs(os.path.join(local, "sub"))
+            files = {"a": b"spam", "sub/b": b"eggs" * 1000, "big": os.urandom(1000000), "stale": b""}
+            for name, data in files.items():
+                with open(os.path.join(local, name), "wb") as f:
+                    f.write(data)
+            rpyc.classic.sync_dir(self.conn, local, remote)
+            os.remove(os.path.join(local, "stale"))
+            os.makedirs(os.path.join(remote, "stale_dir"))
+            # "a-b" sorts between "a" and "a/x"
+            os.makedirs(os.path.join(remote, "gone", "x"))
+            os.makedirs(os.path.join(remote, "gone-b", "y"))
+            # a remote directory that is a file locally
+            os.makedirs(os.path.join(remote, "replaced", "dir"))
+            with open(os.path.join(remote, "replaced", "file"), "wb") as f:
+                f.write(b"old")
+            with open(os.path.join(local, "replaced"), "wb") as f:
+                f.write(b"replaced")
+            unchanged_ctime = os.stat(os.path.join(remote, "sub", "b")).st_ctime_ns
+            with open(os.path.join(local, "big"), "r+b") as f:
+                f.seek(500000)
+                f.write(b"changed")
+            with open(os.path.join(local, "new"), "wb") as f:
+                f.write(b"new")
+
+            with mock.patch("rpyc.utils.classic.upload_file", wraps=rpyc.classic.upload_file) as upload_file:
+                rpyc.classic.sync_dir(self.conn, local, remote, delete=True)
+            # only the new files were uploaded as a whole, and only a block of the big one
+            self.assertEqual(sorted(call[0][1] for call in upload_file.call_args_list),
+                             [os.path.join(local, "new"), os.path.join(local, "replaced")])
+            self.assertEqual(os.stat(os.path.join(remote, "sub", "b")).st_ctime_ns, unchanged_ctime)
+            self.assertEqual(sorted(rpyc.classic.manifest(local)), sorted(rpyc.classic.manifest(remote)))
+            self.assertEqual(sorted(rpyc.classic.manifest(local, checksum=True)),
+                             sorted(rpyc.classic.manifest(remote, checksum=True)))
+        finally:
+            shutil.rmtree(base)
+
     @unittest.skip("TODO: upload a package and a module")
     def test_distribution(self):
         pass
@@ -0,0 +1,83 @@
+import rpyc
+from rpyc.core import consts, netref
+from rpyc.lib.colls import LRUCache
+from rpyc.utils.server import ThreadedServer
+import unittest
+
+
+class Widget(object):
+    def double(self, value):
+        return value * 2
+
+
+class Test_SharedClassCache(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadedServer(rpyc.ClassicService, hostname="localhost", port=0, auto_register=False)
+        self.server.logger.quiet = True
+        self.server._start_in_thread()
+        self.addCleanup(self.server.close)  # after closing the connections
+        netref.shared_classes_cache.clear()
+        self.addCleanup(netref.shared_classes_cache.clear)
+
+    def _connect(self, shared_class_cache=True):
+        conn = rpyc.connect("localhost", self.server.port, rpyc.ClassicService,
+                            config=dict(shared_class_cache=shared_class_cache))
+        self.addCleanup(conn.close)
+        handlers = []
+        sync_request = conn.sync_request
+
+        def recording_sync_request(handler, *args, **kwargs):
+            handlers.append(handler)
+            return sync_request(handler, *args, **kwargs)
+        conn.sync_request = recording_sync_request
+        return conn, handlers
+
+    def _widget_class(self, conn):
+        return conn.eval("__import__('sys').modules[%r].Widget" % (__name__,))
+
+    def _widget(self, conn):
+        return conn.eval("__import__('sys').modules[%r].Widget()" % (__name__,))
+
+    def test_reconnect_warm(self):
+        conn1, handlers1 = self._connect()
+        self.assertEqual(self._widget_class(conn1)().double(2), 4)
+        self.assertIn(consts.HANDLE_INSPECT, handlers1)
+        conn2, handlers2 = self._connect()
+        widget_class = self._widget_class(conn2)
+        self.assertIs(type(widget_class), type(self._widget_class(conn1)))
+        self.assertNotIn(consts.HANDLE_INSPECT, handlers2)
+        self.assertEqual(conn2._peer_token, conn1._peer_token)
+
+    def test_patched_class(self):
+        # the netref classes of instances are not shared, since their class may change
+        conn1, _ = self._connect()
+        self.assertRaises(TypeError, len, self._widget(conn1))
+        Widget.__len__ = lambda self: 3  # the server is in this process
+        try:
+            conn2, _ = self._connect()
+            self.assertEqual(len(self._widget(conn2)), 3)
+        finally:
+            del Widget.__len__
+
+    def test_disabled(self):
+        conn1, _ = self._connect(False)
+        self._widget_class(conn1)
+        conn2, handlers2 = self._connect(False)
+        self._widget_class(conn2)
+        self.assertIn(consts.HANDLE_INSPECT, handlers2)
+        self.assertEqual(len(netref.shared_classes_cache), 0)
+
+
+class Test_LRUCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache.get("a"), 1)  # "b" is now the least recently used
+        cache["c"] = 3
+        self.assertEqual((cache.get("a"), cache.get("b"), cache.get("c")), (1, None, 3))
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import sys
+import threading
+import time
+import unittest
+import rpyc
+from rpyc.core.channel import Channel
+from rpyc.core.stream import SharedMemoryStream, _TOTAL_STORE_ORDER
+
+
+@unittest.skipIf(sys.platform == "win32", "requires POSIX")
+@unittest.skipUnless(_TOTAL_STORE_ORDER, "requires x86")
+class Test_SharedMemoryStream(unittest.TestCase):
+
+    def setUp(self):
+        self.side1, self.side2 = SharedMemoryStream.create_pair(ring_size=4096)
+
+    def tearDown(self):
+        self.side1.close()
+        self.side2.close()
+
+    def test_roundtrip(self):
+        chan1, chan2 = Channel(self.side1), Channel(self.side2)
+        # larger than the rings, so the writer has to wait for space
+        payloads = [b"", b"hello", os.urandom(100000), b"x" * 5000]
+        sender = threading.Thread(target=lambda: [chan1.send(data) for data in payloads])
+        sender.start()
+        try:
+            for data in payloads:
+                self.assertEqual(bytes(chan2.recv()), data)
+        finally:
+            sender.join()
+
+    def test_poll(self):
+        self.assertFalse(self.side2.poll(0.05))
+        self.side1.write(b"abc")
+        self.assertTrue(self.side2.poll(0))
+        self.assertEqual(bytes(self.side2.read(3)), b"abc")
+        self.assertFalse(self.side2.poll(0))
+
+    def test_eof(self):
+        self.side1.write(b"last")
+        self.side1.close()
+        self.assertEqual(bytes(self.side2.read(4)), b"last")
+        self.assertRaises(EOFError, self.side2.read, 1)
+        self.assertTrue(self.side2.closed)
+
+    def test_close_while_copying(self):
+        errors = []
+
+        def loop(func):
+            try:
+                while True:
+                    func()
+            except EOFError:
+                pass
+            except Exception as ex:
+                errors.append(ex)
+        threads = [threading.Thread(target=loop, args=(lambda: self.side2.read(1000),)),
+                   threading.Thread(target=loop, args=(lambda: self.side1.write(b"x" * 10000),))]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        self.side2.close()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(errors, [])
+
+
+@unittest.skipIf(sys.platform == "win32", "requires POSIX")
+@unittest.skipUnless(_TOTAL_STORE_ORDER, "requires x86")
+class Test_SharedMemoryConnect(unittest.TestCase):
+
+    def test_connect_thread(self):
+        conn = rpyc.connect_thread(rpyc.ClassicService, remote_service=rpyc.ClassicService, shared_memory=True)
+        try:
+            self.assertEqual(conn.eval("1+1"), 2)
+            self.assertEqual(len(conn.builtins.bytes(3000000)), 3000000)
+        finally:
+            conn.close()
+
+    def test_connect_multiprocess(self):
+        conn = rpyc.utils.factory.connect_multiprocess(rpyc.ClassicService, remote_service=rpyc.ClassicService,
+                                                       shared_memory=True)
+        try:
+            self.assertNotEqual(conn.modules.os.getpid(), os.getpid())
+            self.assertEqual(conn.modules.zlib.crc32(b"x" * 1000000), __import__("zlib").crc32(b"x" * 1000000))
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
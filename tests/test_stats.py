@@ -0,0 +1,65 @@
+import rpyc
+from rpyc.core import stats
+from rpyc.utils.server import ThreadedServer
+from rpyc import SlaveService
+import unittest
+
+
+class TestConnectionStats(unittest.TestCase):
+    def setUp(self):
+        config = dict(collect_stats=True)
+        self.conn = rpyc.utils.factory.connect_thread(rpyc.ClassicService, config=config,
+                                                      remote_service=rpyc.ClassicService, remote_config=config)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_counters(self):
+        remote_abs = self.conn.builtins.abs
+        for i in range(10):
+            self.assertEqual(remote_abs(-i), i)
+        self.assertRaises(ValueError, self.conn.builtins.int, "foo")
+        remote = self.conn.root.getconn().stats()
+        calls = remote["handlers"]["call"]
+        self.assertGreaterEqual(calls["count"], 11)
+        self.assertEqual(calls["errors"], 1)
+        self.assertEqual(sum(calls["buckets"]), calls["count"])
+        self.assertLessEqual(stats.percentile(calls, 0.5), calls["max_time"])
+        local = self.conn.stats()
+        self.assertGreater(local["bytes_sent"], 0)
+        self.assertGreater(local["messages_received"], 0)
+        self.assertGreater(local["proxies"], 0)
+
+    def test_disabled(self):
+        conn = rpyc.classic.connect_thread()
+        try:
+            snapshot = conn.stats()
+            self.assertNotIn("handlers", snapshot)
+            self.assertEqual(snapshot["send_queue"], 0)
+        finally:
+            conn.close()
+
+
+class TestServerStats(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadedServer(SlaveService, port=0, auto_register=False,
+                                     protocol_config=dict(collect_stats=True))
+        self.server.logger.quiet = True
+        self.server._start_in_thread()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_aggregate(self):
+        conns = [rpyc.classic.connect("localhost", port=self.server.port) for _ in range(3)]
+        for conn in conns:
+            conn.builtins.len("abc")
+        merged = self.server.stats()
+        self.assertEqual(merged["connections"], 3)
+        self.assertGreaterEqual(merged["handlers"]["call"]["count"], 3)
+        for conn in conns:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()